@@ -16,7 +16,9 @@ from src.models import (
     Event,
     EvidenceSource,
     TenantScoreSnapshot,
+    PropertyScoreSnapshot,
     PortfolioBriefSnapshot,
+    BriefPayload,
 )
 
 # this is the Alembic Config object
@@ -0,0 +1,131 @@
+"""
+Conditional GET support (ETag / 304).
+
+Each cacheable route declares a data-version dependency that fingerprints the
+rows its response is built from (usually one query) without building the
+response. The conditional() dependency turns that into a strong ETag scoped
+to the request URL and the caller's audience, answers a matching
+If-None-Match with 304, and otherwise attaches the ETag to the response.
+
+There is deliberately no Last-Modified: a timestamp cannot see a deleted
+row, so If-Modified-Since alone could answer 304 for a response that lost
+rows. Clients revalidate with the ETag, which covers row counts.
+
+Usage:
+    @router.get("/tenants", etag=tenant_list_version)  # see CamelRouter.get
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.demo_auth import get_demo_user, DemoUser
+from src.models import TableVersion, VERSIONED_TABLES
+
+# Responses differ by role (exec layer, AM scoping)
+VARY_HEADERS = "X-DEMO-ROLE"
+
+
+@dataclass
+class DataVersion:
+    """Fingerprint of the data behind a response."""
+    tag: str
+
+
+def table_stats(model: Any, *criteria: Any) -> list[Any]:
+    """
+    Row count and max updated_at for a model's rows, as scalar subqueries.
+
+    Scope criteria to indexed columns and to what the route renders; for a
+    whole table use table_version(), which does not scan. updated_at is
+    bumped by the column's onupdate for ORM flushes and Core update()
+    statements; writes that bypass it (raw SQL, ON CONFLICT DO UPDATE) must
+    set it explicitly or the version won't move. Deletes show up through
+    the count.
+    """
+    return [
+        select(func.count()).select_from(model).where(*criteria).scalar_subquery(),
+        select(func.max(model.updated_at)).where(*criteria).scalar_subquery(),
+    ]
+
+
+def table_version(model: Any) -> list[Any]:
+    """
+    A table's trigger-maintained change counter, as a scalar subquery.
+
+    Every INSERT, UPDATE, DELETE or TRUNCATE statement on the table bumps
+    it, so a whole-table version is one primary-key lookup instead of a
+    count and max over the table. Takes the same place as table_stats() in
+    get_data_version().
+    """
+    table_name = model.__tablename__
+    if table_name not in VERSIONED_TABLES:
+        raise ValueError(f"{table_name} has no table_versions trigger; use table_stats()")
+    return [
+        select(TableVersion.version)
+        .where(TableVersion.table_name == table_name)
+        .scalar_subquery()
+    ]
+
+
+async def get_data_version(
+    db: AsyncSession, *stats: list[Any], extra: tuple = ()
+) -> DataVersion:
+    """
+    Evaluate table_stats() / table_version() groups in one query and
+    fingerprint the result.
+
+    extra values (ids, timestamps of already-loaded rows, in-memory index
+    versions) are folded into the tag.
+    """
+    columns = [column for group in stats for column in group]
+    values = list(extra)
+    if columns:
+        result = await db.execute(select(*columns))
+        values.extend(result.one())
+
+    tag = hashlib.sha256("|".join(str(v) for v in values).encode()).hexdigest()
+    return DataVersion(tag=tag)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison per RFC 9110 (If-None-Match ignores the W/ prefix)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def conditional(
+    version: Callable[..., Awaitable[DataVersion]],
+) -> Callable[..., Awaitable[None]]:
+    """Build a route dependency that applies conditional GET for a data version."""
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        data_version: DataVersion = Depends(version),
+        user: DemoUser = Depends(get_demo_user),
+    ) -> None:
+        scope = f"{request.url.path}?{request.url.query}|{user.audience_key}"
+        digest = hashlib.sha256(f"{scope}|{data_version.tag}".encode()).hexdigest()
+        etag = f'"{digest[:32]}"'
+
+        headers = {
+            "ETag": etag,
+            "Vary": VARY_HEADERS,
+            "Cache-Control": "private, no-cache",
+        }
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+
+    return dependency
@@ -14,6 +14,22 @@ class Settings(BaseSettings):
     api_v1_prefix: str = "/api/v1"
     debug: bool = True
 
+    # Brief: run independent sections concurrently, each on its own pooled
+    # connection, with at most this many such connections across all
+    # requests in the process (capped below the engine's pool size)
+    brief_concurrent_sections: bool = True
+    brief_max_concurrent_sections: int = 4
+
+    # Extra hallucination-marker phrases for memo validation (one per line)
+    hallucination_markers_path: str | None = None
+
+    # /search: minimum pg_trgm word similarity for a fuzzy match (0-1)
+    search_similarity_threshold: float = 0.3
+
+    # How often the in-memory indexes (snapshot calendar, lease graph,
+    # typeahead) pick up rows written by other processes
+    index_refresh_seconds: float = 60.0
+
     # CORS — set to exact frontend URL in production
     cors_origins: str = "http://localhost:3000"
 
@@ -7,6 +7,8 @@ Usage:
   X-DEMO-USER: jane (optional, for display)
 """
 
+import hashlib
+
 from fastapi import Request, HTTPException
 
 
@@ -29,6 +31,25 @@ class DemoUser:
         self.is_am = role == "am"
         self.assigned_property_ids = assigned_property_ids or []
 
+    @property
+    def audience_key(self) -> str:
+        """
+        Key for role-dependent cached views.
+        All execs share one view; AMs share a view per assigned property set.
+        """
+        if self.is_exec:
+            return "exec"
+        property_set = ",".join(sorted(self.assigned_property_ids))
+        return f"am:{hashlib.sha256(property_set.encode()).hexdigest()[:16]}"
+
+
+def list_demo_users() -> list[DemoUser]:
+    """All distinct demo audiences (used to precompute role-specific views)."""
+    return [
+        DemoUser(role="exec"),
+        DemoUser(role="am", assigned_property_ids=DEMO_AM_ASSIGNED_PROPERTIES),
+    ]
+
 
 def get_demo_user(request: Request) -> DemoUser:
     """
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -8,8 +9,11 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
 from src.config import get_settings
-from src.database import engine
+from src.database import engine, AsyncSessionLocal
 from src.routers import brief, tenants, events, properties, search
+from src.services.portfolio_graph import portfolio_graph
+from src.services.snapshot_calendar import snapshot_calendar
+from src.services.typeahead import typeahead_index
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,11 +21,38 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+async def refresh_indexes():
+    """Refresh the in-memory snapshot calendar, lease graph and typeahead index."""
+    async with AsyncSessionLocal() as session:
+        await snapshot_calendar.refresh(session)
+        await portfolio_graph.refresh(session)
+        await typeahead_index.refresh(session)
+
+
+async def refresh_indexes_periodically(interval_seconds: float):
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await refresh_indexes()
+        except Exception as e:
+            logger.warning(f"Index refresh failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Credit Oversight API starting...")
+    try:
+        await refresh_indexes()
+        logger.info(f"Loaded {len(snapshot_calendar)} snapshot dates, lease graph and typeahead index")
+    except Exception as e:
+        # Routes load the indexes lazily once the database is reachable
+        logger.warning(f"In-memory indexes not loaded at startup: {e}")
+    index_refresh = asyncio.create_task(
+        refresh_indexes_periodically(settings.index_refresh_seconds)
+    )
     yield
     logger.info("Shutting down...")
+    index_refresh.cancel()
     await engine.dispose()
 
 
@@ -4,8 +4,14 @@ from src.models.property import Property
 from src.models.lease import Lease
 from src.models.event import Event
 from src.models.evidence import EvidenceSource
+from src.models.evidence_text_map import EvidenceTextMap
 from src.models.score_snapshot import TenantScoreSnapshot
+from src.models.property_score_snapshot import PropertyScoreSnapshot
 from src.models.brief_snapshot import PortfolioBriefSnapshot
+from src.models.brief_payload import BriefPayload
+from src.models.memo_validation_result import MemoValidationResultRecord
+from src.models.seed_row_hash import SeedRowHash
+from src.models.table_version import TableVersion, VERSIONED_TABLES
 
 __all__ = [
     "Portfolio",
@@ -14,6 +20,13 @@ __all__ = [
     "Lease",
     "Event",
     "EvidenceSource",
+    "EvidenceTextMap",
     "TenantScoreSnapshot",
+    "PropertyScoreSnapshot",
     "PortfolioBriefSnapshot",
+    "BriefPayload",
+    "MemoValidationResultRecord",
+    "SeedRowHash",
+    "TableVersion",
+    "VERSIONED_TABLES",
 ]
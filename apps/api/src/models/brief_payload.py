@@ -0,0 +1,44 @@
+import uuid
+from datetime import datetime, date
+
+from sqlalchemy import String, Date, DateTime, ForeignKey, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.database import Base
+
+
+class BriefPayload(Base):
+    """
+    Pre-rendered BriefResponse for a brief snapshot and audience.
+    Served as-is by /brief while its data_version matches the source tables.
+    """
+
+    __tablename__ = "brief_payloads"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    brief_snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("portfolio_brief_snapshots.id"), index=True
+    )
+
+    as_of_date: Mapped[date] = mapped_column(Date, index=True)
+    audience: Mapped[str] = mapped_column(String(100))  # "exec" or "am:<property set hash>"
+    data_version: Mapped[str] = mapped_column(String(64))  # Fingerprint of source rows
+    payload: Mapped[str] = mapped_column(Text)  # Serialized camelCase JSON
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow
+    )
+
+    # Relationships
+    brief_snapshot: Mapped["PortfolioBriefSnapshot"] = relationship()
+
+    __table_args__ = (
+        UniqueConstraint("brief_snapshot_id", "audience", name="uq_brief_payload_audience"),
+    )
+
+
+# Import for type hints
+from src.models.brief_snapshot import PortfolioBriefSnapshot
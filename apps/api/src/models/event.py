@@ -1,9 +1,9 @@
 import uuid
 from datetime import datetime, date
 
-from sqlalchemy import String, Date, DateTime, ForeignKey, Text, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, Date, DateTime, ForeignKey, Text, Boolean, Index, Computed, select, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship, column_property
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 
 from src.database import Base
 
@@ -39,18 +39,56 @@ class Event(Base):
     # Validation
     memo_validated: Mapped[bool] = mapped_column(Boolean, default=False)
     validation_errors: Mapped[list | None] = mapped_column(JSONB)  # [{error: str}, ...]
+    # Hash of the validated inputs; see src.precompute.memo_validation
+    validation_hash: Mapped[str | None] = mapped_column(String(32))
+    # Verified quote locations: [{detail, evidence_id, field, start, end}, ...]
+    quote_spans: Mapped[list | None] = mapped_column(JSONB)
+
+    # Full-text search (src.services.document_search); maintained by Postgres
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(headline, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(memo_what_disclosed, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        deferred_raiseload=True,
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship(back_populates="events")
     evidence_sources: Mapped[list["EvidenceSource"]] = relationship(
-        back_populates="event", lazy="selectin"
+        back_populates="event", lazy="raise"  # Load explicitly via src.models.loaders
+    )
+
+    __table_args__ = (
+        # Latest-event-per-tenant lookups (lateral joins, DISTINCT ON)
+        Index("ix_events_tenant_id_event_date", "tenant_id", event_date.desc()),
+        Index("ix_events_search_vector", "search_vector", postgresql_using="gin"),
     )
 
 
 # Import for type hints
 from src.models.tenant import Tenant
 from src.models.evidence import EvidenceSource
+
+# Aggregate evidence count, for routes that only need len(evidence_sources)
+Event.evidence_count = column_property(
+    select(func.count(EvidenceSource.id))
+    .where(EvidenceSource.event_id == Event.id)
+    .correlate_except(EvidenceSource)
+    .scalar_subquery(),
+    deferred=True,
+    raiseload=True,
+)
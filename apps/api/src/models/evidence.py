@@ -1,9 +1,9 @@
 import uuid
 from datetime import datetime, date
 
-from sqlalchemy import String, Date, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import String, Date, DateTime, ForeignKey, Text, Integer, Index, Computed, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 
 from src.database import Base
 
@@ -29,20 +29,44 @@ class EvidenceSource(Base):
     url: Mapped[str | None] = mapped_column(String(2000))
 
     # Content for citation verification
-    excerpt: Mapped[str | None] = mapped_column(Text)  # Relevant passage
-    raw_text: Mapped[str | None] = mapped_column(Text)  # Full text (for validation)
+    # Deferred: only evidence and validation paths load these (see src.models.loaders)
+    excerpt: Mapped[str | None] = mapped_column(Text, deferred=True, deferred_raiseload=True)  # Relevant passage
+    raw_text: Mapped[str | None] = mapped_column(Text, deferred=True, deferred_raiseload=True)  # Full text (for validation)
     page_reference: Mapped[str | None] = mapped_column(String(50))  # "Page 47" or "Section 4.2"
 
+    # Full-text search (src.services.document_search); maintained by Postgres.
+    # raw_text is capped so very long filings stay under the tsvector size limit
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+            "setweight(to_tsvector('english', left(coalesce(raw_text, ''), 200000)), 'D')",
+            persisted=True,
+        ),
+        deferred=True,
+        deferred_raiseload=True,
+    )
+
     # Tier for source ordering
     tier: Mapped[int] = mapped_column(Integer, default=2)  # 1 = SEC/primary, 2 = major news, 3 = other
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     event: Mapped["Event"] = relationship(back_populates="evidence_sources")
 
+    __table_args__ = (
+        Index("ix_evidence_sources_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
 
 # Import for type hints
 from src.models.event import Event
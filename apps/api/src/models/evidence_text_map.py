@@ -0,0 +1,26 @@
+import uuid
+
+from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+
+from src.database import Base
+
+
+class EvidenceTextMap(Base):
+    """
+    Normalized-to-original offset map of one evidence field.
+    Written by the memo validation job the first time a field is normalized
+    (src.validators.evidence_text.NormalizedField.offset_map) and reused by
+    later runs; content_hash says which version of the field text it maps.
+    """
+
+    __tablename__ = "evidence_text_maps"
+
+    evidence_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("evidence_sources.id", ondelete="CASCADE"), primary_key=True
+    )
+    field: Mapped[str] = mapped_column(String(20), primary_key=True)  # excerpt, raw_text, title
+    content_hash: Mapped[str] = mapped_column(String(64))
+    normalized_starts: Mapped[list[int]] = mapped_column(ARRAY(Integer))
+    original_starts: Mapped[list[int]] = mapped_column(ARRAY(Integer))
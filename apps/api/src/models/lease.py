@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, ForeignKey, Float
+from sqlalchemy import String, DateTime, ForeignKey, Float, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -33,11 +33,22 @@ class Lease(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship(back_populates="leases")
     property: Mapped["Property"] = relationship(back_populates="leases")
 
+    __table_args__ = (
+        # Covers property -> tenant semi-joins (AM scoping) as index-only scans
+        Index("ix_leases_property_id_tenant_id", "property_id", "tenant_id"),
+    )
+
 
 # Import for type hints
 from src.models.tenant import Tenant
@@ -0,0 +1,42 @@
+"""
+Loader profiles for Event and EvidenceSource.
+
+Evidence bodies (excerpt, raw_text) are deferred and Event.evidence_sources
+is lazy="raise", so each route states what it loads:
+
+- event_card_options: lists and cards (brief, tenant history). Aggregate
+  evidence count plus slim evidence rows for display checks.
+- event_detail_options: single event view. Aggregate count only.
+- event_validation_options: memo/citation validation. Full evidence text.
+- evidence_view_options: evidence viewer. Excerpts, no raw_text.
+"""
+
+from sqlalchemy.orm import selectinload, undefer
+
+from src.models.event import Event
+from src.models.evidence import EvidenceSource
+
+
+def event_card_options() -> tuple:
+    return (
+        undefer(Event.evidence_count),
+        selectinload(Event.evidence_sources).load_only(
+            EvidenceSource.source_type, EvidenceSource.tier
+        ),
+    )
+
+
+def event_detail_options() -> tuple:
+    return (undefer(Event.evidence_count),)
+
+
+def event_validation_options() -> tuple:
+    return (
+        selectinload(Event.evidence_sources).undefer(
+            EvidenceSource.excerpt, EvidenceSource.raw_text
+        ),
+    )
+
+
+def evidence_view_options() -> tuple:
+    return (undefer(EvidenceSource.excerpt),)
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.database import Base
+
+
+class MemoValidationResultRecord(Base):
+    """
+    Persisted validate_memo result, keyed by the validation input hash
+    (src.precompute.memo_validation.validation_input_hash). The key covers the
+    memo, its evidence content and the rule set, so an entry never goes stale;
+    rows for old rule sets are pruned by rules_fingerprint.
+    """
+
+    __tablename__ = "memo_validation_results"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    rules_fingerprint: Mapped[str] = mapped_column(String(16), index=True)
+    result: Mapped[dict] = mapped_column(JSONB)  # Serialized MemoValidationResult
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow
+    )
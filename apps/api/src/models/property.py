@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import String, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -32,11 +32,31 @@ class Property(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     portfolio: Mapped["Portfolio"] = relationship(back_populates="properties")
     leases: Mapped[list["Lease"]] = relationship(back_populates="property")
 
+    __table_args__ = (
+        # Listing order / keyset pagination
+        Index("ix_properties_name_id", "name", "id"),
+        # Trigram indexes for ranked, typo-tolerant /search (requires pg_trgm)
+        Index(
+            "ix_properties_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_properties_city_trgm", "city",
+            postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
+
 
 # Import for type hints
 from src.models.portfolio import Portfolio
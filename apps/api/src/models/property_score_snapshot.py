@@ -0,0 +1,52 @@
+import uuid
+from datetime import datetime, date
+
+from sqlalchemy import String, Integer, Date, DateTime, ForeignKey, UniqueConstraint, Index, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.database import Base
+
+
+class PropertyScoreSnapshot(Base):
+    """
+    Point-in-time rollup of tenant statuses at a property.
+    Derived from Lease + TenantScoreSnapshot by src.precompute.property_scores.
+    """
+
+    __tablename__ = "property_score_snapshots"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    property_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("properties.id"), index=True
+    )
+
+    as_of_date: Mapped[date] = mapped_column(Date)
+    status: Mapped[str] = mapped_column(String(20))  # Worst tenant status: critical, watch, improving, stable
+
+    watch_score: Mapped[int | None] = mapped_column(Integer)  # Highest tenant score, 0-100
+    issues_count: Mapped[int] = mapped_column(Integer, default=0)  # Critical + watch tenant leases
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
+
+    # Relationships
+    property: Mapped["Property"] = relationship()
+
+    __table_args__ = (
+        UniqueConstraint("property_id", "as_of_date", name="uq_property_snapshot_date"),
+        Index("ix_property_score_snapshots_date_issues", "as_of_date", "issues_count"),
+    )
+
+
+# Import for type hints
+from src.models.property import Property
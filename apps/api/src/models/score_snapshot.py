@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, date
 
-from sqlalchemy import String, Integer, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Integer, Date, DateTime, ForeignKey, UniqueConstraint, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -32,12 +32,20 @@ class TenantScoreSnapshot(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship(back_populates="score_snapshots")
 
     __table_args__ = (
         UniqueConstraint("tenant_id", "as_of_date", name="uq_tenant_snapshot_date"),
+        # Tenant listing: one snapshot date, ordered by status
+        Index("ix_tenant_score_snapshots_date_status", "as_of_date", "status"),
     )
 
 
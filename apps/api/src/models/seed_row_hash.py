@@ -0,0 +1,21 @@
+import uuid
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.database import Base
+
+
+class SeedRowHash(Base):
+    """
+    Hash of the fixture row each seeded row was last loaded from.
+    Lets incremental seeding (src.seed.upsert) skip unchanged rows without
+    sending them.
+    """
+
+    __tablename__ = "seed_row_hashes"
+
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    row_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64))
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+# Tables whose writes bump their table_versions row (trigger added in
+# migration 8e2d4f6a1c35); keep in step with that migration
+VERSIONED_TABLES = (
+    "tenants",
+    "properties",
+    "leases",
+    "events",
+    "evidence_sources",
+    "tenant_score_snapshots",
+    "property_score_snapshots",
+)
+
+
+class TableVersion(Base):
+    """
+    Change counter for a whole table.
+    A statement-level trigger bumps it on every INSERT, UPDATE, DELETE or
+    TRUNCATE, so whole-table data versions (src.caching.table_version) read one
+    row instead of counting the table.
+    """
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
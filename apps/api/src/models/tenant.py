@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import String, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -34,6 +34,12 @@ class Tenant(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     portfolio: Mapped["Portfolio"] = relationship(back_populates="tenants")
@@ -43,6 +49,18 @@ class Tenant(Base):
         back_populates="tenant"
     )
 
+    __table_args__ = (
+        # Trigram indexes for ranked, typo-tolerant /search (requires pg_trgm)
+        Index(
+            "ix_tenants_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_tenants_ticker_trgm", "ticker",
+            postgresql_using="gin", postgresql_ops={"ticker": "gin_trgm_ops"},
+        ),
+    )
+
 
 # Import for type hints
 from src.models.portfolio import Portfolio
@@ -0,0 +1,39 @@
+"""
+Opaque keyset cursors for list endpoints.
+
+A cursor encodes the sort key of the last row on a page; the next page is
+read with a row-value comparison against it (WHERE (a, b, id) > (...)), so
+every page costs the same regardless of how deep the client has paged.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable
+
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a row's sort key as an opaque URL-safe cursor."""
+    raw = json.dumps([str(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor, parsing each key part.
+
+    Raises a 400 for anything that isn't a well-formed cursor of this shape.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor shape mismatch")
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1 @@
+# Precompute stages package
@@ -0,0 +1,194 @@
+"""
+Precomputed /brief payloads.
+
+Renders the BriefResponse for every brief snapshot and demo audience (exec,
+and each AM property set) into brief_payloads. Each payload records the
+data_version of the rows it was built from; /brief serves the stored JSON
+while the version still matches and renders live (without storing) otherwise.
+Payloads are only written here, by this job and the jobs that run it (seed,
+memo validation), so GET /brief never writes or commits.
+
+Usage:
+    cd apps/api
+    poetry run python -m src.precompute.brief_payloads [--as-of YYYY-MM-DD] [--force]
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.caching import DataVersion, get_data_version, table_stats, table_version
+from src.database import AsyncSessionLocal
+from src.demo_auth import DemoUser, list_demo_users
+from src.models import (
+    BriefPayload,
+    PortfolioBriefSnapshot,
+    TenantScoreSnapshot,
+    Tenant,
+    Property,
+    Event,
+    EvidenceSource,
+    Lease,
+    PropertyScoreSnapshot,
+)
+from src.precompute.property_scores import rollup_property_scores
+from src.services.brief import build_brief, window_start
+from src.services.portfolio_graph import portfolio_graph
+from src.services.snapshot_calendar import snapshot_calendar
+
+
+async def get_brief_data_version(
+    db: AsyncSession, brief: PortfolioBriefSnapshot
+) -> DataVersion:
+    """
+    Fingerprint the rows a brief is built from, in a single query.
+
+    Covers the brief snapshot itself, tenant snapshots for the current and
+    previous period, tenants, properties, events, evidence behind the events
+    in the brief window (cards show evidence counts), leases (names and
+    addresses are rendered into the payload too) and the property rollup for
+    the brief's date, whose absence switches the brief to a live aggregate.
+    Whole tables are versioned by their change counters; the scoped rows by
+    count (deletes) and max updated_at (inserts and updates). The versions
+    of the snapshot calendar and lease graph the brief is built from are
+    included, since they can trail the tables between refreshes.
+    """
+    calendar = await snapshot_calendar.ensure_loaded(db)
+    graph = await portfolio_graph.ensure_loaded(db)
+    snapshot_dates = (brief.as_of_date, calendar.previous(brief.as_of_date))
+    window_event_ids = select(Event.id).where(
+        Event.event_date >= window_start(brief.as_of_date)
+    )
+    return await get_data_version(
+        db,
+        table_stats(TenantScoreSnapshot, TenantScoreSnapshot.as_of_date.in_(snapshot_dates)),
+        table_version(Tenant),
+        table_version(Property),
+        table_version(Event),
+        table_stats(EvidenceSource, EvidenceSource.event_id.in_(window_event_ids)),
+        table_version(Lease),
+        table_stats(PropertyScoreSnapshot, PropertyScoreSnapshot.as_of_date == brief.as_of_date),
+        extra=(brief.id, brief.created_at, calendar.version, graph.version),
+    )
+
+
+async def render_brief_payload(
+    db: AsyncSession,
+    brief: PortfolioBriefSnapshot,
+    user: DemoUser,
+    data_version: str,
+) -> str:
+    """Build the brief for an audience and upsert it into brief_payloads."""
+    response = await build_brief(db, brief, user)
+    payload = response.model_dump_json(by_alias=True)
+
+    stmt = insert(BriefPayload).values(
+        brief_snapshot_id=brief.id,
+        as_of_date=brief.as_of_date,
+        audience=user.audience_key,
+        data_version=data_version,
+        payload=payload,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_brief_payload_audience",
+        set_={
+            "data_version": stmt.excluded.data_version,
+            "payload": stmt.excluded.payload,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+    await db.execute(stmt)
+    await db.commit()
+    return payload
+
+
+async def get_brief_payload(
+    db: AsyncSession,
+    brief: PortfolioBriefSnapshot,
+    user: DemoUser,
+    data_version: DataVersion | None = None,
+) -> str:
+    """
+    Return the serialized brief for a user's audience.
+
+    Serves the stored payload when it is current, otherwise renders it live
+    without storing it: this runs on GET /brief, where concurrent requests
+    would race to upsert the same row. The live render aggregates property
+    scores itself when the date has not been rolled up. Pass data_version if
+    the caller already computed it.
+    """
+    if data_version is None:
+        data_version = await get_brief_data_version(db, brief)
+
+    query = select(BriefPayload.data_version, BriefPayload.payload).where(
+        BriefPayload.brief_snapshot_id == brief.id,
+        BriefPayload.audience == user.audience_key,
+    )
+    result = await db.execute(query)
+    stored = result.one_or_none()
+
+    if stored and stored.data_version == data_version.tag:
+        return stored.payload
+
+    response = await build_brief(db, brief, user)
+    return response.model_dump_json(by_alias=True)
+
+
+async def precompute_brief_payloads(
+    session: AsyncSession,
+    as_of_date: date | None = None,
+    force: bool = False,
+):
+    """Render payloads for every brief snapshot (or one date) and audience."""
+    query = select(PortfolioBriefSnapshot).order_by(PortfolioBriefSnapshot.as_of_date)
+    if as_of_date:
+        query = query.where(PortfolioBriefSnapshot.as_of_date == as_of_date)
+    result = await session.execute(query)
+    briefs = result.scalars().all()
+
+    rendered = 0
+    for brief in briefs:
+        data_version = (await get_brief_data_version(session, brief)).tag
+        stale_users = list_demo_users()
+        if not force:
+            stored_query = select(BriefPayload.audience).where(
+                BriefPayload.brief_snapshot_id == brief.id,
+                BriefPayload.data_version == data_version,
+            )
+            stored_result = await session.execute(stored_query)
+            current = set(stored_result.scalars().all())
+            stale_users = [u for u in stale_users if u.audience_key not in current]
+
+        if not stale_users:
+            continue
+
+        # The rollup is part of the data version; refresh it before rendering
+        if await rollup_property_scores(session, brief.as_of_date):
+            data_version = (await get_brief_data_version(session, brief)).tag
+        for user in stale_users:
+            await render_brief_payload(session, brief, user, data_version)
+            rendered += 1
+
+    print(f"Rendered {rendered} brief payloads for {len(briefs)} brief snapshots")
+
+
+async def run(as_of_date: date | None = None, force: bool = False):
+    async with AsyncSessionLocal() as session:
+        await precompute_brief_payloads(session, as_of_date=as_of_date, force=force)
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Precompute /brief payloads")
+    parser.add_argument("--as-of", type=date.fromisoformat, help="Only this snapshot date")
+    parser.add_argument("--force", action="store_true", help="Re-render current payloads too")
+    args = parser.parse_args()
+    asyncio.run(run(as_of_date=args.as_of, force=args.force))
+
+
+if __name__ == "__main__":
+    main()
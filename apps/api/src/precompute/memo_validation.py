@@ -0,0 +1,389 @@
+"""
+Offline memo validation.
+
+Runs validate_memo over events in a process pool and stores memo_validated,
+validation_errors, quote_spans (verified original-text quote offsets, for
+the evidence viewer) and validation_hash. Request paths only read the stored
+verdict (is_event_valid_for_display), so string scanning never runs on the
+event loop.
+
+validation_hash fingerprints everything a verdict depends on (memo fields,
+event type, each evidence source's metadata and text, and the rule set) and
+is computed in SQL, so finding changed events doesn't pull evidence text
+out of the database; only events whose hash differs are loaded and
+revalidated.
+
+Normalizing evidence text for quote search builds an offset map per field
+(src.validators.evidence_text). Workers get the stored maps of their
+evidence (evidence_text_maps) with the payload and return the maps they had
+to build, which are stored for later runs and other workers.
+
+Results are also persisted in memo_validation_results under the same input
+hash, so an event whose inputs match an earlier result, such as on an --all
+run, takes it without revalidating. Keys are never recomputed in Python:
+workers validate with an explicit scanner, which skips validate_memo's
+in-process cache and its key. Results for other rule sets are pruned at
+the start of a run.
+
+Writing a changed verdict bumps events.updated_at, which moves the tenant
+and brief data versions (src.caching), so ETags for those routes change
+and stale brief payloads are re-rendered at the end of the run rather than
+on the next GET /brief. Events whose verdict didn't change keep their
+updated_at.
+
+Usage:
+    cd apps/api
+    poetry run python -m src.precompute.memo_validation [--all] [--workers N] [--batch-size N] [--no-result-cache]
+"""
+
+import argparse
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy import select, update, delete, func, cast, String, literal
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.database import AsyncSessionLocal
+from src.models import Event, EvidenceSource, EvidenceTextMap, MemoValidationResultRecord
+from src.models.loaders import event_validation_options
+from src.precompute.brief_payloads import precompute_brief_payloads
+from src.validators.evidence_text import SEARCHABLE_FIELDS, cached_field, load_offset_map
+from src.validators.memo_validator import (
+    get_marker_scanner,
+    validate_memo,
+    validation_rules_fingerprint,
+)
+
+# Events loaded, validated and written per round trip
+BATCH_SIZE = 200
+
+
+def validation_input_hash():
+    """SQL expression: md5 over an event's validation inputs and the rule set."""
+    evidence = aliased(EvidenceSource, name="validated_evidence")
+    evidence_digest = (
+        select(
+            func.string_agg(
+                func.concat_ws(
+                    ":",
+                    cast(evidence.id, String),
+                    evidence.source_type,
+                    cast(evidence.tier, String),
+                    func.md5(func.coalesce(evidence.excerpt, "")),
+                    func.md5(func.coalesce(evidence.raw_text, "")),
+                    func.md5(func.coalesce(evidence.title, "")),
+                ),
+                # Ordered so the digest doesn't depend on scan order
+                aggregate_order_by(literal(","), evidence.id),
+            )
+        )
+        .where(evidence.event_id == Event.id)
+        .scalar_subquery()
+    )
+    return func.md5(
+        func.concat_ws(
+            "|",
+            literal(validation_rules_fingerprint()),
+            Event.event_type,
+            func.coalesce(Event.memo_what_disclosed, ""),
+            func.coalesce(cast(Event.memo_key_details, String), ""),
+            func.coalesce(cast(Event.memo_context, String), ""),
+            func.coalesce(evidence_digest, ""),
+        )
+    )
+
+
+def _payload(event: Event, text_maps: dict[tuple[str, str], dict]) -> dict[str, Any]:
+    """Plain, picklable copy of what validate_memo reads, with stored offset maps."""
+    return {
+        "id": str(event.id),
+        "event_type": event.event_type,
+        "memo_what_disclosed": event.memo_what_disclosed,
+        "memo_key_details": event.memo_key_details,
+        "memo_context": event.memo_context,
+        "evidence_sources": [
+            {
+                "id": str(ev.id),
+                "source_type": ev.source_type,
+                "tier": ev.tier,
+                "title": ev.title,
+                "excerpt": ev.excerpt,
+                "raw_text": ev.raw_text,
+                "text_maps": {
+                    name: text_maps[(str(ev.id), name)]
+                    for name in SEARCHABLE_FIELDS
+                    if (str(ev.id), name) in text_maps
+                },
+            }
+            for ev in event.evidence_sources
+        ],
+    }
+
+
+def _verdict_values(event: Event, result: dict) -> dict[str, Any]:
+    """Event column values for a validation result."""
+    values = {
+        "id": event.id,
+        "memo_validated": result["valid"],
+        "validation_errors": [{"error": e} for e in result["errors"]] or None,
+        "quote_spans": result["quote_spans"] or None,
+    }
+    if (
+        event.memo_validated == values["memo_validated"]
+        and event.validation_errors == values["validation_errors"]
+        and event.quote_spans == values["quote_spans"]
+    ):
+        # Same verdict: keep updated_at so cached responses stay valid
+        values["updated_at"] = event.updated_at
+    return values
+
+
+def _validate_payload(payload: dict[str, Any]) -> tuple[dict, list[dict]]:
+    """
+    Worker: validate one event payload.
+
+    Returns the serialized result and the offset maps built for it that were
+    not stored yet (or were stored for older text), as evidence_text_maps rows.
+    """
+    current: set[tuple[str, str]] = set()
+    for ev in payload["evidence_sources"]:
+        for name, stored in ev["text_maps"].items():
+            if ev[name] and load_offset_map(ev[name], **stored):
+                current.add((ev["id"], name))
+
+    event = SimpleNamespace(
+        **{**payload, "evidence_sources": [SimpleNamespace(**ev) for ev in payload["evidence_sources"]]}
+    )
+    # Explicit scanner: no in-process cache (keys would re-hash the evidence)
+    result = validate_memo(event, get_marker_scanner()).to_json()
+
+    new_maps = []
+    for ev in payload["evidence_sources"]:
+        for name in SEARCHABLE_FIELDS:
+            if not ev[name] or (ev["id"], name) in current:
+                continue
+            cached = cached_field(ev[name])
+            if cached is None:
+                continue  # never searched, so never normalized
+            key, normalized = cached
+            normalized_starts, original_starts = normalized.offset_map()
+            new_maps.append({
+                "evidence_id": ev["id"],
+                "field": name,
+                "content_hash": key,
+                "normalized_starts": normalized_starts,
+                "original_starts": original_starts,
+            })
+    return result, new_maps
+
+
+async def _stored_text_maps(
+    session: AsyncSession, events: list[Event]
+) -> dict[tuple[str, str], dict]:
+    """Stored offset maps of the events' evidence, by (evidence id, field)."""
+    evidence_ids = [ev.id for event in events for ev in event.evidence_sources]
+    if not evidence_ids:
+        return {}
+    result = await session.execute(
+        select(EvidenceTextMap).where(EvidenceTextMap.evidence_id.in_(evidence_ids))
+    )
+    return {
+        (str(row.evidence_id), row.field): {
+            "stored_hash": row.content_hash,
+            "normalized_starts": row.normalized_starts,
+            "original_starts": row.original_starts,
+        }
+        for row in result.scalars().all()
+    }
+
+
+async def _store_text_maps(session: AsyncSession, rows: list[dict]) -> None:
+    stmt = insert(EvidenceTextMap)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EvidenceTextMap.evidence_id, EvidenceTextMap.field],
+        set_={
+            "content_hash": stmt.excluded.content_hash,
+            "normalized_starts": stmt.excluded.normalized_starts,
+            "original_starts": stmt.excluded.original_starts,
+        },
+    )
+    await session.execute(stmt, rows)
+
+
+async def _cached_results(session: AsyncSession, keys: list[str]) -> dict[str, dict]:
+    """Persisted results for the given validation keys."""
+    result = await session.execute(
+        select(MemoValidationResultRecord.key, MemoValidationResultRecord.result).where(
+            MemoValidationResultRecord.key.in_(keys)
+        )
+    )
+    return dict(result.all())
+
+
+async def prune_result_cache(session: AsyncSession) -> int:
+    """Drop persisted results recorded under other rule sets."""
+    result = await session.execute(
+        delete(MemoValidationResultRecord).where(
+            MemoValidationResultRecord.rules_fingerprint != validation_rules_fingerprint()
+        )
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def validate_events(
+    session: AsyncSession,
+    changed_only: bool = True,
+    workers: int | None = None,
+    batch_size: int = BATCH_SIZE,
+    use_result_cache: bool = True,
+) -> tuple[int, int]:
+    """
+    Validate events and persist the verdicts.
+
+    With changed_only, events whose stored validation_hash still matches
+    their inputs are skipped. With use_result_cache, events whose inputs
+    match a result in memo_validation_results take it without revalidating,
+    and new results are added there. Returns (validated, valid) counts.
+    """
+    input_hash = validation_input_hash().label("input_hash")
+    loop = asyncio.get_running_loop()
+    validated = valid = 0
+    last_id = None
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            # Keyset over event ids; the hash is computed server-side
+            stale_query = select(Event.id, input_hash).order_by(Event.id).limit(batch_size)
+            if last_id is not None:
+                stale_query = stale_query.where(Event.id > last_id)
+            if changed_only:
+                stale_query = stale_query.where(
+                    Event.validation_hash.is_distinct_from(validation_input_hash())
+                )
+            stale_result = await session.execute(stale_query)
+            stale = dict(stale_result.all())
+            if not stale:
+                break
+            last_id = max(stale)
+
+            events_query = (
+                select(Event)
+                .options(*event_validation_options())
+                .where(Event.id.in_(stale))
+            )
+            events_result = await session.execute(events_query)
+            events = events_result.scalars().all()
+
+            # The input hash doubles as the result cache key
+            keys = {event.id: stale[event.id] for event in events}
+            cached = await _cached_results(session, list(keys.values())) if use_result_cache else {}
+            misses = [event for event in events if keys[event.id] not in cached]
+            text_maps = await _stored_text_maps(session, misses)
+            fresh = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _validate_payload, _payload(e, text_maps))
+                    for e in misses
+                )
+            )
+            new_results = {keys[event.id]: result for event, (result, _) in zip(misses, fresh)}
+            new_text_maps = [row for _, rows in fresh for row in rows]
+            results = {
+                event.id: cached.get(keys[event.id]) or new_results[keys[event.id]]
+                for event in events
+            }
+
+            # Bulk UPDATE by primary key (executemany)
+            await session.execute(
+                update(Event),
+                [
+                    {
+                        **_verdict_values(event, results[event.id]),
+                        "validation_hash": stale[event.id],
+                    }
+                    for event in events
+                ],
+            )
+            if new_text_maps:
+                await _store_text_maps(session, new_text_maps)
+            if use_result_cache and new_results:
+                await session.execute(
+                    insert(MemoValidationResultRecord).on_conflict_do_nothing(),
+                    [
+                        {
+                            "key": key,
+                            "rules_fingerprint": validation_rules_fingerprint(),
+                            "result": result,
+                        }
+                        for key, result in new_results.items()
+                    ],
+                )
+            await session.commit()
+            # Free the batch's ORM objects (evidence text) before the next one
+            session.expunge_all()
+
+            validated += len(results)
+            valid += sum(1 for result in results.values() if result["valid"])
+            print(
+                f"Validated {validated} events ({valid} valid, "
+                f"{len(results) - len(misses)} of this batch from the result cache)"
+            )
+
+    return validated, valid
+
+
+async def run(
+    changed_only: bool = True,
+    workers: int | None = None,
+    batch_size: int = BATCH_SIZE,
+    use_result_cache: bool = True,
+):
+    async with AsyncSessionLocal() as session:
+        if use_result_cache:
+            pruned = await prune_result_cache(session)
+            if pruned:
+                print(f"Pruned {pruned} cached results from earlier rule sets")
+        validated, valid = await validate_events(
+            session,
+            changed_only=changed_only,
+            workers=workers,
+            batch_size=batch_size,
+            use_result_cache=use_result_cache,
+        )
+        print(f"Validation complete: {validated} events validated, {validated - valid} invalid")
+        if validated:
+            # Verdicts feed the brief's recent events; re-render stale payloads
+            await precompute_brief_payloads(session)
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Validate event memos and store the verdicts")
+    parser.add_argument("--all", action="store_true", help="Revalidate unchanged events too")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="Validation processes"
+    )
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Events per batch")
+    parser.add_argument(
+        "--no-result-cache",
+        action="store_true",
+        help="Don't read or write memo_validation_results",
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        run(
+            changed_only=not args.all,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            use_result_cache=not args.no_result_cache,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
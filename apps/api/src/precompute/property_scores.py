@@ -0,0 +1,149 @@
+"""
+PropertyScoreSnapshot rollup.
+
+Derives each property's worst tenant status, issues count and watch score for
+every snapshot date in one aggregate pass over Lease ⋈ TenantScoreSnapshot,
+upserting into property_score_snapshots. The brief computes the same
+aggregate live (property_scores_query) for dates that were never rolled up.
+
+Usage:
+    cd apps/api
+    poetry run python -m src.precompute.property_scores [--as-of YYYY-MM-DD]
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from sqlalchemy import Select, select, func, case, true, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import AsyncSessionLocal
+from src.models import Property, Lease, TenantScoreSnapshot, PropertyScoreSnapshot
+
+
+def property_scores_query(as_of_date: date | None = None) -> Select:
+    """
+    Per-property rollup rows for one snapshot date, or all of them.
+
+    Columns: property_id, as_of_date, status, watch_score, issues_count.
+    Properties without scored tenants still get a row (stable, no issues).
+    """
+    dates_query = select(TenantScoreSnapshot.as_of_date).distinct()
+    if as_of_date:
+        dates_query = dates_query.where(TenantScoreSnapshot.as_of_date == as_of_date)
+    dates = dates_query.subquery("dates")
+
+    lease_status_query = (
+        select(
+            Lease.property_id,
+            TenantScoreSnapshot.as_of_date,
+            TenantScoreSnapshot.status,
+            TenantScoreSnapshot.score,
+        )
+        .join(TenantScoreSnapshot, TenantScoreSnapshot.tenant_id == Lease.tenant_id)
+    )
+    if as_of_date:
+        lease_status_query = lease_status_query.where(
+            TenantScoreSnapshot.as_of_date == as_of_date
+        )
+    lease_status = lease_status_query.subquery("lease_status")
+
+    def count_status(*statuses: str):
+        return func.count(lease_status.c.status).filter(
+            lease_status.c.status.in_(statuses)
+        )
+
+    worst_status = case(
+        (count_status("critical") > 0, "critical"),
+        (count_status("watch") > 0, "watch"),
+        (count_status("improving") > 0, "improving"),
+        else_="stable",
+    )
+
+    return (
+        select(
+            Property.id.label("property_id"),
+            dates.c.as_of_date,
+            worst_status.label("status"),
+            func.max(lease_status.c.score).label("watch_score"),
+            count_status("critical", "watch").label("issues_count"),
+        )
+        .select_from(Property)
+        .join(dates, true())
+        .outerjoin(
+            lease_status,
+            (lease_status.c.property_id == Property.id)
+            & (lease_status.c.as_of_date == dates.c.as_of_date),
+        )
+        .group_by(Property.id, dates.c.as_of_date)
+    )
+
+
+async def rollup_property_scores(
+    session: AsyncSession, as_of_date: date | None = None
+) -> int:
+    """
+    Recompute property rollups for one snapshot date, or all of them.
+
+    Every property gets a row, so the brief can list every property from the
+    rollup alone. Rows whose values did not change are left untouched, so
+    their updated_at (and the brief data version) only moves on real changes.
+    Returns the number of rows inserted or changed.
+    """
+    scores = property_scores_query(as_of_date).subquery("scores")
+    rollup = select(
+        func.gen_random_uuid(),
+        scores.c.property_id,
+        scores.c.as_of_date,
+        scores.c.status,
+        scores.c.watch_score,
+        scores.c.issues_count,
+        func.now(),
+    )
+
+    stmt = insert(PropertyScoreSnapshot).from_select(
+        ["id", "property_id", "as_of_date", "status", "watch_score", "issues_count", "created_at"],
+        rollup,
+    )
+    current = tuple_(
+        PropertyScoreSnapshot.status,
+        PropertyScoreSnapshot.watch_score,
+        PropertyScoreSnapshot.issues_count,
+    )
+    excluded = tuple_(
+        stmt.excluded.status, stmt.excluded.watch_score, stmt.excluded.issues_count
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_property_snapshot_date",
+        set_={
+            "status": stmt.excluded.status,
+            "watch_score": stmt.excluded.watch_score,
+            "issues_count": stmt.excluded.issues_count,
+            # ON CONFLICT DO UPDATE bypasses the column's onupdate
+            "updated_at": func.now(),
+        },
+        where=current.is_distinct_from(excluded),
+    )
+    result = await session.execute(stmt)
+    await session.commit()
+    return result.rowcount
+
+
+async def run(as_of_date: date | None = None):
+    async with AsyncSessionLocal() as session:
+        count = await rollup_property_scores(session, as_of_date=as_of_date)
+    print(f"Rolled up {count} property score snapshots")
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Roll up property score snapshots")
+    parser.add_argument("--as-of", type=date.fromisoformat, help="Only this snapshot date")
+    args = parser.parse_args()
+    asyncio.run(run(as_of_date=args.as_of))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 """Custom router for proper camelCase serialization."""
 
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.types import DecoratedCallable
 
+from src.caching import DataVersion, conditional
+
 
 class CamelRouter(APIRouter):
     """APIRouter that uses response_model_by_alias=True by default.
@@ -12,8 +14,26 @@ class CamelRouter(APIRouter):
     This ensures Pydantic models with alias_generator=to_camel
     serialize to camelCase in API responses while preserving
     OpenAPI schema documentation.
+
+    GET routes can also pass etag=<data version dependency> to get
+    conditional GET handling (ETag, 304) from src.caching.
     """
 
+    def get(
+        self,
+        path: str,
+        *,
+        etag: Callable[..., Awaitable[DataVersion]] | None = None,
+        **kwargs: Any,
+    ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        """Override to attach the conditional GET dependency when etag is given."""
+        if etag is not None:
+            kwargs["dependencies"] = [
+                *(kwargs.get("dependencies") or []),
+                Depends(conditional(etag)),
+            ]
+        return super().get(path, **kwargs)
+
     def api_route(
         self,
         path: str,
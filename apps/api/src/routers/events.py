@@ -5,27 +5,61 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.caching import DataVersion, get_data_version, table_stats, table_version
 from src.database import get_db
 from src.demo_auth import get_demo_user, DemoUser
 from src.models import Event, EvidenceSource, Tenant, Lease, Property
+from src.models.loaders import event_detail_options, evidence_view_options
 from src.responses import CamelRouter
-from src.schemas.event import EventDetailResponse, EvidenceResponse
-from src.validators.memo_validator import validate_memo
+from src.schemas.event import EventDetailResponse, EvidenceResponse, QuoteSpan
+from src.services.portfolio_graph import PortfolioGraph, get_portfolio_graph
 
 router = CamelRouter(tags=["events"])
 
 
-@router.get("/events/{event_id}", response_model=EventDetailResponse)
+async def event_version(
+    event_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    graph: PortfolioGraph = Depends(get_portfolio_graph),
+) -> DataVersion:
+    event_tenant_id = select(Event.tenant_id).where(Event.id == event_id).scalar_subquery()
+    return await get_data_version(
+        db,
+        table_stats(Event, Event.id == event_id),
+        table_stats(EvidenceSource, EvidenceSource.event_id == event_id),
+        table_stats(Lease, Lease.tenant_id == event_tenant_id),
+        table_version(Property),
+        # Badges come from the lease graph, which may trail the tables
+        extra=(graph.version,),
+    )
+
+
+async def evidence_version(
+    event_id: UUID, db: AsyncSession = Depends(get_db)
+) -> DataVersion:
+    return await get_data_version(
+        db,
+        table_stats(Event, Event.id == event_id),
+        table_stats(EvidenceSource, EvidenceSource.event_id == event_id),
+        # Revalidation rewrites the event's quote_spans in place
+        [select(Event.validation_hash).where(Event.id == event_id).scalar_subquery()],
+    )
+
+
+@router.get(
+    "/events/{event_id}", response_model=EventDetailResponse, etag=event_version
+)
 async def get_event(
     event_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: DemoUser = Depends(get_demo_user),
+    graph: PortfolioGraph = Depends(get_portfolio_graph),
 ):
     """Get detailed information about a specific event."""
     # Get event with evidence
     event_query = (
         select(Event)
-        .options(selectinload(Event.evidence_sources), selectinload(Event.tenant))
+        .options(selectinload(Event.tenant), *event_detail_options())
         .where(Event.id == event_id)
     )
     event_result = await db.execute(event_query)
@@ -34,15 +68,6 @@ async def get_event(
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    # Get properties for this tenant
-    properties_query = (
-        select(Property)
-        .join(Lease, Lease.property_id == Property.id)
-        .where(Lease.tenant_id == event.tenant_id)
-    )
-    properties_result = await db.execute(properties_query)
-    properties = properties_result.scalars().all()
-
     return EventDetailResponse(
         id=str(event.id),
         tenant_id=str(event.tenant_id),
@@ -59,12 +84,16 @@ async def get_event(
             "recommended_actions": event.memo_recommended_actions or [],
             "what_to_watch": event.memo_what_to_watch or [],
         } if event.memo_what_disclosed else None,
-        evidence_count=len(event.evidence_sources),
-        properties=[{"id": str(p.id), "name": p.name} for p in properties],
+        evidence_count=event.evidence_count,
+        properties=graph.badges(event.tenant_id),
     )
 
 
-@router.get("/events/{event_id}/evidence", response_model=list[EvidenceResponse])
+@router.get(
+    "/events/{event_id}/evidence",
+    response_model=list[EvidenceResponse],
+    etag=evidence_version,
+)
 async def get_event_evidence(
     event_id: UUID,
     db: AsyncSession = Depends(get_db),
@@ -82,12 +111,19 @@ async def get_event_evidence(
     # Get evidence sources, ordered by tier
     evidence_query = (
         select(EvidenceSource)
+        .options(*evidence_view_options())
         .where(EvidenceSource.event_id == event_id)
         .order_by(EvidenceSource.tier, EvidenceSource.source_date.desc())
     )
     evidence_result = await db.execute(evidence_query)
     evidence_sources = evidence_result.scalars().all()
 
+    # Quote offsets verified by memo validation, so the viewer can highlight
+    # without searching
+    spans_by_evidence: dict[str, list[QuoteSpan]] = {}
+    for span in event.quote_spans or []:
+        spans_by_evidence.setdefault(span["evidence_id"], []).append(QuoteSpan(**span))
+
     return [
         EvidenceResponse(
             id=str(e.id),
@@ -99,6 +135,7 @@ async def get_event_evidence(
             url=e.url,
             excerpt=e.excerpt,
             page_reference=e.page_reference,
+            quote_spans=spans_by_evidence.get(str(e.id), []),
         )
         for e in evidence_sources
     ]
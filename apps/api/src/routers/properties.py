@@ -1,76 +1,162 @@
 from uuid import UUID
 
-from fastapi import Depends, HTTPException
-from sqlalchemy import select, func
+from fastapi import Depends, HTTPException, Query
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.caching import DataVersion, get_data_version, table_stats, table_version
 from src.database import get_db
 from src.demo_auth import get_demo_user, DemoUser
+from src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor
 from src.models import Property, Lease, Tenant, TenantScoreSnapshot, Event
 from src.responses import CamelRouter
 from src.schemas.property import (
     PropertyResponse,
+    PropertyListResponse,
     PropertyDetailResponse,
     PropertyBasicResponse,
     PropertyTenantResponse,
     PropertyTenantEventResponse,
     PropertyEventResponse,
 )
+from src.services.snapshot_calendar import SnapshotCalendar, get_snapshot_calendar
 
 router = CamelRouter(tags=["properties"])
 
+# Events shown in a property's recent activity
+RECENT_EVENTS_LIMIT = 10
 
-@router.get("/properties", response_model=list[PropertyResponse])
+
+async def property_list_version(db: AsyncSession = Depends(get_db)) -> DataVersion:
+    return await get_data_version(
+        db,
+        table_version(Property),
+        table_version(Lease),
+        table_version(Event),
+    )
+
+
+async def property_version(
+    property_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    calendar: SnapshotCalendar = Depends(get_snapshot_calendar),
+) -> DataVersion:
+    property_tenant_ids = select(Lease.tenant_id).where(Lease.property_id == property_id)
+    return await get_data_version(
+        db,
+        table_stats(Property, Property.id == property_id),
+        table_stats(Lease, Lease.property_id == property_id),
+        table_stats(
+            TenantScoreSnapshot,
+            TenantScoreSnapshot.tenant_id.in_(property_tenant_ids),
+            TenantScoreSnapshot.as_of_date == calendar.latest(),
+        ),
+        table_stats(Event, Event.tenant_id.in_(property_tenant_ids)),
+        extra=(calendar.version,),
+    )
+
+
+@router.get(
+    "/properties", response_model=PropertyListResponse, etag=property_list_version
+)
 async def list_properties(
+    state: str | None = Query(None, description="Filter by state"),
+    asset_class: str | None = Query(None, description="Filter by asset class"),
+    min_events_count: int | None = Query(None, ge=0, description="Minimum tenants with events"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="nextCursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     user: DemoUser = Depends(get_demo_user),
 ):
-    """List all properties."""
-    # Get all properties
-    properties_query = select(Property).order_by(Property.name)
-    properties_result = await db.execute(properties_query)
-    properties = properties_result.scalars().all()
-
-    responses = []
-    for prop in properties:
-        # Get tenant count
-        tenant_count_query = (
-            select(func.count(Lease.id))
-            .where(Lease.property_id == prop.id)
+    """
+    List properties one page at a time, keyed on (name, id).
+
+    Lease and event counts come from one grouped subquery and filters are
+    applied in SQL, so a page is always a single query.
+    """
+    # Count of tenants with events (simplified)
+    tenant_has_events = (
+        select(Event.id).where(Event.tenant_id == Lease.tenant_id).exists()
+    )
+    lease_counts = (
+        select(
+            Lease.property_id,
+            func.count(Lease.id).label("tenant_count"),
+            func.count(func.distinct(Lease.tenant_id))
+            .filter(tenant_has_events)
+            .label("events_count"),
         )
-        tenant_count_result = await db.execute(tenant_count_query)
-        tenant_count = tenant_count_result.scalar() or 0
-
-        # Get count of tenants with events (simplified)
-        events_count_query = (
-            select(func.count(func.distinct(Event.tenant_id)))
-            .join(Lease, Lease.tenant_id == Event.tenant_id)
-            .where(Lease.property_id == prop.id)
+        .group_by(Lease.property_id)
+        .subquery("lease_counts")
+    )
+
+    tenant_count = func.coalesce(lease_counts.c.tenant_count, 0)
+    events_count = func.coalesce(lease_counts.c.events_count, 0)
+
+    properties_query = (
+        select(
+            Property,
+            tenant_count.label("tenant_count"),
+            events_count.label("events_count"),
         )
-        events_count_result = await db.execute(events_count_query)
-        events_count = events_count_result.scalar() or 0
+        .outerjoin(lease_counts, lease_counts.c.property_id == Property.id)
+        .order_by(Property.name, Property.id)
+    )
 
-        responses.append(PropertyResponse(
-            id=str(prop.id),
-            name=prop.name,
-            city=prop.city,
-            state=prop.state,
-            asset_class=prop.asset_class,
-            image_url=prop.image_url,
-            tenant_count=tenant_count,
-            events_count=events_count,
-        ))
+    if state:
+        properties_query = properties_query.where(Property.state == state)
+    if asset_class:
+        properties_query = properties_query.where(Property.asset_class == asset_class)
+    if min_events_count is not None:
+        properties_query = properties_query.where(events_count >= min_events_count)
 
-    return responses
+    if cursor:
+        after = decode_cursor(cursor, str, UUID)
+        properties_query = properties_query.where(tuple_(Property.name, Property.id) > after)
 
+    properties_result = await db.execute(properties_query.limit(limit + 1))
+    rows = properties_result.all()
 
-@router.get("/properties/{property_id}", response_model=PropertyDetailResponse)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].Property.name, rows[-1].Property.id)
+
+    return PropertyListResponse(
+        items=[
+            PropertyResponse(
+                id=str(row.Property.id),
+                name=row.Property.name,
+                city=row.Property.city,
+                state=row.Property.state,
+                asset_class=row.Property.asset_class,
+                image_url=row.Property.image_url,
+                tenant_count=row.tenant_count,
+                events_count=row.events_count,
+            )
+            for row in rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/properties/{property_id}",
+    response_model=PropertyDetailResponse,
+    etag=property_version,
+)
 async def get_property(
     property_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: DemoUser = Depends(get_demo_user),
+    calendar: SnapshotCalendar = Depends(get_snapshot_calendar),
 ):
-    """Get detailed information about a specific property."""
+    """
+    Get detailed information about a specific property.
+
+    Tenants (with lease, current status and newest event) and the property's
+    recent events come from one windowed query.
+    """
     # Get property
     property_query = select(Property).where(Property.id == property_id)
     property_result = await db.execute(property_query)
@@ -79,63 +165,93 @@ async def get_property(
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    # Get tenants at this property with their status
-    latest_date_query = (
-        select(TenantScoreSnapshot.as_of_date)
-        .order_by(TenantScoreSnapshot.as_of_date.desc())
-        .limit(1)
+    # Rank this property's events per tenant and overall; keep each tenant's
+    # newest event plus the property's most recent events
+    order = (Event.event_date.desc(), Event.id.desc())
+    property_tenant_ids = select(Lease.tenant_id).where(Lease.property_id == property_id)
+    ranked_events = (
+        select(
+            Event.id,
+            Event.tenant_id,
+            Event.event_type,
+            Event.headline,
+            Event.event_date,
+            func.row_number()
+            .over(partition_by=Event.tenant_id, order_by=order)
+            .label("tenant_rank"),
+            func.row_number().over(order_by=order).label("property_rank"),
+        )
+        .where(Event.tenant_id.in_(property_tenant_ids))
+        .subquery("ranked_events")
     )
-    latest_date_result = await db.execute(latest_date_query)
-    latest_date = latest_date_result.scalar_one_or_none()
 
+    # Get tenants at this property with their status and events, in one query
+    latest_date = calendar.latest()
     tenants_query = (
-        select(Tenant, Lease, TenantScoreSnapshot)
+        select(
+            Tenant,
+            Lease,
+            TenantScoreSnapshot.status,
+            ranked_events.c.id.label("event_id"),
+            ranked_events.c.event_type,
+            ranked_events.c.headline,
+            ranked_events.c.event_date,
+            ranked_events.c.tenant_rank,
+            ranked_events.c.property_rank,
+        )
         .join(Lease, Lease.tenant_id == Tenant.id)
         .outerjoin(
             TenantScoreSnapshot,
             (TenantScoreSnapshot.tenant_id == Tenant.id) &
             (TenantScoreSnapshot.as_of_date == latest_date)
         )
-        .where(Lease.property_id == property_id)
-    )
-    tenants_result = await db.execute(tenants_query)
-    tenant_data = tenants_result.all()
-
-    tenants = []
-    for tenant, lease, snapshot in tenant_data:
-        # Get latest event for this tenant
-        event_query = (
-            select(Event)
-            .where(Event.tenant_id == tenant.id)
-            .order_by(Event.event_date.desc())
-            .limit(1)
+        .outerjoin(
+            ranked_events,
+            (ranked_events.c.tenant_id == Tenant.id) &
+            (
+                (ranked_events.c.tenant_rank == 1) |
+                (ranked_events.c.property_rank <= RECENT_EVENTS_LIMIT)
+            )
         )
-        event_result = await db.execute(event_query)
-        latest_event = event_result.scalar_one_or_none()
-
-        tenants.append(PropertyTenantResponse(
-            id=str(tenant.id),
-            name=tenant.name,
-            status=snapshot.status if snapshot else "stable",
-            suite_label=lease.suite_label,
-            rent_share_estimate=lease.rent_share_estimate,
-            latest_event=PropertyTenantEventResponse(
-                id=str(latest_event.id),
-                headline=latest_event.headline,
-                date=latest_event.event_date.isoformat(),
-            ) if latest_event else None,
-        ))
-
-    # Get recent events at this property
-    events_query = (
-        select(Event)
-        .join(Lease, Lease.tenant_id == Event.tenant_id)
         .where(Lease.property_id == property_id)
-        .order_by(Event.event_date.desc())
-        .limit(10)
+        .order_by(Tenant.name, Lease.id, ranked_events.c.property_rank)
     )
-    events_result = await db.execute(events_query)
-    recent_events = events_result.scalars().all()
+    tenants_result = await db.execute(tenants_query)
+
+    tenants: dict[UUID, PropertyTenantResponse] = {}
+    recent_events: dict[UUID, tuple[int, PropertyEventResponse]] = {}
+    for row in tenants_result.all():
+        tenant, lease = row.Tenant, row.Lease
+        if lease.id not in tenants:
+            tenants[lease.id] = PropertyTenantResponse(
+                id=str(tenant.id),
+                name=tenant.name,
+                status=row.status or "stable",
+                suite_label=lease.suite_label,
+                rent_share_estimate=lease.rent_share_estimate,
+                latest_event=None,
+            )
+
+        if row.event_id is None:
+            continue
+
+        if row.tenant_rank == 1:
+            tenants[lease.id].latest_event = PropertyTenantEventResponse(
+                id=str(row.event_id),
+                headline=row.headline,
+                date=row.event_date.isoformat(),
+            )
+        if row.property_rank <= RECENT_EVENTS_LIMIT:
+            recent_events[row.event_id] = (
+                row.property_rank,
+                PropertyEventResponse(
+                    id=str(row.event_id),
+                    tenant_id=str(tenant.id),
+                    event_type=row.event_type,
+                    headline=row.headline,
+                    date=row.event_date.isoformat(),
+                ),
+            )
 
     return PropertyDetailResponse(
         property=PropertyBasicResponse(
@@ -146,15 +262,8 @@ async def get_property(
             asset_class=prop.asset_class,
             image_url=prop.image_url,
         ),
-        tenants=tenants,
+        tenants=list(tenants.values()),
         recent_events=[
-            PropertyEventResponse(
-                id=str(e.id),
-                tenant_id=str(e.tenant_id),
-                event_type=e.event_type,
-                headline=e.headline,
-                date=e.event_date.isoformat(),
-            )
-            for e in recent_events
+            event for _, event in sorted(recent_events.values(), key=lambda r: r[0])
         ],
     )
@@ -1,39 +1,99 @@
+from uuid import UUID
+
 from fastapi import Depends, Query
-from sqlalchemy import select, or_
+from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.caching import DataVersion, get_data_version, table_stats, table_version
+from src.config import get_settings
 from src.database import get_db
 from src.demo_auth import get_demo_user, DemoUser
-from src.models import Tenant, Property, TenantScoreSnapshot
+from src.models import Tenant, Property, TenantScoreSnapshot, Event, EvidenceSource
+from src.pagination import MAX_PAGE_SIZE, decode_cursor
 from src.responses import CamelRouter
 from src.schemas.search import (
     SearchResponse,
     SearchTenantResponse,
     SearchPropertyResponse,
+    DocumentSearchResponse,
 )
+from src.services.document_search import search_documents
+from src.services.snapshot_calendar import SnapshotCalendar, get_snapshot_calendar
+from src.services.typeahead import TypeaheadIndex, get_typeahead_index
 
 router = CamelRouter(tags=["search"])
 
+# Max results per entity type
+SEARCH_LIMIT = 10
+SUGGEST_LIMIT = 5
+
+# Document search page size (each hit carries a snippet)
+DOCUMENTS_PAGE_SIZE = 20
+
+
+def _match(column, q: str):
+    """Fuzzy word match or substring match; both use the column's trigram index."""
+    return or_(column.op("%>")(q), column.icontains(q, autoescape=True))
+
+
+def _rank(column, q: str):
+    """Similarity of q to the best-matching extent of column (0 when NULL)."""
+    return func.coalesce(func.word_similarity(q, column), 0)
+
+
+async def search_version(
+    db: AsyncSession = Depends(get_db),
+    calendar: SnapshotCalendar = Depends(get_snapshot_calendar),
+) -> DataVersion:
+    return await get_data_version(
+        db,
+        table_version(Tenant),
+        table_version(Property),
+        # Results only show statuses as of the latest snapshot
+        table_stats(TenantScoreSnapshot, TenantScoreSnapshot.as_of_date == calendar.latest()),
+        extra=(calendar.version,),
+    )
+
+
+async def document_search_version(db: AsyncSession = Depends(get_db)) -> DataVersion:
+    return await get_data_version(
+        db,
+        table_version(Event),
+        table_version(EvidenceSource),
+    )
+
 
-@router.get("/search", response_model=SearchResponse)
+@router.get("/search", response_model=SearchResponse, etag=search_version)
 async def search(
     q: str = Query(..., min_length=2, description="Search query"),
     db: AsyncSession = Depends(get_db),
     user: DemoUser = Depends(get_demo_user),
+    calendar: SnapshotCalendar = Depends(get_snapshot_calendar),
 ):
-    """Search for tenants and properties."""
-    search_term = f"%{q.lower()}%"
-
-    # Get latest snapshot date for tenant status
-    latest_date_query = (
-        select(TenantScoreSnapshot.as_of_date)
-        .order_by(TenantScoreSnapshot.as_of_date.desc())
-        .limit(1)
+    """
+    Search for tenants and properties, best matches first.
+
+    Matches are pg_trgm word similarity (typo tolerant) or plain substrings,
+    served from the trigram GIN indexes and ranked by similarity.
+    """
+    q = q.strip()
+
+    # Scope the fuzzy-match threshold (%> operator) to this transaction
+    await db.execute(
+        select(
+            func.set_config(
+                "pg_trgm.word_similarity_threshold",
+                str(get_settings().search_similarity_threshold),
+                True,
+            )
+        )
     )
-    latest_date_result = await db.execute(latest_date_query)
-    latest_date = latest_date_result.scalar_one_or_none()
+
+    # Latest snapshot date for tenant status
+    latest_date = calendar.latest()
 
     # Search tenants
+    tenant_rank = func.greatest(_rank(Tenant.name, q), _rank(Tenant.ticker, q))
     tenants_query = (
         select(Tenant, TenantScoreSnapshot)
         .outerjoin(
@@ -41,27 +101,20 @@ async def search(
             (TenantScoreSnapshot.tenant_id == Tenant.id) &
             (TenantScoreSnapshot.as_of_date == latest_date)
         )
-        .where(
-            or_(
-                Tenant.name.ilike(search_term),
-                Tenant.ticker.ilike(search_term),
-            )
-        )
-        .limit(10)
+        .where(or_(_match(Tenant.name, q), _match(Tenant.ticker, q)))
+        .order_by(tenant_rank.desc(), Tenant.name, Tenant.id)
+        .limit(SEARCH_LIMIT)
     )
     tenants_result = await db.execute(tenants_query)
     tenant_matches = tenants_result.all()
 
     # Search properties
+    property_rank = func.greatest(_rank(Property.name, q), _rank(Property.city, q))
     properties_query = (
         select(Property)
-        .where(
-            or_(
-                Property.name.ilike(search_term),
-                Property.city.ilike(search_term),
-            )
-        )
-        .limit(10)
+        .where(or_(_match(Property.name, q), _match(Property.city, q)))
+        .order_by(property_rank.desc(), Property.name, Property.id)
+        .limit(SEARCH_LIMIT)
     )
     properties_result = await db.execute(properties_query)
     property_matches = properties_result.scalars().all()
@@ -87,3 +140,61 @@ async def search(
             for prop in property_matches
         ],
     )
+
+
+@router.get("/search/suggest", response_model=SearchResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, description="Partial search query"),
+    limit: int = Query(SUGGEST_LIMIT, ge=1, le=SEARCH_LIMIT, description="Max results per type"),
+    index: TypeaheadIndex = Depends(get_typeahead_index),
+):
+    """
+    Typeahead suggestions for tenants and properties.
+
+    Served entirely from the in-memory typeahead index (no database access),
+    so it can run on every keystroke. Same shape as /search.
+    """
+    tenants, properties = index.suggest(q, limit)
+    return SearchResponse(
+        tenants=[
+            SearchTenantResponse(
+                id=str(tenant.id),
+                name=tenant.name,
+                ticker=tenant.ticker,
+                entity_type=tenant.entity_type,
+                status=index.status(tenant.id),
+            )
+            for tenant in tenants
+        ],
+        properties=[
+            SearchPropertyResponse(
+                id=str(prop.id),
+                name=prop.name,
+                city=prop.city,
+                state=prop.state,
+            )
+            for prop in properties
+        ],
+    )
+
+
+@router.get(
+    "/search/documents",
+    response_model=DocumentSearchResponse,
+    etag=document_search_version,
+)
+async def search_event_documents(
+    q: str = Query(..., min_length=2, description='Search query ("phrases", OR, -term)'),
+    limit: int = Query(DOCUMENTS_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="nextCursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+    user: DemoUser = Depends(get_demo_user),
+):
+    """
+    Full-text search over event headlines and memos and evidence text.
+
+    Hits are ranked best first and carry a snippet with highlight ranges;
+    see src.services.document_search.
+    """
+    after = decode_cursor(cursor, float, str, UUID) if cursor else None
+    return await search_documents(db, q, limit, after)
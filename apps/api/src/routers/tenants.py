@@ -1,102 +1,165 @@
+from datetime import date
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import or_, select, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from src.caching import DataVersion, get_data_version, table_stats, table_version
 from src.database import get_db
 from src.demo_auth import get_demo_user, DemoUser
-from src.models import Tenant, TenantScoreSnapshot, Event, Lease, Property
+from src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor
+from src.models import Tenant, TenantScoreSnapshot, Event, Lease, Property, EvidenceSource
+from src.models.loaders import event_card_options
 from src.responses import CamelRouter
-from src.schemas.tenant import TenantResponse, TenantDetailResponse
+from src.schemas.tenant import TenantResponse, TenantListResponse, TenantDetailResponse
+from src.services.portfolio_graph import PortfolioGraph, get_portfolio_graph
+from src.services.snapshot_calendar import SnapshotCalendar, get_snapshot_calendar
 from src.validators.memo_validator import is_event_valid_for_display
 
 router = CamelRouter(tags=["tenants"])
 
 
-@router.get("/tenants", response_model=list[TenantResponse])
+async def tenant_list_version(
+    db: AsyncSession = Depends(get_db),
+    calendar: SnapshotCalendar = Depends(get_snapshot_calendar),
+    graph: PortfolioGraph = Depends(get_portfolio_graph),
+) -> DataVersion:
+    return await get_data_version(
+        db,
+        table_version(Tenant),
+        table_stats(TenantScoreSnapshot, TenantScoreSnapshot.as_of_date == calendar.latest()),
+        table_version(Event),
+        table_version(Lease),
+        # The in-memory indexes the listing reads may trail the tables
+        extra=(calendar.version, graph.version),
+    )
+
+
+async def tenant_version(
+    tenant_id: UUID, db: AsyncSession = Depends(get_db)
+) -> DataVersion:
+    tenant_event_ids = select(Event.id).where(Event.tenant_id == tenant_id)
+    return await get_data_version(
+        db,
+        table_stats(Tenant, Tenant.id == tenant_id),
+        table_stats(TenantScoreSnapshot, TenantScoreSnapshot.tenant_id == tenant_id),
+        table_stats(Event, Event.tenant_id == tenant_id),
+        table_stats(EvidenceSource, EvidenceSource.event_id.in_(tenant_event_ids)),
+        table_stats(Lease, Lease.tenant_id == tenant_id),
+        table_version(Property),
+    )
+
+
+@router.get("/tenants", response_model=TenantListResponse, etag=tenant_list_version)
 async def list_tenants(
     status: str | None = Query(None, description="Filter by status"),
+    q: str | None = Query(None, description="Filter by name or ticker substring"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="nextCursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     user: DemoUser = Depends(get_demo_user),
+    calendar: SnapshotCalendar = Depends(get_snapshot_calendar),
+    graph: PortfolioGraph = Depends(get_portfolio_graph),
 ):
-    """List all tenants, optionally filtered by status."""
-    # Get latest snapshot date
-    latest_date_query = (
-        select(TenantScoreSnapshot.as_of_date)
-        .order_by(TenantScoreSnapshot.as_of_date.desc())
+    """
+    List tenants, optionally filtered by status and a name/ticker
+    substring, one page at a time.
+
+    Built from one query: tenants at the latest snapshot date with each
+    tenant's latest event via a lateral join. Lease counts come from the
+    lease graph. Pages are keyed on (status, name, id).
+    """
+    latest_date = calendar.latest()
+
+    latest_event = (
+        select(Event.id, Event.event_type, Event.headline, Event.event_date)
+        .where(Event.tenant_id == Tenant.id)
+        .order_by(Event.event_date.desc())
         .limit(1)
+        .lateral("latest_event")
     )
-    latest_date_result = await db.execute(latest_date_query)
-    latest_date = latest_date_result.scalar_one_or_none()
-
-    if not latest_date:
-        return []
 
     # Get tenants with their current status
     query = (
-        select(Tenant, TenantScoreSnapshot)
+        select(
+            Tenant,
+            TenantScoreSnapshot.status,
+            latest_event.c.id.label("event_id"),
+            latest_event.c.event_type,
+            latest_event.c.headline,
+            latest_event.c.event_date,
+        )
         .join(TenantScoreSnapshot, TenantScoreSnapshot.tenant_id == Tenant.id)
+        .outerjoin(latest_event, true())
         .where(TenantScoreSnapshot.as_of_date == latest_date)
     )
 
     if status:
         query = query.where(TenantScoreSnapshot.status == status)
 
-    query = query.order_by(TenantScoreSnapshot.status, Tenant.name)
-
-    result = await db.execute(query)
-    tenant_snapshots = result.all()
+    if q:
+        query = query.where(or_(
+            Tenant.name.icontains(q, autoescape=True),
+            Tenant.ticker.icontains(q, autoescape=True),
+        ))
 
-    responses = []
-    for tenant, snapshot in tenant_snapshots:
-        # Get property count
-        lease_count_query = (
-            select(Lease)
-            .where(Lease.tenant_id == tenant.id)
+    if cursor:
+        after = decode_cursor(cursor, str, str, UUID)
+        query = query.where(
+            tuple_(TenantScoreSnapshot.status, Tenant.name, Tenant.id) > after
         )
-        lease_result = await db.execute(lease_count_query)
-        property_count = len(lease_result.scalars().all())
 
-        # Get latest event
-        event_query = (
-            select(Event)
-            .where(Event.tenant_id == tenant.id)
-            .order_by(Event.event_date.desc())
-            .limit(1)
-        )
-        event_result = await db.execute(event_query)
-        latest_event = event_result.scalar_one_or_none()
-
-        responses.append(TenantResponse(
-            id=str(tenant.id),
-            name=tenant.name,
-            ticker=tenant.ticker,
-            cik=tenant.cik,
-            industry=tenant.industry,
-            entity_type=tenant.entity_type,
-            status=snapshot.status,
-            property_count=property_count,
+    query = query.order_by(TenantScoreSnapshot.status, Tenant.name, Tenant.id)
+
+    result = await db.execute(query.limit(limit + 1))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.status, last.Tenant.name, last.Tenant.id)
+
+    items = [
+        TenantResponse(
+            id=str(row.Tenant.id),
+            name=row.Tenant.name,
+            ticker=row.Tenant.ticker,
+            cik=row.Tenant.cik,
+            industry=row.Tenant.industry,
+            entity_type=row.Tenant.entity_type,
+            status=row.status,
+            property_count=graph.property_count(row.Tenant.id),
             latest_event={
-                "id": str(latest_event.id),
-                "event_type": latest_event.event_type,
-                "headline": latest_event.headline,
-                "date": latest_event.event_date.isoformat(),
-            } if latest_event else None,
-            logo_url=tenant.logo_url,
-        ))
+                "id": str(row.event_id),
+                "event_type": row.event_type,
+                "headline": row.headline,
+                "date": row.event_date.isoformat(),
+            } if row.event_id else None,
+            logo_url=row.Tenant.logo_url,
+        )
+        for row in rows
+    ]
 
-    return responses
+    return TenantListResponse(items=items, next_cursor=next_cursor)
 
 
-@router.get("/tenants/{tenant_id}", response_model=TenantDetailResponse)
+@router.get(
+    "/tenants/{tenant_id}", response_model=TenantDetailResponse, etag=tenant_version
+)
 async def get_tenant(
     tenant_id: UUID,
+    events_limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Events page size"),
+    events_cursor: str | None = Query(None, description="eventsNextCursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     user: DemoUser = Depends(get_demo_user),
 ):
-    """Get detailed information about a specific tenant."""
+    """
+    Get detailed information about a specific tenant.
+
+    Event history is paginated newest first, keyed on (event_date, id).
+    """
     # Get tenant
     tenant_query = select(Tenant).where(Tenant.id == tenant_id)
     tenant_result = await db.execute(tenant_query)
@@ -124,18 +187,36 @@ async def get_tenant(
     properties_result = await db.execute(properties_query)
     properties = properties_result.scalars().all()
 
-    # Get events with evidence
+    # Get a page of events with evidence
     events_query = (
         select(Event)
-        .options(selectinload(Event.evidence_sources))
+        .options(*event_card_options())
         .where(Event.tenant_id == tenant_id)
-        .order_by(Event.event_date.desc())
+        .order_by(Event.event_date.desc(), Event.id.desc())
     )
-    events_result = await db.execute(events_query)
+    if events_cursor:
+        after = decode_cursor(events_cursor, date.fromisoformat, UUID)
+        events_query = events_query.where(tuple_(Event.event_date, Event.id) < after)
+    events_result = await db.execute(events_query.limit(events_limit + 1))
     events = events_result.scalars().all()
 
+    events_next_cursor = None
+    if len(events) > events_limit:
+        events = events[:events_limit]
+        events_next_cursor = encode_cursor(events[-1].event_date, events[-1].id)
+
     # Get latest event for this tenant
-    latest_event = events[0] if events else None
+    if not events_cursor:
+        latest_event = events[0] if events else None
+    else:
+        latest_event_query = (
+            select(Event)
+            .where(Event.tenant_id == tenant_id)
+            .order_by(Event.event_date.desc(), Event.id.desc())
+            .limit(1)
+        )
+        latest_event_result = await db.execute(latest_event_query)
+        latest_event = latest_event_result.scalar_one_or_none()
 
     return TenantDetailResponse(
         tenant={
@@ -179,10 +260,11 @@ async def get_tenant(
                     "key_details": e.memo_key_details or [],
                     "context": e.memo_context or [],
                 } if e.memo_what_disclosed else None,
-                "evidence_count": len(e.evidence_sources),
+                "evidence_count": e.evidence_count,
                 "properties": [{"id": str(p.id), "name": p.name} for p in properties],
             }
             for e in events
             if is_event_valid_for_display(e)  # Filter invalid events
         ],
+        events_next_cursor=events_next_cursor,
     )
@@ -87,8 +87,10 @@ class BriefResponse(CamelModel):
     status_changes: StatusChangesResponse
     recent_events: list[EventResponse]
     coverage: CoverageResponse
-    # Properties requiring attention
+    # Properties requiring attention (top PROPERTIES_ATTENTION_LIMIT) and
+    # the number of properties they were taken from
     properties_attention: list[PropertyAttentionItem] | None = None
+    properties_total: int | None = None
     # Executive layer (optional - present for exec role)
     portfolio_verdict: PortfolioVerdict | None = None
     narrative_bullets: list[NarrativeBullet] | None = None
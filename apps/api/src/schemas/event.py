@@ -34,6 +34,14 @@ class EventDetailResponse(CamelModel):
     properties: list[PropertyBadge]
 
 
+class QuoteSpan(CamelModel):
+    """Verified location of a key detail's quote in stored evidence text."""
+    detail: int  # index into memo key_details
+    field: str  # excerpt, raw_text, title
+    start: int
+    end: int
+
+
 class EvidenceResponse(CamelModel):
     id: str
     event_id: str
@@ -44,3 +52,4 @@ class EvidenceResponse(CamelModel):
     url: str | None
     excerpt: str | None
     page_reference: str | None
+    quote_spans: list[QuoteSpan] = []
@@ -12,6 +12,11 @@ class PropertyResponse(CamelModel):
     events_count: int
 
 
+class PropertyListResponse(CamelModel):
+    items: list[PropertyResponse]
+    next_cursor: str | None = None
+
+
 class PropertyTenantResponse(CamelModel):
     id: str
     name: str
@@ -19,3 +19,32 @@ class SearchPropertyResponse(CamelModel):
 class SearchResponse(CamelModel):
     tenants: list[SearchTenantResponse]
     properties: list[SearchPropertyResponse]
+
+
+class HighlightSpan(CamelModel):
+    start: int
+    end: int
+
+
+class DocumentSearchHit(CamelModel):
+    kind: str  # event, evidence
+    id: str
+    event_id: str
+    event_type: str
+    event_date: str
+    headline: str
+    tenant_id: str
+    tenant_name: str
+    evidence_title: str | None = None
+    field: str  # headline, memo_what_disclosed, excerpt, raw_text
+    rank: float
+    snippet: str
+    # Character offset of the snippet within the field (None if not located)
+    offset: int | None
+    # Matched terms, as character ranges within the snippet
+    highlights: list[HighlightSpan]
+
+
+class DocumentSearchResponse(CamelModel):
+    items: list[DocumentSearchHit]
+    next_cursor: str | None = None
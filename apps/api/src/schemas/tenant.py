@@ -21,6 +21,11 @@ class TenantResponse(CamelModel):
     logo_url: str | None = None
 
 
+class TenantListResponse(CamelModel):
+    items: list[TenantResponse]
+    next_cursor: str | None = None
+
+
 class PropertySummary(CamelModel):
     id: str
     name: str
@@ -62,3 +67,4 @@ class TenantDetailResponse(CamelModel):
     tenant: TenantResponse
     properties: list[PropertySummary]
     events: list[EventDetailResponse]
+    events_next_cursor: str | None = None
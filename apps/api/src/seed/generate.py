@@ -0,0 +1,390 @@
+"""
+Synthetic portfolio generator for scale testing.
+
+Writes the same fixtures seed.load consumes (portfolios, properties,
+tenants, leases, events, evidence, score_snapshots, brief_snapshots) as
+NDJSON, optionally gzip-compressed, sized by parameters up to production
+scale (100k tenants, 1M events, 5 years of weekly snapshots). Output is
+deterministic: the same parameters and --seed produce byte-identical
+files. Rows are written as they are generated, so memory stays flat apart
+from per-tenant state.
+
+Memos cite their evidence with quote_text taken from the evidence excerpt,
+and each excerpt is embedded in raw_text, so generated events pass memo
+validation. raw_text lengths follow the source type (long filings, short
+news); --raw-text-scale shrinks them for quicker runs.
+
+Usage:
+    cd apps/api
+    poetry run python -m src.seed.generate --out /tmp/fixtures [--tenants N] [--events N] [--weeks N] [--seed N]
+    poetry run python -m src.seed.load --bulk --fixtures /tmp/fixtures
+"""
+
+import argparse
+import gzip
+import io
+import json
+import random
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import IO
+from uuid import UUID
+
+# Id namespaces (top byte of the UUID), one per table
+_KINDS = {
+    "portfolio": 0x10,
+    "property": 0x11,
+    "tenant": 0x12,
+    "lease": 0x13,
+    "event": 0x14,
+    "evidence": 0x15,
+    "score_snapshot": 0x16,
+    "brief_snapshot": 0x17,
+}
+
+CITIES = [
+    ("Chicago", "IL"), ("Dallas", "TX"), ("Atlanta", "GA"), ("Denver", "CO"),
+    ("Phoenix", "AZ"), ("Seattle", "WA"), ("Boston", "MA"), ("Charlotte", "NC"),
+    ("Nashville", "TN"), ("Columbus", "OH"), ("Tampa", "FL"), ("Austin", "TX"),
+]
+ASSET_CLASSES = ["Office", "Retail", "Industrial", "Multifamily", "Mixed-Use"]
+PROPERTY_WORDS = ["Riverside", "Gateway", "Park", "Summit", "Harbor", "Willow", "Cedar", "Union", "Lakeview", "Northgate"]
+PROPERTY_TYPES = ["Tower", "Plaza", "Center", "Commons", "Industrial Park", "Square", "Place"]
+TENANT_WORDS = ["Apex", "Northstar", "Blue", "Summit", "Granite", "Harbor", "Pioneer", "Vertex", "Meridian", "Atlas", "Quantum", "Cascade", "Beacon", "Sterling", "Evergreen"]
+TENANT_NOUNS = ["Retail", "Logistics", "Health", "Foods", "Apparel", "Data", "Fitness", "Manufacturing", "Pharma", "Media"]
+TENANT_SUFFIXES = ["Group", "Inc.", "Holdings", "Corp.", "Partners", "LLC"]
+INDUSTRIES = ["Retail", "Logistics", "Healthcare", "Consumer", "Technology", "Industrial", "Fitness", "Media"]
+
+# event_type -> (evidence source_type, tier, publisher, raw_text length range)
+SOURCES = {
+    "sec_filing": ("sec_filing", 1, "SEC EDGAR", (60_000, 300_000)),
+    "press_release": ("press_release", 1, "Business Wire", (2_000, 8_000)),
+    "news": ("news", 2, "Reuters", (3_000, 12_000)),
+    "court_filing": ("court_filing", 1, "PACER", (20_000, 120_000)),
+}
+EVENT_TYPES = list(SOURCES)
+EVENT_WEIGHTS = [3, 2, 4, 1]
+
+# (headline, excerpt) templates; {name} is the tenant
+EVENT_TEMPLATES = [
+    ("{name} reports covenant breach under senior credit facility",
+     "The Company was not in compliance with the leverage ratio covenant under its senior secured credit facility as of the end of the quarter and is negotiating a waiver with its lenders."),
+    ("{name} announces store closure program",
+     "The Company announced plans to close underperforming locations over the next two quarters as part of a broader cost reduction program."),
+    ("{name} discloses going concern uncertainty",
+     "These conditions raise substantial doubt about the Company's ability to continue as a going concern within one year after the date the financial statements are issued."),
+    ("{name} completes refinancing and extends maturities",
+     "The Company completed the refinancing of its term loan, extending the maturity by three years and reducing annual interest expense."),
+    ("{name} reports revenue growth and raises guidance",
+     "Revenue increased year over year, driven by higher volumes, and management raised its full-year guidance."),
+    ("{name} named defendant in landlord lawsuit over unpaid rent",
+     "The complaint alleges that the defendant failed to pay base rent and additional rent due under the lease for three consecutive months."),
+]
+
+FILLER_SENTENCES = [
+    "Management continues to evaluate operating performance across its locations.",
+    "The following discussion should be read together with the condensed consolidated financial statements.",
+    "Net cash used in operating activities reflected changes in working capital during the period.",
+    "The Company leases its stores, distribution centers and offices under operating leases.",
+    "Forward-looking statements are subject to risks and uncertainties that could cause actual results to differ.",
+    "Interest expense increased primarily due to higher borrowings under the revolving credit facility.",
+    "Selling, general and administrative expenses decreased as a percentage of net sales.",
+    "The Company believes its existing liquidity will be sufficient to fund operations for the next twelve months.",
+    "Inventory levels were reduced in response to lower customer demand in certain categories.",
+    "Capital expenditures were directed primarily toward maintenance and technology investments.",
+]
+
+
+def _id(kind: str, n: int) -> str:
+    return str(UUID(int=(_KINDS[kind] << 120) | n))
+
+
+@dataclass
+class _Tenant:
+    id: str
+    portfolio_id: str
+    name: str
+    score: int
+    previous_score: int
+
+
+class FixtureWriter:
+    """NDJSON writers for each fixture, gzip-compressed with a fixed mtime."""
+
+    def __init__(self, out: Path, compress: bool, stack: ExitStack):
+        self._files: dict[str, IO[str]] = {}
+        self._out = out
+        self._compress = compress
+        self._stack = stack
+        self.counts: dict[str, int] = {}
+
+    def write(self, fixture: str, row: dict) -> None:
+        f = self._files.get(fixture)
+        if f is None:
+            if self._compress:
+                raw = self._stack.enter_context(open(self._out / f"{fixture}.ndjson.gz", "wb"))
+                # mtime=0 keeps the output byte-identical between runs
+                binary = self._stack.enter_context(
+                    gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0)
+                )
+                f = self._stack.enter_context(io.TextIOWrapper(binary, encoding="utf-8"))
+            else:
+                f = self._stack.enter_context(
+                    open(self._out / f"{fixture}.ndjson", "w", encoding="utf-8")
+                )
+            self._files[fixture] = f
+            self.counts[fixture] = 0
+        f.write(json.dumps(row, separators=(",", ":")))
+        f.write("\n")
+        self.counts[fixture] += 1
+
+
+def status_for(score: int, previous_score: int) -> str:
+    """Status for a risk score (higher is riskier) given last week's score."""
+    if score >= 80:
+        return "critical"
+    if score >= 55:
+        return "watch"
+    if score < 50 and previous_score - score >= 5:
+        return "improving"
+    return "stable"
+
+
+def _raw_text(rng: random.Random, excerpt: str, length: int) -> str:
+    """Filler text of about length characters with the excerpt embedded."""
+    count = max(1, length // 90)
+    sentences = rng.choices(FILLER_SENTENCES, k=count)
+    sentences.insert(rng.randrange(len(sentences) + 1), excerpt)
+    # Paragraph breaks every few sentences, like extracted filings
+    return "\n\n".join(" ".join(sentences[i:i + 5]) for i in range(0, len(sentences), 5))
+
+
+def _check_sizes(
+    portfolios: int, properties: int, tenants: int, events: int, weeks: int, raw_text_scale: float
+) -> None:
+    """Reject parameter combinations the generator cannot honour, before writing anything."""
+    if weeks < 1 or portfolios < 1:
+        raise ValueError("weeks and portfolios must be at least 1")
+    if properties < 0 or tenants < 0 or events < 0:
+        raise ValueError("properties, tenants and events cannot be negative")
+    if events and not tenants:
+        raise ValueError(f"{events} events need at least one tenant to belong to")
+    if raw_text_scale <= 0:
+        raise ValueError("raw_text_scale must be positive")
+
+
+def generate(
+    out: Path,
+    seed: int = 0,
+    portfolios: int = 1,
+    properties: int = 200,
+    tenants: int = 1_000,
+    events: int = 10_000,
+    weeks: int = 52,
+    end_date: date = date(2026, 1, 17),
+    raw_text_scale: float = 1.0,
+    compress: bool = True,
+) -> dict[str, int]:
+    """Write a synthetic fixture set to out; returns row counts per fixture."""
+    _check_sizes(portfolios, properties, tenants, events, weeks, raw_text_scale)
+    rng = random.Random(seed)
+    out.mkdir(parents=True, exist_ok=True)
+    snapshot_dates = [end_date - timedelta(weeks=w) for w in range(weeks - 1, -1, -1)]
+    first_date = snapshot_dates[0] - timedelta(days=6)
+    span_days = (end_date - first_date).days + 1
+
+    with ExitStack() as stack:
+        writer = FixtureWriter(out, compress, stack)
+
+        portfolio_ids = [_id("portfolio", p + 1) for p in range(portfolios)]
+        for p, portfolio_id in enumerate(portfolio_ids):
+            writer.write("portfolios", {"id": portfolio_id, "name": f"Synthetic Portfolio {p + 1}"})
+
+        property_portfolios: list[list[str]] = [[] for _ in portfolio_ids]
+        for n in range(1, properties + 1):
+            p = (n - 1) % portfolios
+            city, state = rng.choice(CITIES)
+            property_id = _id("property", n)
+            property_portfolios[p].append(property_id)
+            writer.write("properties", {
+                "id": property_id,
+                "portfolio_id": portfolio_ids[p],
+                "name": f"{rng.choice(PROPERTY_WORDS)} {rng.choice(PROPERTY_TYPES)} {n}",
+                "city": city,
+                "state": state,
+                "asset_class": rng.choice(ASSET_CLASSES),
+                "image_url": None,
+            })
+
+        tenant_state: list[_Tenant] = []
+        lease_n = 0
+        for n in range(1, tenants + 1):
+            p = (n - 1) % portfolios
+            is_public = rng.random() < 0.3
+            name = f"{rng.choice(TENANT_WORDS)} {rng.choice(TENANT_NOUNS)} {rng.choice(TENANT_SUFFIXES)}"
+            tenant_id = _id("tenant", n)
+            score = rng.randint(20, 60)
+            tenant_state.append(_Tenant(tenant_id, portfolio_ids[p], name, score, score))
+            writer.write("tenants", {
+                "id": tenant_id,
+                "portfolio_id": portfolio_ids[p],
+                "name": name,
+                "ticker": "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=4)) if is_public else None,
+                "cik": f"{rng.randrange(10**10):010d}" if is_public else None,
+                "industry": rng.choice(INDUSTRIES),
+                "entity_type": "public" if is_public else "private",
+                "website": None,
+                "logo_url": None,
+            })
+
+            candidates = property_portfolios[p]
+            if not candidates:
+                continue
+            for property_id in rng.sample(candidates, k=min(len(candidates), rng.choice((1, 1, 2, 3)))):
+                lease_n += 1
+                writer.write("leases", {
+                    "id": _id("lease", lease_n),
+                    "tenant_id": tenant_id,
+                    "property_id": property_id,
+                    "suite_label": f"Suite {rng.randint(1, 40) * 100}",
+                    "rent_share_estimate": round(rng.uniform(0.02, 0.4), 2),
+                })
+
+        evidence_n = 0
+        for n in range(1, events + 1):
+            tenant = rng.choice(tenant_state)
+            event_type = rng.choices(EVENT_TYPES, weights=EVENT_WEIGHTS)[0]
+            headline, excerpt = rng.choice(EVENT_TEMPLATES)
+            event_id = _id("event", n)
+            event_date = first_date + timedelta(days=rng.randrange(span_days))
+
+            evidence_ids = []
+            # The first source matches the event type (SEC events need SEC evidence)
+            source_types = [event_type] + rng.sample(EVENT_TYPES, k=rng.randint(0, 2))
+            for source_key in source_types:
+                source_type, tier, publisher, (low, high) = SOURCES[source_key]
+                evidence_n += 1
+                evidence_id = _id("evidence", evidence_n)
+                evidence_ids.append(evidence_id)
+                length = int(rng.randint(low, high) * raw_text_scale)
+                writer.write("evidence", {
+                    "id": evidence_id,
+                    "event_id": event_id,
+                    "source_type": source_type,
+                    "title": f"{tenant.name} {source_type.replace('_', ' ')}",
+                    "publisher": publisher,
+                    "source_date": event_date.isoformat(),
+                    "url": None,
+                    "excerpt": excerpt,
+                    "raw_text": _raw_text(rng, excerpt, length),
+                    "page_reference": f"p.{rng.randint(1, 120)}" if tier == 1 else None,
+                    "tier": tier,
+                })
+
+            quote = excerpt.split(",")[0].rstrip(".")
+            writer.write("events", {
+                "id": event_id,
+                "tenant_id": tenant.id,
+                "event_type": event_type,
+                "event_date": event_date.isoformat(),
+                "headline": headline.format(name=tenant.name),
+                "memo_what_disclosed": f"{tenant.name} disclosed the following. {excerpt}",
+                "memo_key_details": [
+                    {
+                        "fact": quote,
+                        "citation": f"{SOURCES[event_type][2]}, {event_date:%b %d}",
+                        "evidence_id": evidence_ids[0],
+                        "quote_text": quote,
+                    }
+                ],
+                "memo_context": [f"{tenant.name} is a tenant in the portfolio"],
+                "memo_why_it_matters": None,
+                "memo_recommended_actions": [],
+                "memo_what_to_watch": [],
+                "memo_validated": True,
+                "validation_errors": None,
+            })
+
+        snapshot_n = 0
+        for week, as_of_date in enumerate(snapshot_dates):
+            counts = {pid: dict.fromkeys(("critical", "watch", "stable", "improving"), 0) for pid in portfolio_ids}
+            for tenant in tenant_state:
+                if week:
+                    tenant.previous_score = tenant.score
+                    tenant.score = min(100, max(0, tenant.score + rng.randint(-6, 6)))
+                status = status_for(tenant.score, tenant.previous_score)
+                counts[tenant.portfolio_id][status] += 1
+                snapshot_n += 1
+                writer.write("score_snapshots", {
+                    "id": _id("score_snapshot", snapshot_n),
+                    "tenant_id": tenant.id,
+                    "as_of_date": as_of_date.isoformat(),
+                    "status": status,
+                    "score": tenant.score,
+                })
+
+            for p, portfolio_id in enumerate(portfolio_ids):
+                c = counts[portfolio_id]
+                writer.write("brief_snapshots", {
+                    "id": _id("brief_snapshot", week * portfolios + p + 1),
+                    "portfolio_id": portfolio_id,
+                    "as_of_date": as_of_date.isoformat(),
+                    "headline": (
+                        f"{c['critical']} tenants are critical and {c['watch']} on watch this week."
+                    ),
+                    "headline_validated": True,
+                    "critical_count": c["critical"],
+                    "watch_count": c["watch"],
+                    "stable_count": c["stable"],
+                    "improving_count": c["improving"],
+                    "portfolio_verdict": None,
+                    "narrative_bullets": [],
+                    "concentration_insights": [],
+                    "exec_questions": [],
+                })
+
+        return writer.counts
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Generate synthetic seed fixtures")
+    parser.add_argument("--out", type=Path, required=True, help="Output directory")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--portfolios", type=int, default=1)
+    parser.add_argument("--properties", type=int, default=200)
+    parser.add_argument("--tenants", type=int, default=1_000)
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--weeks", type=int, default=52, help="Weekly snapshots (260 = 5 years)")
+    parser.add_argument(
+        "--end-date", type=date.fromisoformat, default=date(2026, 1, 17), help="Latest snapshot date"
+    )
+    parser.add_argument(
+        "--raw-text-scale", type=float, default=1.0, help="Multiplier on evidence raw_text lengths"
+    )
+    parser.add_argument("--no-compress", action="store_true", help="Write plain .ndjson")
+    args = parser.parse_args()
+
+    try:
+        counts = generate(
+            args.out,
+            seed=args.seed,
+            portfolios=args.portfolios,
+            properties=args.properties,
+            tenants=args.tenants,
+            events=args.events,
+            weeks=args.weeks,
+            end_date=args.end_date,
+            raw_text_scale=args.raw_text_scale,
+            compress=not args.no_compress,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    for fixture, count in counts.items():
+        print(f"Wrote {count} {fixture}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,28 @@ Seed data loader for Credit Oversight demo.
 
 Usage:
     cd apps/api
-    poetry run python -m src.seed.load
+    poetry run python -m src.seed.load [--bulk | --incremental [--delete-missing]] [--fixtures DIR]
 """
 
+import argparse
 import asyncio
-import json
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import AsyncSessionLocal, engine
+from src.precompute.brief_payloads import precompute_brief_payloads
+from src.precompute.property_scores import rollup_property_scores
+from src.seed.bulk import copy_rows
+from src.seed.reader import batched, find_fixture, iter_rows
+from src.seed.upsert import create_keep_table, delete_missing, upsert_batch
+from src.services.portfolio_graph import portfolio_graph
+from src.services.snapshot_calendar import snapshot_calendar
 from src.models import (
     Portfolio,
     Tenant,
@@ -30,15 +39,22 @@ from src.models import (
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Rows handed to the insert path at a time; bounds memory for large fixtures
+BATCH_ROWS = 5_000
 
-def load_fixture(name: str) -> list[dict]:
-    """Load a JSON fixture file."""
-    path = FIXTURES_DIR / f"{name}.json"
-    if not path.exists():
-        print(f"Warning: {path} not found, skipping")
-        return []
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+
+def iter_fixture(name: str, directory: Path = FIXTURES_DIR) -> Iterator[dict]:
+    """Rows of a fixture (.json, or .ndjson optionally .gz/.zst), read lazily."""
+    path = find_fixture(directory, name)
+    if path is None:
+        print(f"Warning: {directory / name}.json not found, skipping")
+        return iter(())
+    return iter_rows(path)
+
+
+def load_fixture(name: str, directory: Path = FIXTURES_DIR) -> list[dict]:
+    """Load a whole fixture."""
+    return list(iter_fixture(name, directory))
 
 
 def parse_uuid(value: str | None) -> UUID | None:
@@ -59,8 +75,11 @@ def parse_date(value: str | None):
 async def clear_tables(session: AsyncSession):
     """Clear all tables in reverse dependency order."""
     tables = [
+        "seed_row_hashes",
+        "brief_payloads",
         "evidence_sources",
         "events",
+        "property_score_snapshots",
         "tenant_score_snapshots",
         "leases",
         "portfolio_brief_snapshots",
@@ -74,184 +93,274 @@ async def clear_tables(session: AsyncSession):
     print("Cleared all tables")
 
 
-async def seed_portfolios(session: AsyncSession):
-    """Seed portfolios."""
-    data = load_fixture("portfolios")
-    for item in data:
-        portfolio = Portfolio(
-            id=parse_uuid(item["id"]),
-            name=item["name"],
-        )
-        session.add(portfolio)
-    await session.commit()
-    print(f"Seeded {len(data)} portfolios")
-
-
-async def seed_properties(session: AsyncSession):
-    """Seed properties."""
-    data = load_fixture("properties")
-    for item in data:
-        prop = Property(
-            id=parse_uuid(item["id"]),
-            portfolio_id=parse_uuid(item["portfolio_id"]),
-            name=item["name"],
-            city=item["city"],
-            state=item["state"],
-            asset_class=item["asset_class"],
-            image_url=item.get("image_url"),
-        )
-        session.add(prop)
-    await session.commit()
-    print(f"Seeded {len(data)} properties")
-
-
-async def seed_tenants(session: AsyncSession):
-    """Seed tenants."""
-    data = load_fixture("tenants")
-    for item in data:
-        tenant = Tenant(
-            id=parse_uuid(item["id"]),
-            portfolio_id=parse_uuid(item["portfolio_id"]),
-            name=item["name"],
-            ticker=item.get("ticker"),
-            cik=item.get("cik"),
-            industry=item.get("industry"),
-            entity_type=item.get("entity_type", "private"),
-            website=item.get("website"),
-            logo_url=item.get("logo_url"),
-        )
-        session.add(tenant)
-    await session.commit()
-    print(f"Seeded {len(data)} tenants")
-
-
-async def seed_leases(session: AsyncSession):
-    """Seed leases (tenant-property links)."""
-    data = load_fixture("leases")
-    for item in data:
-        lease = Lease(
-            id=parse_uuid(item["id"]),
-            tenant_id=parse_uuid(item["tenant_id"]),
-            property_id=parse_uuid(item["property_id"]),
-            suite_label=item.get("suite_label"),
-            rent_share_estimate=item.get("rent_share_estimate"),
-        )
-        session.add(lease)
+def portfolio_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "name": item["name"],
+    }
+
+
+def property_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "portfolio_id": parse_uuid(item["portfolio_id"]),
+        "name": item["name"],
+        "city": item["city"],
+        "state": item["state"],
+        "asset_class": item["asset_class"],
+        "image_url": item.get("image_url"),
+    }
+
+
+def tenant_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "portfolio_id": parse_uuid(item["portfolio_id"]),
+        "name": item["name"],
+        "ticker": item.get("ticker"),
+        "cik": item.get("cik"),
+        "industry": item.get("industry"),
+        "entity_type": item.get("entity_type", "private"),
+        "website": item.get("website"),
+        "logo_url": item.get("logo_url"),
+    }
+
+
+def lease_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "tenant_id": parse_uuid(item["tenant_id"]),
+        "property_id": parse_uuid(item["property_id"]),
+        "suite_label": item.get("suite_label"),
+        "rent_share_estimate": item.get("rent_share_estimate"),
+    }
+
+
+def event_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "tenant_id": parse_uuid(item["tenant_id"]),
+        "event_type": item["event_type"],
+        "event_date": parse_date(item["event_date"]),
+        "headline": item["headline"],
+        "memo_what_disclosed": item.get("memo_what_disclosed"),
+        "memo_key_details": item.get("memo_key_details"),
+        "memo_context": item.get("memo_context"),
+        "memo_why_it_matters": item.get("memo_why_it_matters"),
+        "memo_recommended_actions": item.get("memo_recommended_actions"),
+        "memo_what_to_watch": item.get("memo_what_to_watch"),
+        "memo_validated": item.get("memo_validated", False),
+        "validation_errors": item.get("validation_errors"),
+    }
+
+
+def evidence_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "event_id": parse_uuid(item["event_id"]),
+        "source_type": item["source_type"],
+        "title": item["title"],
+        "publisher": item["publisher"],
+        "source_date": parse_date(item["source_date"]),
+        "url": item.get("url"),
+        "excerpt": item.get("excerpt"),
+        "raw_text": item.get("raw_text"),
+        "page_reference": item.get("page_reference"),
+        "tier": item.get("tier", 2),
+    }
+
+
+def score_snapshot_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "tenant_id": parse_uuid(item["tenant_id"]),
+        "as_of_date": parse_date(item["as_of_date"]),
+        "status": item["status"],
+        "score": item.get("score"),
+    }
+
+
+def brief_snapshot_values(item: dict) -> dict:
+    return {
+        "id": parse_uuid(item["id"]),
+        "portfolio_id": parse_uuid(item["portfolio_id"]),
+        "as_of_date": parse_date(item["as_of_date"]),
+        "headline": item["headline"],
+        "headline_validated": item.get("headline_validated", False),
+        "critical_count": item.get("critical_count", 0),
+        "watch_count": item.get("watch_count", 0),
+        "stable_count": item.get("stable_count", 0),
+        "improving_count": item.get("improving_count", 0),
+        "portfolio_verdict": item.get("portfolio_verdict"),
+        "narrative_bullets": item.get("narrative_bullets"),
+        "concentration_insights": item.get("concentration_insights"),
+        "exec_questions": item.get("exec_questions"),
+    }
+
+
+# (fixture, model, row conversion, label), in dependency order
+SEED_TABLES = [
+    ("portfolios", Portfolio, portfolio_values, "portfolios"),
+    ("properties", Property, property_values, "properties"),
+    ("tenants", Tenant, tenant_values, "tenants"),
+    ("leases", Lease, lease_values, "leases"),
+    ("events", Event, event_values, "events"),
+    ("evidence", EvidenceSource, evidence_values, "evidence sources"),
+    ("score_snapshots", TenantScoreSnapshot, score_snapshot_values, "score snapshots"),
+    ("brief_snapshots", PortfolioBriefSnapshot, brief_snapshot_values, "brief snapshots"),
+]
+
+
+async def seed_table(
+    session: AsyncSession,
+    fixture: str,
+    model,
+    values,
+    label: str,
+    bulk: bool,
+    directory: Path = FIXTURES_DIR,
+):
+    """
+    Seed one table from its fixture, BATCH_ROWS rows at a time.
+
+    The ORM path adds one object per row; bulk streams the rows through COPY.
+    Each batch is released before the next is read, and the table is
+    committed once at the end.
+    """
+    started = time.perf_counter()
+    count = 0
+    for batch in batched(iter_fixture(fixture, directory), BATCH_ROWS):
+        if bulk:
+            count += await copy_rows(session, model, (values(item) for item in batch))
+        else:
+            session.add_all([model(**values(item)) for item in batch])
+            await session.flush()
+            session.expunge_all()
+            count += len(batch)
     await session.commit()
-    print(f"Seeded {len(data)} leases")
-
-
-async def seed_events(session: AsyncSession):
-    """Seed events with memos."""
-    data = load_fixture("events")
-    for item in data:
-        event = Event(
-            id=parse_uuid(item["id"]),
-            tenant_id=parse_uuid(item["tenant_id"]),
-            event_type=item["event_type"],
-            event_date=parse_date(item["event_date"]),
-            headline=item["headline"],
-            memo_what_disclosed=item.get("memo_what_disclosed"),
-            memo_key_details=item.get("memo_key_details"),
-            memo_context=item.get("memo_context"),
-            memo_why_it_matters=item.get("memo_why_it_matters"),
-            memo_recommended_actions=item.get("memo_recommended_actions"),
-            memo_what_to_watch=item.get("memo_what_to_watch"),
-            memo_validated=item.get("memo_validated", False),
-            validation_errors=item.get("validation_errors"),
-        )
-        session.add(event)
-    await session.commit()
-    print(f"Seeded {len(data)} events")
-
-
-async def seed_evidence(session: AsyncSession):
-    """Seed evidence sources."""
-    data = load_fixture("evidence")
-    for item in data:
-        evidence = EvidenceSource(
-            id=parse_uuid(item["id"]),
-            event_id=parse_uuid(item["event_id"]),
-            source_type=item["source_type"],
-            title=item["title"],
-            publisher=item["publisher"],
-            source_date=parse_date(item["source_date"]),
-            url=item.get("url"),
-            excerpt=item.get("excerpt"),
-            raw_text=item.get("raw_text"),
-            page_reference=item.get("page_reference"),
-            tier=item.get("tier", 2),
-        )
-        session.add(evidence)
-    await session.commit()
-    print(f"Seeded {len(data)} evidence sources")
-
-
-async def seed_score_snapshots(session: AsyncSession):
-    """Seed tenant score snapshots."""
-    data = load_fixture("score_snapshots")
-    for item in data:
-        snapshot = TenantScoreSnapshot(
-            id=parse_uuid(item["id"]),
-            tenant_id=parse_uuid(item["tenant_id"]),
-            as_of_date=parse_date(item["as_of_date"]),
-            status=item["status"],
-            score=item.get("score"),
-        )
-        session.add(snapshot)
-    await session.commit()
-    print(f"Seeded {len(data)} score snapshots")
-
-
-async def seed_brief_snapshots(session: AsyncSession):
-    """Seed portfolio brief snapshots."""
-    data = load_fixture("brief_snapshots")
-    for item in data:
-        brief = PortfolioBriefSnapshot(
-            id=parse_uuid(item["id"]),
-            portfolio_id=parse_uuid(item["portfolio_id"]),
-            as_of_date=parse_date(item["as_of_date"]),
-            headline=item["headline"],
-            headline_validated=item.get("headline_validated", False),
-            critical_count=item.get("critical_count", 0),
-            watch_count=item.get("watch_count", 0),
-            stable_count=item.get("stable_count", 0),
-            improving_count=item.get("improving_count", 0),
-            portfolio_verdict=item.get("portfolio_verdict"),
-            narrative_bullets=item.get("narrative_bullets"),
-            concentration_insights=item.get("concentration_insights"),
-            exec_questions=item.get("exec_questions"),
-        )
-        session.add(brief)
+    if bulk:
+        await session.execute(text(f"ANALYZE {model.__tablename__}"))
+    elapsed = time.perf_counter() - started
+    print(f"Seeded {count} {label} in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+async def upsert_tables(
+    session: AsyncSession, directory: Path = FIXTURES_DIR, delete: bool = False
+) -> int:
+    """
+    Incrementally seed every table (see src.seed.upsert) in one transaction.
+
+    With delete, rows missing from the fixtures are deleted, but only for
+    tables whose fixture was found: a missing file means "not part of this
+    run", never "delete everything". Returns the number of rows written or
+    deleted.
+    """
+    touched = 0
+    keep_tables = []
+    for fixture, model, values, label in SEED_TABLES:
+        if find_fixture(directory, fixture) is None:
+            print(f"Warning: no {fixture} fixture in {directory}, leaving {label} as is")
+            keep_tables.append(None)
+            continue
+        started = time.perf_counter()
+        keep = await create_keep_table(session, model)
+        keep_tables.append(keep)
+        upserted = unchanged = 0
+        for batch in batched(iter_fixture(fixture, directory), BATCH_ROWS):
+            batch_upserted, batch_unchanged = await upsert_batch(session, model, batch, values, keep)
+            upserted += batch_upserted
+            unchanged += batch_unchanged
+        touched += upserted
+        elapsed = time.perf_counter() - started
+        print(f"Upserted {upserted} {label} ({unchanged} unchanged) in {elapsed:.2f}s")
+
+    if delete:
+        seeded_tables = {
+            model.__tablename__
+            for (_, model, _, _), keep in zip(SEED_TABLES, keep_tables)
+            if keep is not None
+        }
+        for (_, model, _, label), keep in reversed(list(zip(SEED_TABLES, keep_tables))):
+            if keep is None:
+                continue
+            deleted = await delete_missing(session, model, keep, seeded_tables)
+            touched += deleted
+            print(f"Deleted {deleted} {label} missing from the fixtures")
+
     await session.commit()
-    print(f"Seeded {len(data)} brief snapshots")
+    return touched
 
 
-async def run_seed():
+async def run_seed(
+    bulk: bool = False,
+    directory: Path = FIXTURES_DIR,
+    incremental: bool = False,
+    delete: bool = False,
+):
     """Run the full seed process."""
     print("Starting seed process...")
-    print(f"Fixtures directory: {FIXTURES_DIR}")
+    print(f"Fixtures directory: {directory}")
 
     async with AsyncSessionLocal() as session:
-        # Clear existing data
-        await clear_tables(session)
-
-        # Seed in dependency order
-        await seed_portfolios(session)
-        await seed_properties(session)
-        await seed_tenants(session)
-        await seed_leases(session)
-        await seed_events(session)
-        await seed_evidence(session)
-        await seed_score_snapshots(session)
-        await seed_brief_snapshots(session)
+        if incremental:
+            # Upsert changed rows in place; no truncate, no downtime
+            touched = await upsert_tables(session, directory, delete=delete)
+            print(f"Incremental seed wrote or deleted {touched} rows")
+        else:
+            # Clear existing data
+            await clear_tables(session)
+
+            # Seed in dependency order
+            for fixture, model, values, label in SEED_TABLES:
+                await seed_table(session, fixture, model, values, label, bulk, directory)
+
+        # Render derived data so the first requests are served precomputed.
+        # Upserts bump updated_at, so changed rows move the payload versions
+        # and the API's indexes pick them up on their next refresh
+        await snapshot_calendar.refresh(session)
+        await portfolio_graph.refresh(session)
+        count = await rollup_property_scores(session)
+        print(f"Rolled up {count} property score snapshots")
+        await precompute_brief_payloads(session)
 
     print("Seed complete!")
 
 
 def main():
     """Entry point."""
-    asyncio.run(run_seed())
+    parser = argparse.ArgumentParser(description="Load demo fixtures")
+    parser.add_argument(
+        "--bulk", action="store_true", help="Load through COPY (large extracts)"
+    )
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        default=FIXTURES_DIR,
+        help="Fixture directory (.json, .ndjson, .ndjson.gz or .ndjson.zst per table)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Upsert changed rows instead of truncating and reloading",
+    )
+    parser.add_argument(
+        "--delete-missing",
+        action="store_true",
+        help="With --incremental, delete rows that aren't in the fixtures",
+    )
+    args = parser.parse_args()
+    if args.incremental and args.bulk:
+        parser.error("--bulk and --incremental are mutually exclusive")
+    if args.delete_missing and not args.incremental:
+        parser.error("--delete-missing requires --incremental")
+    asyncio.run(
+        run_seed(
+            bulk=args.bulk,
+            directory=args.fixtures,
+            incremental=args.incremental,
+            delete=args.delete_missing,
+        )
+    )
 
 
 if __name__ == "__main__":
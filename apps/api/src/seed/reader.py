@@ -0,0 +1,71 @@
+"""
+Fixture readers.
+
+<name>.json holds a JSON array and is parsed whole, which is fine for the
+demo fixtures. Production-sized extracts use newline-delimited JSON
+(<name>.ndjson, one object per line), optionally gzip (.ndjson.gz) or zstd
+(.ndjson.zst) compressed; these are decoded line by line, so peak memory is
+one batch of rows however large the file is. zstd needs the zstandard
+package (the seed-zstd extra), which is only imported when such a file is
+read.
+"""
+
+import gzip
+import io
+import json
+from itertools import islice
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+# Checked in order; the first existing file is used
+FIXTURE_SUFFIXES = (".ndjson.zst", ".ndjson.gz", ".ndjson", ".json")
+
+
+def find_fixture(directory: Path, name: str) -> Path | None:
+    """Path of the fixture called name in directory, in any supported format."""
+    for suffix in FIXTURE_SUFFIXES:
+        path = directory / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(
+                f"{path.name} is zstd-compressed; install the seed-zstd extra "
+                "(poetry install -E seed-zstd) to read it"
+            ) from None
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_rows(path: Path) -> Iterator[dict]:
+    """Rows of a fixture file, streamed for NDJSON."""
+    if path.suffix == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+        return
+
+    with _open_text(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path.name}:{line_number}: invalid JSON ({e.msg})") from None
+
+
+def batched(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """Consecutive lists of up to size rows."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -0,0 +1,152 @@
+"""
+Incremental (diff-aware) fixture loading.
+
+Instead of truncating and reloading every table, each fixture row is hashed
+(canonical JSON of the fixture item) and compared with the hash recorded in
+seed_row_hashes when that row was last seeded. Unchanged rows are skipped
+without being sent. New and changed rows are upserted by primary key with
+INSERT ... ON CONFLICT DO UPDATE, whose WHERE clause also leaves rows alone
+when their column values already match (e.g. on the first incremental run
+after a full load, which records no hashes).
+
+Upserts set updated_at themselves (ON CONFLICT DO UPDATE doesn't run the
+column's onupdate), so the conditional GET versions and the in-memory
+indexes see changed rows.
+
+Seeded ids are collected in a temporary table per table so that rows
+missing from the fixtures can be deleted afterwards. Everything runs in the
+caller's transaction, so readers see the old data until it commits.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable
+
+from sqlalchemy import delete, exists, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import TableClause, column, table
+
+from src.database import Base
+from src.models import SeedRowHash
+
+
+def row_hash(item: dict) -> str:
+    """Content hash of a fixture row."""
+    return hashlib.sha256(
+        json.dumps(item, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+async def create_keep_table(session: AsyncSession, model: Any) -> TableClause:
+    """
+    Temporary table collecting the ids seeded into model's table.
+
+    No key: a fixture may repeat an id, and the table is only probed by the
+    anti-join in delete_missing.
+    """
+    name = f"seed_keep_{model.__tablename__}"
+    await session.execute(text(f"CREATE TEMP TABLE {name} (id uuid) ON COMMIT DROP"))
+    return table(name, column("id"))
+
+
+async def upsert_batch(
+    session: AsyncSession,
+    model: Any,
+    items: list[dict],
+    values: Callable[[dict], dict],
+    keep: TableClause,
+) -> tuple[int, int]:
+    """
+    Upsert the fixture rows whose content hash changed; returns
+    (upserted, unchanged) counts.
+
+    When the batch repeats an id the last row wins, as it would for a
+    sequential load (one INSERT ... ON CONFLICT can't touch a row twice).
+    """
+    model_table = model.__table__
+    latest = {}
+    for item in items:
+        row = values(item)
+        latest[row["id"]] = (row, row_hash(item))
+    rows = [row for row, _ in latest.values()]
+    hashes = [h for _, h in latest.values()]
+    ids = list(latest)
+
+    result = await session.execute(
+        select(SeedRowHash.row_id, SeedRowHash.content_hash).where(
+            SeedRowHash.table_name == model_table.name, SeedRowHash.row_id.in_(ids)
+        )
+    )
+    seeded = dict(result.all())
+    changed = [(row, h) for row, h in zip(rows, hashes) if seeded.get(row["id"]) != h]
+
+    if changed:
+        stmt = insert(model_table)
+        columns = [name for name in changed[0][0] if name != "id"]
+        set_ = {name: stmt.excluded[name] for name in columns}
+        if "updated_at" in model_table.c:
+            set_["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model_table.c.id],
+            set_=set_,
+            where=tuple_(*(model_table.c[name] for name in columns)).is_distinct_from(
+                tuple_(*(stmt.excluded[name] for name in columns))
+            ),
+        )
+        await session.execute(stmt, [row for row, _ in changed])
+
+        hash_stmt = insert(SeedRowHash)
+        await session.execute(
+            hash_stmt.on_conflict_do_update(
+                index_elements=[SeedRowHash.table_name, SeedRowHash.row_id],
+                set_={"content_hash": hash_stmt.excluded.content_hash},
+            ),
+            [
+                {"table_name": model_table.name, "row_id": row["id"], "content_hash": h}
+                for row, h in changed
+            ],
+        )
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        keep.name, records=[(row_id,) for row_id in ids], columns=["id"]
+    )
+    return len(changed), len(rows) - len(changed)
+
+
+async def delete_missing(
+    session: AsyncSession, model: Any, keep: TableClause, seeded_tables: set[str]
+) -> int:
+    """
+    Delete rows of model's table that weren't in the fixtures; returns the count.
+
+    Rows of other tables referencing them are deleted first: derived tables
+    (such as property_score_snapshots, rebuilt by the seed's precompute
+    steps) and seeded tables whose fixture wasn't found this run. Tables in
+    seeded_tables are expected to have been handled already: call in
+    reverse dependency order.
+    """
+    model_table = model.__table__
+    # Temp tables are never auto-analyzed; give the anti-join real row counts
+    await session.execute(text(f"ANALYZE {keep.name}"))
+    missing = select(model_table.c.id).where(
+        ~exists().where(keep.c.id == model_table.c.id)
+    )
+
+    for dependent in Base.metadata.sorted_tables:
+        if dependent.name in seeded_tables:
+            continue
+        for fk in dependent.foreign_keys:
+            if fk.column.table is model_table:
+                await session.execute(delete(dependent).where(fk.parent.in_(missing)))
+
+    await session.execute(
+        delete(SeedRowHash).where(
+            SeedRowHash.table_name == model_table.name,
+            ~exists().where(keep.c.id == SeedRowHash.row_id),
+        )
+    )
+    result = await session.execute(delete(model_table).where(model_table.c.id.in_(missing)))
+    return result.rowcount
@@ -0,0 +1,417 @@
+"""
+Weekly brief assembly.
+
+Builds a BriefResponse for a PortfolioBriefSnapshot from the underlying
+snapshot, event, lease and property tables. Used both by the precompute stage
+(src.precompute.brief_payloads) and as the live fallback in /brief.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy import Select, Subquery, select, func, case, and_, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, aliased
+
+from src.config import get_settings
+from src.database import AsyncSessionLocal, engine
+from src.demo_auth import DemoUser
+from src.models import (
+    PortfolioBriefSnapshot,
+    TenantScoreSnapshot,
+    Tenant,
+    Event,
+    Lease,
+    Property,
+    PropertyScoreSnapshot,
+)
+from src.models.loaders import event_card_options
+from src.precompute.property_scores import property_scores_query
+from src.schemas.brief import (
+    BriefResponse,
+    StatusChangesResponse,
+    StatusChangeItem,
+    EventResponse,
+    CoverageResponse,
+    PropertyBadge,
+    PortfolioVerdict,
+    NarrativeBullet,
+    ConcentrationInsight,
+    PropertyAttentionItem,
+)
+from src.services.portfolio_graph import portfolio_graph
+from src.services.snapshot_calendar import snapshot_calendar
+from src.validators.memo_validator import is_event_valid_for_display
+
+# Statuses that count as a deterioration when a tenant moves into them
+ATTENTION_STATUSES = ("critical", "watch")
+
+# Days of events the brief covers, counting back from its as_of_date
+BRIEF_WINDOW_DAYS = 7
+
+# Event cards shown in the brief, and how many events to read per batch
+RECENT_EVENTS_LIMIT = 7
+EVENTS_BATCH_SIZE = 15
+
+# Max properties returned in properties_attention (most issues first)
+PROPERTIES_ATTENTION_LIMIT = 50
+
+
+def window_start(as_of_date: date) -> date:
+    """First event date inside the brief window for as_of_date."""
+    return as_of_date - timedelta(days=BRIEF_WINDOW_DAYS)
+
+
+def _section_slots() -> int:
+    """Section sessions allowed at once, leaving a pooled connection for other routes."""
+    limit = get_settings().brief_max_concurrent_sections
+    return max(1, min(limit, engine.pool.size() - 1))
+
+
+# Shared by every brief built in this process, so concurrent /brief requests
+# together hold at most _section_slots() extra connections
+_section_semaphore = asyncio.Semaphore(_section_slots())
+
+
+async def _get_status_changes(
+    db: AsyncSession, as_of_date: date, previous_date: date | None
+) -> StatusChangesResponse:
+    """
+    Compare tenant statuses between two snapshot dates in a single query.
+
+    previous_date is the previous snapshot that actually exists (None for the
+    first one, where every tenant counts as unchanged).
+
+    Current and previous snapshots are paired per tenant and classified in SQL.
+    Changed tenants come back with their name and latest event (via a lateral
+    join); the unchanged count rides along on every row, so the round trips
+    stay constant regardless of portfolio size.
+    """
+    current = aliased(TenantScoreSnapshot, name="current_snapshot")
+    previous = aliased(TenantScoreSnapshot, name="previous_snapshot")
+
+    # NULL previous status (no prior snapshot) falls through to "unchanged"
+    transition = case(
+        (
+            and_(
+                current.status.in_(ATTENTION_STATUSES),
+                previous.status.not_in(ATTENTION_STATUSES),
+            ),
+            "to_watch_or_critical",
+        ),
+        (
+            and_(current.status == "improving", previous.status != "improving"),
+            "to_improving",
+        ),
+        else_=None,
+    )
+
+    transitions = (
+        select(
+            current.tenant_id,
+            previous.status.label("previous_status"),
+            current.status.label("new_status"),
+            transition.label("transition"),
+        )
+        .outerjoin(
+            previous,
+            (previous.tenant_id == current.tenant_id)
+            & (previous.as_of_date == previous_date),
+        )
+        .where(current.as_of_date == as_of_date)
+        .cte("transitions")
+    )
+
+    counts = (
+        select(func.count().label("unchanged"))
+        .where(transitions.c.transition.is_(None))
+        .subquery("counts")
+    )
+
+    latest_event = (
+        select(Event.id, Event.headline)
+        .where(Event.tenant_id == transitions.c.tenant_id)
+        .order_by(Event.event_date.desc())
+        .limit(1)
+        .lateral("latest_event")
+    )
+
+    changed = (
+        select(
+            transitions.c.tenant_id,
+            Tenant.name.label("tenant_name"),
+            transitions.c.previous_status,
+            transitions.c.new_status,
+            transitions.c.transition,
+            latest_event.c.id.label("event_id"),
+            latest_event.c.headline.label("event_headline"),
+        )
+        .join(Tenant, Tenant.id == transitions.c.tenant_id)
+        .outerjoin(latest_event, true())
+        .where(transitions.c.transition.is_not(None))
+        .subquery("changed")
+    )
+
+    query = (
+        select(counts.c.unchanged, changed)
+        .select_from(counts.outerjoin(changed, true()))
+        .order_by(changed.c.tenant_name)
+    )
+    result = await db.execute(query)
+    rows = result.all()
+
+    to_watch_or_critical = []
+    to_improving = []
+    for row in rows:
+        if row.transition is None:
+            continue
+
+        item = StatusChangeItem(
+            tenant_id=str(row.tenant_id),
+            tenant_name=row.tenant_name,
+            previous_status=row.previous_status,
+            new_status=row.new_status,
+            event_id=str(row.event_id) if row.event_id else None,
+            event_headline=row.event_headline,
+        )
+        if row.transition == "to_watch_or_critical":
+            to_watch_or_critical.append(item)
+        else:
+            to_improving.append(item)
+
+    return StatusChangesResponse(
+        to_watch_or_critical=to_watch_or_critical,
+        to_improving=to_improving,
+        unchanged=rows[0].unchanged if rows else 0,
+    )
+
+
+async def _get_recent_events(
+    db: AsyncSession, as_of_date: date, user: DemoUser
+) -> list[EventResponse]:
+    """
+    Most recent displayable events in the brief window, with property badges.
+
+    AM scope is applied in SQL as a semi-join on leases at the assigned
+    properties (one bind per property rather than one per visible tenant,
+    and never behind the in-memory graph). Events are read in keyset
+    batches until enough pass display validation, so AMs always get a full
+    set of cards when they exist. Property badges come from the lease graph.
+    """
+    graph = await portfolio_graph.ensure_loaded(db)
+
+    events_query = (
+        select(Event)
+        .options(selectinload(Event.tenant), *event_card_options())
+        .where(Event.event_date >= window_start(as_of_date))
+        .order_by(Event.event_date.desc(), Event.id.desc())
+    )
+
+    # AM filtering: only show events for tenants at assigned properties
+    if user.is_am:
+        assigned_property_ids = [UUID(pid) for pid in user.assigned_property_ids]
+        visible_tenant_ids = select(Lease.tenant_id).where(
+            Lease.property_id.in_(assigned_property_ids)
+        )
+        events_query = events_query.where(Event.tenant_id.in_(visible_tenant_ids))
+
+    recent_events: list[Event] = []
+    last_event = None
+    while len(recent_events) < RECENT_EVENTS_LIMIT:
+        batch_query = events_query
+        if last_event is not None:
+            batch_query = batch_query.where(
+                tuple_(Event.event_date, Event.id) < (last_event.event_date, last_event.id)
+            )
+        events_result = await db.execute(batch_query.limit(EVENTS_BATCH_SIZE))
+        batch = events_result.scalars().all()
+
+        # Skip events that fail validation
+        recent_events.extend(e for e in batch if is_event_valid_for_display(e))
+
+        if len(batch) < EVENTS_BATCH_SIZE:
+            break
+        last_event = batch[-1]
+
+    recent_events = recent_events[:RECENT_EVENTS_LIMIT]
+
+    return [
+        EventResponse(
+            id=str(event.id),
+            tenant_id=str(event.tenant_id),
+            tenant_name=event.tenant.name,
+            event_type=event.event_type,
+            event_date=event.event_date.isoformat(),
+            headline=event.headline,
+            summary=event.memo_what_disclosed or event.headline,
+            evidence_count=event.evidence_count,
+            properties=[PropertyBadge(**b) for b in graph.badges(event.tenant_id)],
+        )
+        for event in recent_events
+    ]
+
+
+async def _get_coverage(db: AsyncSession, as_of_date: date) -> CoverageResponse:
+    """Tenants monitored and tenants with disclosures in the brief window."""
+    coverage_query = select(
+        select(func.count(Tenant.id)).scalar_subquery(),
+        select(func.count(func.distinct(Event.tenant_id)))
+        .where(Event.event_date >= window_start(as_of_date))
+        .scalar_subquery(),
+    )
+    coverage_result = await db.execute(coverage_query)
+    tenants_monitored, tenants_with_disclosures = coverage_result.one()
+
+    return CoverageResponse(
+        tenants_monitored=tenants_monitored or 0,
+        tenants_with_disclosures=tenants_with_disclosures or 0,
+        sources=["SEC EDGAR", "Reuters", "Court Records"],
+        as_of_date=as_of_date.isoformat(),
+    )
+
+
+def _attention_query(scores: Subquery) -> Select:
+    """Properties joined to per-property scores, most issues first, with the total."""
+    return (
+        select(
+            Property,
+            scores.c.status,
+            scores.c.issues_count,
+            func.count().over().label("total"),
+        )
+        .join(scores, scores.c.property_id == Property.id)
+        .order_by(scores.c.issues_count.desc(), Property.name)
+        .limit(PROPERTIES_ATTENTION_LIMIT)
+    )
+
+
+async def _get_properties_attention(
+    db: AsyncSession, as_of_date: date
+) -> tuple[list[PropertyAttentionItem], int]:
+    """
+    Properties with the most issues, and how many properties there are.
+
+    Read from the precomputed rollup, which has a row for every property on
+    each rolled-up date. A date the rollup has not reached yet (no rows) is
+    aggregated live instead, without writing, so the section is never empty
+    just because the job has not run.
+    """
+    rollup = (
+        select(
+            PropertyScoreSnapshot.property_id,
+            PropertyScoreSnapshot.status,
+            PropertyScoreSnapshot.issues_count,
+        )
+        .where(PropertyScoreSnapshot.as_of_date == as_of_date)
+        .subquery("property_scores")
+    )
+    properties_result = await db.execute(_attention_query(rollup))
+    rows = properties_result.all()
+
+    if not rows:
+        live = property_scores_query(as_of_date).subquery("property_scores")
+        properties_result = await db.execute(_attention_query(live))
+        rows = properties_result.all()
+
+    items = [
+        PropertyAttentionItem(
+            id=str(row.Property.id),
+            name=row.Property.name,
+            city=row.Property.city,
+            state=row.Property.state,
+            image_url=row.Property.image_url,
+            status=row.status,
+            issues_count=row.issues_count,
+        )
+        for row in rows
+    ]
+    return items, rows[0].total if rows else 0
+
+
+async def _run_sections(
+    db: AsyncSession, **sections: Callable[[AsyncSession], Awaitable[Any]]
+) -> dict[str, Any]:
+    """
+    Run independent brief sections and return their results by name.
+
+    In concurrent mode each section gets its own session (and so its own
+    pooled connection from the engine). Sections of all in-flight briefs
+    share one process-wide semaphore, so a burst of /brief requests cannot
+    drain the pool. Otherwise sections run one after another on db.
+    """
+    if not get_settings().brief_concurrent_sections:
+        return {name: await section(db) for name, section in sections.items()}
+
+    async def run_section(section: Callable[[AsyncSession], Awaitable[Any]]):
+        async with _section_semaphore:
+            async with AsyncSessionLocal() as session:
+                return await section(session)
+
+    results = await asyncio.gather(*(run_section(s) for s in sections.values()))
+    return dict(zip(sections, results))
+
+
+async def build_brief(
+    db: AsyncSession, brief: PortfolioBriefSnapshot, user: DemoUser
+) -> BriefResponse:
+    """
+    Build the brief for a snapshot as seen by the given user.
+
+    Exec users get the executive layer; AM users only see events for
+    tenants at their assigned properties. Sections are independent and run
+    through _run_sections.
+    """
+    as_of_date = brief.as_of_date
+    calendar = await snapshot_calendar.ensure_loaded(db)
+    sections = await _run_sections(
+        db,
+        status_changes=partial(
+            _get_status_changes,
+            as_of_date=as_of_date,
+            previous_date=calendar.previous(as_of_date),
+        ),
+        recent_events=partial(_get_recent_events, as_of_date=as_of_date, user=user),
+        coverage=partial(_get_coverage, as_of_date=as_of_date),
+        properties_attention=partial(_get_properties_attention, as_of_date=as_of_date),
+    )
+
+    properties_attention, properties_total = sections["properties_attention"]
+
+    # Build base response
+    response = BriefResponse(
+        id=str(brief.id),
+        as_of_date=brief.as_of_date.isoformat(),
+        headline=brief.headline,
+        updated_at=brief.created_at.isoformat(),
+        status_counts={
+            "critical": brief.critical_count,
+            "watch": brief.watch_count,
+            "stable": brief.stable_count,
+            "improving": brief.improving_count,
+        },
+        status_changes=sections["status_changes"],
+        recent_events=sections["recent_events"],
+        coverage=sections["coverage"],
+        properties_attention=properties_attention,
+        properties_total=properties_total,
+    )
+
+    # Add executive layer fields for exec role only
+    if user.is_exec:
+        if brief.portfolio_verdict:
+            response.portfolio_verdict = PortfolioVerdict(**brief.portfolio_verdict)
+        if brief.narrative_bullets:
+            response.narrative_bullets = [
+                NarrativeBullet(**b) for b in brief.narrative_bullets
+            ]
+        if brief.concentration_insights:
+            response.concentration_insights = [
+                ConcentrationInsight(**c) for c in brief.concentration_insights
+            ]
+        if brief.exec_questions:
+            response.exec_questions = brief.exec_questions
+
+    return response
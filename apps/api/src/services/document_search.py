@@ -0,0 +1,207 @@
+"""
+Full-text search over events and evidence.
+
+Event headlines and memos, and evidence excerpts and raw text, are indexed
+in Postgres-maintained search_vector columns (GIN). A query is parsed with
+websearch_to_tsquery (quoted phrases, OR, -term), matched through the GIN
+indexes, ranked with ts_rank_cd and paged by keyset on (rank, kind, id).
+Snippets are cut by ts_headline for the rows of the requested page only and
+returned as plain text with highlight ranges rather than markup.
+"""
+
+import re
+from uuid import UUID
+
+from sqlalchemy import select, func, case, literal, and_, or_, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.models import Event, EvidenceSource, Tenant
+from src.pagination import encode_cursor
+from src.schemas.search import DocumentSearchHit, DocumentSearchResponse, HighlightSpan
+
+# Text search configuration used by the search_vector columns
+TS_CONFIG = "english"
+
+# ts_headline markers; control characters so they never collide with text
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", '
+    "MinWords=15, MaxWords=35, ShortWord=3"
+)
+_MARKERS = re.compile(f"({HIGHLIGHT_START}|{HIGHLIGHT_STOP})")
+
+# Characters of a field ts_headline reads; matches the raw_text prefix indexed
+# by evidence_sources.search_vector, so a snippet never parses a whole filing
+HEADLINE_MAX_CHARS = 200_000
+
+
+def _displayable_event():
+    """SQL form of is_event_valid_for_display for stored validation results."""
+    evidence = aliased(EvidenceSource, name="display_evidence")
+    has_evidence = select(evidence.id).where(evidence.event_id == Event.id)
+    return and_(
+        Event.memo_validated.is_(True),
+        has_evidence.exists(),
+        or_(
+            Event.event_type != "sec_filing",
+            has_evidence.where(evidence.source_type == "sec_filing").exists(),
+        ),
+    )
+
+
+def _parse_headline(headline: str) -> tuple[str, list[HighlightSpan]]:
+    """Strip ts_headline markers, returning the snippet and highlight ranges."""
+    snippet: list[str] = []
+    highlights: list[HighlightSpan] = []
+    length = 0
+    start = 0
+    for part in _MARKERS.split(headline):
+        if part == HIGHLIGHT_START:
+            start = length
+        elif part == HIGHLIGHT_STOP:
+            highlights.append(HighlightSpan(start=start, end=length))
+        else:
+            snippet.append(part)
+            length += len(part)
+    return "".join(snippet), highlights
+
+
+async def search_documents(
+    db: AsyncSession,
+    q: str,
+    limit: int,
+    after: tuple[float, str, UUID] | None = None,
+) -> DocumentSearchResponse:
+    """
+    One page of ranked matches for q, best first.
+
+    Events only match if they would be displayed (validated memo with the
+    required evidence); evidence matches are limited to those events too.
+    """
+    tsquery = func.websearch_to_tsquery(TS_CONFIG, q)
+
+    event_matches = select(
+        literal("event").label("kind"),
+        Event.id.label("id"),
+        Event.id.label("event_id"),
+        func.ts_rank_cd(Event.search_vector, tsquery).label("rank"),
+    ).where(Event.search_vector.bool_op("@@")(tsquery), _displayable_event())
+
+    evidence_matches = (
+        select(
+            literal("evidence").label("kind"),
+            EvidenceSource.id.label("id"),
+            EvidenceSource.event_id.label("event_id"),
+            func.ts_rank_cd(EvidenceSource.search_vector, tsquery).label("rank"),
+        )
+        .join(Event, Event.id == EvidenceSource.event_id)
+        .where(EvidenceSource.search_vector.bool_op("@@")(tsquery), _displayable_event())
+    )
+
+    matches = union_all(event_matches, evidence_matches).subquery("matches")
+    page_query = select(matches)
+    if after:
+        page_query = page_query.where(
+            tuple_(matches.c.rank, matches.c.kind, matches.c.id) < after
+        )
+    page = (
+        page_query
+        .order_by(matches.c.rank.desc(), matches.c.kind.desc(), matches.c.id.desc())
+        .limit(limit + 1)
+        .subquery("page")
+    )
+
+    # Pick the field to quote: the highest-weighted one that matches
+    is_event = page.c.kind == "event"
+    headline_matches = func.to_tsvector(TS_CONFIG, Event.headline).bool_op("@@")(tsquery)
+    excerpt_matches = func.to_tsvector(
+        TS_CONFIG, func.coalesce(EvidenceSource.excerpt, "")
+    ).bool_op("@@")(tsquery)
+    field = case(
+        (is_event & headline_matches, "headline"),
+        (is_event, "memo_what_disclosed"),
+        (excerpt_matches, "excerpt"),
+        else_="raw_text",
+    )
+    field_text = case(
+        (is_event & headline_matches, Event.headline),
+        (is_event, Event.memo_what_disclosed),
+        (excerpt_matches, EvidenceSource.excerpt),
+        else_=EvidenceSource.raw_text,
+    )
+    sources = (
+        select(
+            page,
+            Event.event_type,
+            Event.event_date,
+            Event.headline,
+            Event.tenant_id,
+            Tenant.name.label("tenant_name"),
+            EvidenceSource.title.label("evidence_title"),
+            field.label("field"),
+            func.left(func.coalesce(field_text, ""), HEADLINE_MAX_CHARS).label("field_text"),
+        )
+        .join(Event, Event.id == page.c.event_id)
+        .join(Tenant, Tenant.id == Event.tenant_id)
+        .outerjoin(
+            EvidenceSource, (EvidenceSource.id == page.c.id) & (page.c.kind == "evidence")
+        )
+        .subquery("sources")
+    )
+
+    # Materialized so ts_headline runs once per page row; the offset then
+    # locates the plain snippet in the field
+    snippets = (
+        select(
+            sources,
+            func.ts_headline(
+                TS_CONFIG, sources.c.field_text, tsquery, HEADLINE_OPTIONS
+            ).label("snippet"),
+        )
+        .cte("snippets")
+        .prefix_with("MATERIALIZED")
+    )
+    plain_snippet = func.replace(
+        func.replace(snippets.c.snippet, HIGHLIGHT_START, ""), HIGHLIGHT_STOP, ""
+    )
+    query = (
+        select(
+            *(c for c in snippets.c if c.name != "field_text"),
+            (func.strpos(snippets.c.field_text, plain_snippet) - 1).label("offset"),
+        )
+        .order_by(snippets.c.rank.desc(), snippets.c.kind.desc(), snippets.c.id.desc())
+    )
+    result = await db.execute(query)
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.rank, last.kind, last.id)
+
+    items = []
+    for row in rows:
+        text, highlights = _parse_headline(row.snippet)
+        items.append(
+            DocumentSearchHit(
+                kind=row.kind,
+                id=str(row.id),
+                event_id=str(row.event_id),
+                event_type=row.event_type,
+                event_date=row.event_date.isoformat(),
+                headline=row.headline,
+                tenant_id=str(row.tenant_id),
+                tenant_name=row.tenant_name,
+                evidence_title=row.evidence_title,
+                field=row.field,
+                rank=row.rank,
+                snippet=text,
+                offset=row.offset if row.offset >= 0 else None,
+                highlights=highlights,
+            )
+        )
+
+    return DocumentSearchResponse(items=items, next_cursor=next_cursor)
@@ -0,0 +1,274 @@
+"""
+In-memory lease graph.
+
+Tenant <-> property adjacency for the whole portfolio, held as compressed
+sparse rows (offset and neighbour arrays per direction) so property badges
+and lease counts are resolved without joining leases per event or per
+tenant.
+
+Leases are append-mostly: refresh() compares lease/property counts and max
+updated_at with the loaded state and only reads rows written since. New
+leases and properties are added and property renames applied in place;
+deleted or updated (reassigned) leases trigger a full reload. version is the
+database state the graph reflects, for response data versions.
+"""
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.caching import table_stats
+from src.database import get_db
+from src.models import Lease, Property
+
+
+@dataclass(frozen=True)
+class _GraphVersion:
+    lease_count: int
+    lease_updated_at: datetime | None
+    property_count: int
+    property_updated_at: datetime | None
+
+
+def _compressed_rows(
+    node_count: int, sources: array, targets: array, order: list[int]
+) -> tuple[array, array]:
+    """Offsets and neighbour arrays for edges sources[i] -> targets[i], taken in order."""
+    offsets = array("l", [0] * (node_count + 1))
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+
+    neighbours = array("l", [0] * len(sources))
+    cursor = array("l", offsets[:-1])
+    for edge in order:
+        source = sources[edge]
+        neighbours[cursor[source]] = targets[edge]
+        cursor[source] += 1
+    return offsets, neighbours
+
+
+class PortfolioGraph:
+    """Lease adjacency between tenants and properties, one edge per lease."""
+
+    def __init__(self):
+        self.loaded = False
+        self._version: _GraphVersion | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._tenant_ids: list[UUID] = []
+        self._tenant_index: dict[UUID, int] = {}
+        self._property_ids: list[UUID] = []
+        self._property_names: list[str] = []
+        self._property_index: dict[UUID, int] = {}
+
+        self._lease_ids: set[UUID] = set()
+        self._edge_tenants = array("l")
+        self._edge_properties = array("l")
+
+        self._tenant_offsets = array("l", [0])
+        self._tenant_properties = array("l")
+        self._property_offsets = array("l", [0])
+        self._property_tenants = array("l")
+
+    @property
+    def version(self) -> _GraphVersion | None:
+        """Lease/property stats as of the last refresh."""
+        return self._version
+
+    # -- lookups ------------------------------------------------------------
+
+    def properties_of(self, tenant_id: UUID) -> list[UUID]:
+        """Property ids leased by a tenant, ordered by property name."""
+        return [self._property_ids[p] for p in self._tenant_row(tenant_id)]
+
+    def tenants_of(self, property_id: UUID) -> list[UUID]:
+        """Tenant ids with a lease at a property."""
+        i = self._property_index.get(property_id)
+        if i is None:
+            return []
+        start, end = self._property_offsets[i], self._property_offsets[i + 1]
+        return [self._tenant_ids[t] for t in self._property_tenants[start:end]]
+
+    def property_count(self, tenant_id: UUID) -> int:
+        """Number of leases a tenant holds."""
+        i = self._tenant_index.get(tenant_id)
+        if i is None:
+            return 0
+        return self._tenant_offsets[i + 1] - self._tenant_offsets[i]
+
+    def tenant_count(self, property_id: UUID) -> int:
+        """Number of leases at a property."""
+        i = self._property_index.get(property_id)
+        if i is None:
+            return 0
+        return self._property_offsets[i + 1] - self._property_offsets[i]
+
+    def badges(self, tenant_id: UUID) -> list[dict]:
+        """Property badges ({"id", "name"}) for a tenant, ordered by name."""
+        return [
+            {"id": str(self._property_ids[p]), "name": self._property_names[p]}
+            for p in self._tenant_row(tenant_id)
+        ]
+
+    def _tenant_row(self, tenant_id: UUID) -> array:
+        i = self._tenant_index.get(tenant_id)
+        if i is None:
+            return array("l")
+        return self._tenant_properties[self._tenant_offsets[i]:self._tenant_offsets[i + 1]]
+
+    # -- loading ------------------------------------------------------------
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Bring the graph up to date, reading only changed rows when possible."""
+        version = await self._read_version(db)
+        if self.loaded and version == self._version:
+            return
+
+        previous = self._version
+        if (
+            self.loaded
+            and previous is not None
+            and version.lease_count >= previous.lease_count
+            and version.property_count >= previous.property_count
+            and await self._apply_changes(db, previous, version)
+        ):
+            self._version = version
+            return
+
+        await self._reload(db)
+        self._version = version
+
+    async def ensure_loaded(self, db: AsyncSession) -> "PortfolioGraph":
+        """Load on first use (CLI entry points that skip the app lifespan)."""
+        if not self.loaded:
+            await self.refresh(db)
+        return self
+
+    def add_lease(
+        self, lease_id: UUID, tenant_id: UUID, property_id: UUID, property_name: str
+    ) -> None:
+        """Record a lease written by this process."""
+        self._add_property(property_id, property_name)
+        if self._add_edge(lease_id, tenant_id, property_id):
+            self._rebuild()
+
+    async def _read_version(self, db: AsyncSession) -> _GraphVersion:
+        result = await db.execute(select(*table_stats(Lease), *table_stats(Property)))
+        return _GraphVersion(*result.one())
+
+    async def _reload(self, db: AsyncSession) -> None:
+        # Leases first: any property they reference already exists when
+        # properties are read
+        leases_result = await db.execute(
+            select(Lease.id, Lease.tenant_id, Lease.property_id)
+        )
+        properties_result = await db.execute(select(Property.id, Property.name))
+
+        self._reset()
+        for property_id, name in properties_result.all():
+            self._add_property(property_id, name)
+        for lease_id, tenant_id, property_id in leases_result.all():
+            self._add_edge(lease_id, tenant_id, property_id)
+        self._rebuild()
+        self.loaded = True
+
+    async def _apply_changes(
+        self, db: AsyncSession, previous: _GraphVersion, version: _GraphVersion
+    ) -> bool:
+        """
+        Read leases and properties written since the loaded state.
+
+        Returns False when a known lease was updated (it may point at another
+        tenant or property now) or the rows found don't account for the new
+        counts (e.g. a delete plus an insert), so the caller reloads
+        everything.
+        """
+        leases_query = select(Lease.id, Lease.tenant_id, Lease.property_id, Lease.updated_at)
+        if previous.lease_updated_at is not None:
+            # >= so rows sharing the old watermark are re-read; known ids are skipped
+            leases_query = leases_query.where(Lease.updated_at >= previous.lease_updated_at)
+        properties_query = select(Property.id, Property.name)
+        if previous.property_updated_at is not None:
+            properties_query = properties_query.where(
+                Property.updated_at >= previous.property_updated_at
+            )
+
+        leases_result = await db.execute(leases_query)
+        properties_result = await db.execute(properties_query)
+
+        properties = properties_result.all()
+        new_properties = [
+            (property_id, name)
+            for property_id, name in properties
+            if property_id not in self._property_index
+        ]
+        new_leases = []
+        for row in leases_result.all():
+            if row.id not in self._lease_ids:
+                new_leases.append(row)
+            elif row.updated_at != previous.lease_updated_at:
+                return False
+        known_properties = self._property_index.keys() | {p for p, _ in new_properties}
+        if (
+            len(self._property_ids) + len(new_properties) != version.property_count
+            or len(self._lease_ids) + len(new_leases) != version.lease_count
+            or any(row.property_id not in known_properties for row in new_leases)
+        ):
+            return False
+
+        # Known properties are renamed in place
+        for property_id, name in properties:
+            self._add_property(property_id, name)
+        for row in new_leases:
+            self._add_edge(row.id, row.tenant_id, row.property_id)
+        self._rebuild()
+        return True
+
+    def _add_property(self, property_id: UUID, name: str) -> None:
+        if property_id in self._property_index:
+            self._property_names[self._property_index[property_id]] = name
+            return
+        self._property_index[property_id] = len(self._property_ids)
+        self._property_ids.append(property_id)
+        self._property_names.append(name)
+
+    def _add_edge(self, lease_id: UUID, tenant_id: UUID, property_id: UUID) -> bool:
+        if lease_id in self._lease_ids:
+            return False
+        if tenant_id not in self._tenant_index:
+            self._tenant_index[tenant_id] = len(self._tenant_ids)
+            self._tenant_ids.append(tenant_id)
+        self._lease_ids.add(lease_id)
+        self._edge_tenants.append(self._tenant_index[tenant_id])
+        self._edge_properties.append(self._property_index[property_id])
+        return True
+
+    def _rebuild(self) -> None:
+        """Rebuild both adjacency directions from the edge list."""
+        names = self._property_names
+        edges = range(len(self._edge_tenants))
+        by_property_name = sorted(edges, key=lambda e: names[self._edge_properties[e]])
+        tenant_offsets, tenant_properties = _compressed_rows(
+            len(self._tenant_ids), self._edge_tenants, self._edge_properties, by_property_name
+        )
+        property_offsets, property_tenants = _compressed_rows(
+            len(self._property_ids), self._edge_properties, self._edge_tenants, list(edges)
+        )
+        self._tenant_offsets, self._tenant_properties = tenant_offsets, tenant_properties
+        self._property_offsets, self._property_tenants = property_offsets, property_tenants
+
+
+portfolio_graph = PortfolioGraph()
+
+
+async def get_portfolio_graph(db: AsyncSession = Depends(get_db)) -> PortfolioGraph:
+    """Route dependency: the process-wide lease graph, loaded if needed."""
+    return await portfolio_graph.ensure_loaded(db)
@@ -0,0 +1,90 @@
+"""
+Snapshot calendar.
+
+Keeps the sorted set of tenant_score_snapshots.as_of_date values in memory so
+"latest", "previous actual snapshot" and "nearest on or before D" are bisect
+lookups instead of queries. Snapshot dates are irregular (weekly runs can be
+skipped), so the previous period is always the previous date that exists,
+never as_of_date - 7 days.
+
+The API loads the calendar at startup and reloads it periodically (see
+main.lifespan); processes that write snapshots call refresh() afterwards.
+Routes that read the calendar fold its version into their data version, so
+their ETags move when it catches up with the database.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import get_db
+from src.models import TenantScoreSnapshot
+
+
+class SnapshotCalendar:
+    """Sorted, de-duplicated snapshot dates with O(log n) lookups."""
+
+    def __init__(self, dates: list[date] | None = None):
+        self._dates: list[date] = sorted(set(dates or []))
+        self.loaded = dates is not None
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    @property
+    def dates(self) -> tuple[date, ...]:
+        return tuple(self._dates)
+
+    @property
+    def version(self) -> tuple[int, date | None]:
+        """Date count and latest date, for response data versions."""
+        return len(self._dates), self.latest()
+
+    def latest(self) -> date | None:
+        """Most recent snapshot date."""
+        return self._dates[-1] if self._dates else None
+
+    def previous(self, as_of_date: date) -> date | None:
+        """Latest snapshot date strictly before as_of_date."""
+        i = bisect_left(self._dates, as_of_date)
+        return self._dates[i - 1] if i else None
+
+    def on_or_before(self, as_of_date: date) -> date | None:
+        """Latest snapshot date on or before as_of_date."""
+        i = bisect_right(self._dates, as_of_date)
+        return self._dates[i - 1] if i else None
+
+    def add(self, as_of_date: date) -> None:
+        """Record a snapshot date written by this process."""
+        i = bisect_left(self._dates, as_of_date)
+        if i == len(self._dates) or self._dates[i] != as_of_date:
+            insort(self._dates, as_of_date)
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Reload every snapshot date (one index-only query)."""
+        query = (
+            select(TenantScoreSnapshot.as_of_date)
+            .distinct()
+            .order_by(TenantScoreSnapshot.as_of_date)
+        )
+        result = await db.execute(query)
+        # Swap the list in one assignment so readers never see a partial load
+        self._dates = list(result.scalars().all())
+        self.loaded = True
+
+    async def ensure_loaded(self, db: AsyncSession) -> "SnapshotCalendar":
+        """Load on first use (CLI entry points that skip the app lifespan)."""
+        if not self.loaded:
+            await self.refresh(db)
+        return self
+
+
+snapshot_calendar = SnapshotCalendar()
+
+
+async def get_snapshot_calendar(db: AsyncSession = Depends(get_db)) -> SnapshotCalendar:
+    """Route dependency: the process-wide calendar, loaded if needed."""
+    return await snapshot_calendar.ensure_loaded(db)
@@ -0,0 +1,270 @@
+"""
+In-memory typeahead index for /search/suggest.
+
+Every word of tenant names, tickers, CIKs, property names and cities is kept
+in one sorted key list, so a keystroke is a bisect to the start of the
+query's prefix range plus a short scan; multi-word queries must prefix-match
+a word of the entry for every query word. Tenant status comes from the
+latest snapshot date, so suggestions carry the same status as /tenants.
+
+refresh() reads row counts and max updated_at for tenants, properties and
+snapshots in one query, appends tenants/properties created since the loaded
+state and reloads statuses when snapshots changed; anything else (deletes,
+renames) triggers a full rebuild.
+"""
+
+import heapq
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.caching import table_stats
+from src.models import Tenant, Property, TenantScoreSnapshot
+from src.services.snapshot_calendar import snapshot_calendar
+
+# Matching entries collected per query before ranking. The prefix range is
+# scanned in key order, so entries with the query word itself come first and
+# longer words follow alphabetically; matches past the cap aren't ranked.
+MAX_CANDIDATES = 500
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _words(*values: str | None) -> tuple[str, ...]:
+    """Normalized words of the given fields (casefolded, punctuation dropped)."""
+    words: list[str] = []
+    for value in values:
+        if value:
+            words.extend(_WORD.findall(value.casefold()))
+    return tuple(dict.fromkeys(words))
+
+
+@dataclass(frozen=True)
+class TenantEntry:
+    id: UUID
+    name: str
+    ticker: str | None
+    entity_type: str
+    words: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PropertyEntry:
+    id: UUID
+    name: str
+    city: str
+    state: str
+    words: tuple[str, ...]
+
+
+Entry = TenantEntry | PropertyEntry
+
+
+class TypeaheadIndex:
+    """Prefix index over tenant and property words."""
+
+    def __init__(self):
+        self.loaded = False
+        self._version: tuple | None = None
+        self._entries: list[Entry] = []
+        self._ids: set[UUID] = set()
+        # Sorted (word, entry position) pairs
+        self._keys: list[tuple[str, int]] = []
+        self._statuses: dict[UUID, str] = {}
+
+    def status(self, tenant_id: UUID) -> str:
+        """Tenant status at the latest snapshot date."""
+        return self._statuses.get(tenant_id, "stable")
+
+    def suggest(self, q: str, limit: int) -> tuple[list[TenantEntry], list[PropertyEntry]]:
+        """
+        Best tenant and property matches for a (partial) query.
+
+        Entries whose words exactly match the query rank first, then entries
+        whose name starts with the query, then other word-prefix matches;
+        ties break on name.
+        """
+        query_words = _words(q)
+        if not query_words:
+            return [], []
+
+        # Drive the scan with the longest word (narrowest prefix range) and
+        # check the other words as we go, so only entries matching every word
+        # count toward MAX_CANDIDATES
+        lead = max(query_words, key=len)
+        others = [qw for qw in query_words if qw != lead]
+        keys = self._keys
+        seen: set[int] = set()
+        matches: list[Entry] = []
+        for i in range(bisect_left(keys, (lead,)), len(keys)):
+            word, position = keys[i]
+            if not word.startswith(lead):
+                break
+            if position in seen:
+                continue
+            seen.add(position)
+            entry = self._entries[position]
+            if all(any(w.startswith(qw) for w in entry.words) for qw in others):
+                matches.append(entry)
+                if len(matches) == MAX_CANDIDATES:
+                    break
+
+        normalized = " ".join(query_words)
+        tenants: list[tuple[tuple, TenantEntry]] = []
+        properties: list[tuple[tuple, PropertyEntry]] = []
+        for entry in matches:
+            exact = all(qw in entry.words for qw in query_words)
+            name_prefix = " ".join(_words(entry.name)).startswith(normalized)
+            rank = (not exact, not name_prefix, entry.name.casefold())
+            target = tenants if isinstance(entry, TenantEntry) else properties
+            target.append((rank, entry))
+
+        return (
+            [entry for _, entry in heapq.nsmallest(limit, tenants, key=lambda r: r[0])],
+            [entry for _, entry in heapq.nsmallest(limit, properties, key=lambda r: r[0])],
+        )
+
+    # -- loading ------------------------------------------------------------
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Bring the index up to date, reading only new rows when possible."""
+        result = await db.execute(
+            select(
+                *table_stats(Tenant),
+                *table_stats(Property),
+                *table_stats(TenantScoreSnapshot),
+            )
+        )
+        version = tuple(result.one())
+        if self.loaded and version == self._version:
+            return
+
+        previous = self._version
+        if previous is None or not await self._append_new(db, previous, version):
+            await self._rebuild(db)
+        if previous is None or version[4:] != previous[4:]:
+            await self._load_statuses(db)
+
+        self._version = version
+        self.loaded = True
+
+    async def _rebuild(self, db: AsyncSession) -> None:
+        tenants = await db.execute(
+            select(Tenant.id, Tenant.name, Tenant.ticker, Tenant.cik, Tenant.entity_type)
+        )
+        properties = await db.execute(
+            select(Property.id, Property.name, Property.city, Property.state)
+        )
+        entries = [_tenant_entry(row) for row in tenants.all()]
+        entries.extend(_property_entry(row) for row in properties.all())
+
+        self._entries = entries
+        self._ids = {entry.id for entry in entries}
+        self._keys = sorted(_index_keys(entries, 0))
+
+    async def _append_new(self, db: AsyncSession, previous: tuple, version: tuple) -> bool:
+        """
+        Add tenants and properties created since the loaded state.
+
+        Returns False when a known row was updated (renamed) or the new rows
+        don't account for the new counts (rows were deleted), so the caller
+        rebuilds.
+        """
+        tenant_count, tenant_updated_at, property_count, property_updated_at = previous[:4]
+        if version[0] < tenant_count or version[2] < property_count:
+            return False
+        if version[:4] == previous[:4]:
+            return True
+
+        # >= so rows sharing the old watermark are re-read; known ids are skipped
+        tenants_query = select(
+            Tenant.id,
+            Tenant.name,
+            Tenant.ticker,
+            Tenant.cik,
+            Tenant.entity_type,
+            Tenant.updated_at,
+        )
+        if tenant_updated_at is not None:
+            tenants_query = tenants_query.where(Tenant.updated_at >= tenant_updated_at)
+        properties_query = select(
+            Property.id, Property.name, Property.city, Property.state, Property.updated_at
+        )
+        if property_updated_at is not None:
+            properties_query = properties_query.where(
+                Property.updated_at >= property_updated_at
+            )
+        tenants = (await db.execute(tenants_query)).all()
+        properties = (await db.execute(properties_query)).all()
+        if any(
+            row.id in self._ids and row.updated_at != watermark
+            for rows, watermark in ((tenants, tenant_updated_at), (properties, property_updated_at))
+            for row in rows
+        ):
+            return False
+
+        new_entries = [_tenant_entry(row) for row in tenants if row.id not in self._ids]
+        new_tenant_count = len(new_entries)
+        new_entries.extend(
+            _property_entry(row) for row in properties if row.id not in self._ids
+        )
+        known_tenants = sum(isinstance(e, TenantEntry) for e in self._entries)
+        known_properties = len(self._entries) - known_tenants
+        if (
+            known_tenants + new_tenant_count != version[0]
+            or known_properties + len(new_entries) - new_tenant_count != version[2]
+        ):
+            return False
+
+        new_keys = sorted(_index_keys(new_entries, len(self._entries)))
+        self._entries = self._entries + new_entries
+        self._ids = self._ids | {entry.id for entry in new_entries}
+        self._keys = list(heapq.merge(self._keys, new_keys))
+        return True
+
+    async def _load_statuses(self, db: AsyncSession) -> None:
+        calendar = await snapshot_calendar.ensure_loaded(db)
+        result = await db.execute(
+            select(TenantScoreSnapshot.tenant_id, TenantScoreSnapshot.status).where(
+                TenantScoreSnapshot.as_of_date == calendar.latest()
+            )
+        )
+        self._statuses = dict(result.all())
+
+
+def _tenant_entry(row) -> TenantEntry:
+    return TenantEntry(
+        id=row.id,
+        name=row.name,
+        ticker=row.ticker,
+        entity_type=row.entity_type,
+        words=_words(row.name, row.ticker, row.cik),
+    )
+
+
+def _property_entry(row) -> PropertyEntry:
+    return PropertyEntry(
+        id=row.id,
+        name=row.name,
+        city=row.city,
+        state=row.state,
+        words=_words(row.name, row.city),
+    )
+
+
+def _index_keys(entries: list[Entry], offset: int) -> list[tuple[str, int]]:
+    return [
+        (word, offset + i) for i, entry in enumerate(entries) for word in entry.words
+    ]
+
+
+typeahead_index = TypeaheadIndex()
+
+
+def get_typeahead_index() -> TypeaheadIndex:
+    """Route dependency: the process-wide index, as last refreshed (no DB access)."""
+    return typeahead_index
@@ -1,9 +1,17 @@
-from src.validators.citation_validator import validate_citations, CitationValidationResult
+from src.validators.citation_validator import (
+    validate_citations,
+    CitationValidationResult,
+    QuoteSpan,
+)
+from src.validators.markers import MarkerScanner, MarkerMatch
 from src.validators.memo_validator import validate_memo, MemoValidationResult
 
 __all__ = [
     "validate_citations",
     "CitationValidationResult",
+    "QuoteSpan",
+    "MarkerScanner",
+    "MarkerMatch",
     "validate_memo",
     "MemoValidationResult",
 ]
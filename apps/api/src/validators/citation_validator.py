@@ -3,17 +3,39 @@ Citation grounding validator.
 
 Rules:
 1. Every fact in memo key_details must have a citation
-2. If quote_text is provided, it must be a substring of stored evidence excerpt
+2. If quote_text is provided, it must be a substring of stored evidence text;
+   declared quote_spans must point at that text
 3. SEC-type events require SEC filing evidence (tier 1)
 4. Evidence must belong to the same event
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from src.validators.evidence_text import (
+    SEARCHABLE_FIELDS,
+    NormalizedField,
+    normalize_text,
+    normalized_evidence_fields,
+)
+
 if TYPE_CHECKING:
     from src.models import Event, EvidenceSource
 
+# Elisions in quote_text ("…covenant relief… increased pricing…")
+_ELLIPSIS = re.compile(r"…|\.\.\.")
+
+
+@dataclass(frozen=True)
+class QuoteSpan:
+    """A verified quote: original-text offsets into an evidence field."""
+    detail: int  # index into memo_key_details
+    evidence_id: str
+    field: str  # excerpt, raw_text, title
+    start: int
+    end: int
+
 
 @dataclass
 class CitationValidationResult:
@@ -21,6 +43,8 @@ class CitationValidationResult:
     valid: bool
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    # Where each verified quote sits in the stored evidence text
+    quote_spans: list[QuoteSpan] = field(default_factory=list)
 
 
 def validate_citations(event: "Event") -> CitationValidationResult:
@@ -35,6 +59,7 @@ def validate_citations(event: "Event") -> CitationValidationResult:
     """
     errors: list[str] = []
     warnings: list[str] = []
+    quote_spans: list[QuoteSpan] = []
 
     # Build evidence lookup
     evidence_map: dict[str, "EvidenceSource"] = {}
@@ -57,6 +82,11 @@ def validate_citations(event: "Event") -> CitationValidationResult:
             errors.append("SEC filing event requires tier-1 SEC filing evidence")
 
     # Rule 3: Validate key_details citations
+    # Declared quote_spans are checked in place (cost of the span only).
+    # Quotes without spans are grouped per evidence source and searched after
+    # the loop, so each document is normalized once however many cite it
+    detail_errors: dict[int, str] = {}
+    quotes_by_evidence: dict[str, list[tuple[int, str]]] = {}
     if event.memo_key_details:
         for i, detail in enumerate(event.memo_key_details):
             if not isinstance(detail, dict):
@@ -71,20 +101,52 @@ def validate_citations(event: "Event") -> CitationValidationResult:
             evidence_id = detail.get("evidence_id")
             if evidence_id:
                 if evidence_id not in evidence_map:
-                    errors.append(f"Key detail {i+1} references non-existent evidence_id: {evidence_id}")
+                    detail_errors[i] = f"Key detail {i+1} references non-existent evidence_id: {evidence_id}"
                     continue
 
                 # Rule 4: Validate quote_text if present
                 quote_text = detail.get("quote_text")
-                if quote_text:
-                    evidence = evidence_map[evidence_id]
-                    searchable_text = _get_searchable_text(evidence)
-
-                    if not _quote_exists_in_text(quote_text, searchable_text):
-                        errors.append(
+                if not quote_text:
+                    continue
+                if not quote_text.strip():
+                    # Nothing to locate: accepted when the evidence has any
+                    # text, as a substring check of an empty quote would be
+                    if not normalized_evidence_fields(evidence_map[evidence_id]):
+                        detail_errors[i] = (
                             f"Key detail {i+1} quote_text not found in evidence: "
                             f"'{quote_text[:50]}...'"
                         )
+                    continue
+                declared_spans = detail.get("quote_spans")
+                if not declared_spans:
+                    quotes_by_evidence.setdefault(evidence_id, []).append((i, quote_text))
+                    continue
+
+                spans = _check_spans(quote_text, declared_spans, evidence_map[evidence_id])
+                if spans is None:
+                    detail_errors[i] = (
+                        f"Key detail {i+1} quote_spans do not match quote_text in evidence: "
+                        f"'{quote_text[:50]}...'"
+                    )
+                else:
+                    quote_spans.extend(
+                        QuoteSpan(i, evidence_id, name, start, end) for name, start, end in spans
+                    )
+
+    for evidence_id, quotes in quotes_by_evidence.items():
+        fields = normalized_evidence_fields(evidence_map[evidence_id])
+        found = _find_quotes([quote for _, quote in quotes], fields)
+        for i, quote_text in quotes:
+            if quote_text not in found:
+                detail_errors[i] = (
+                    f"Key detail {i+1} quote_text not found in evidence: "
+                    f"'{quote_text[:50]}...'"
+                )
+            else:
+                quote_spans.append(QuoteSpan(i, evidence_id, *found[quote_text]))
+
+    errors.extend(detail_errors[i] for i in sorted(detail_errors))
+    quote_spans.sort(key=lambda span: (span.detail, span.start))
 
     # Rule 5: Check evidence tier constraints for severity
     # Tier 3-only evidence cannot generate critical status (warning only)
@@ -98,28 +160,77 @@ def validate_citations(event: "Event") -> CitationValidationResult:
         valid=len(errors) == 0,
         errors=errors,
         warnings=warnings,
+        quote_spans=quote_spans,
     )
 
 
-def _get_searchable_text(evidence: "EvidenceSource") -> str:
-    """Get all searchable text from an evidence source."""
-    parts = []
-    if evidence.excerpt:
-        parts.append(evidence.excerpt)
-    if evidence.raw_text:
-        parts.append(evidence.raw_text)
-    if evidence.title:
-        parts.append(evidence.title)
-    return " ".join(parts).lower()
-
-
-def _quote_exists_in_text(quote: str, text: str) -> bool:
-    """Check if a quote exists in the text (case-insensitive, whitespace-normalized)."""
-    if not quote or not text:
-        return False
+def _check_spans(
+    quote_text: str, spans: list, evidence: "EvidenceSource"
+) -> list[tuple[str, int, int]] | None:
+    """
+    Verify declared quote_spans against the stored field text.
 
-    # Normalize whitespace and case
-    normalized_quote = " ".join(quote.lower().split())
-    normalized_text = " ".join(text.lower().split())
+    The spans' text, joined in order, must equal quote_text (case- and
+    whitespace-insensitive, elisions ignored). Only the spanned characters
+    are read. Returns the spans as (field, start, end), or None on mismatch.
+    """
+    if not isinstance(spans, list):
+        return None
+
+    checked: list[tuple[str, int, int]] = []
+    parts: list[str] = []
+    for span in spans:
+        if not isinstance(span, dict):
+            return None
+        name, start, end = span.get("field"), span.get("start"), span.get("end")
+        if name not in SEARCHABLE_FIELDS or not isinstance(start, int) or not isinstance(end, int):
+            return None
+        text = getattr(evidence, name) or ""
+        if not 0 <= start < end <= len(text):
+            return None
+        parts.append(text[start:end])
+        checked.append((name, start, end))
+
+    if normalize_text(" ".join(parts)) != normalize_text(_ELLIPSIS.sub(" ", quote_text)):
+        return None
+    return checked
+
+
+def _find_quotes(
+    quotes: list[str], fields: dict[str, NormalizedField]
+) -> dict[str, tuple[str, int, int]]:
+    """
+    Locate quotes in normalized evidence fields (case-insensitive, whitespace-normalized).
 
-    return normalized_quote in normalized_text
+    Each distinct normalized quote is searched once, longest first; a quote
+    contained in one already found is located inside it without a search of
+    its own. Returns (field, start, end) in original-text offsets per quote
+    found.
+    """
+    normalized = {quote: normalize_text(quote) for quote in quotes if quote}
+    # Normalized quote -> (field, normalized offset), longest first
+    found: dict[str, tuple[str, int]] = {}
+    for candidate in sorted(set(normalized.values()), key=len, reverse=True):
+        if not candidate:
+            continue
+        location = None
+        for longer, (name, at) in found.items():
+            offset = longer.find(candidate)
+            if offset >= 0:
+                location = (name, at + offset)
+                break
+        else:
+            for name, normalized_field in fields.items():
+                offset = normalized_field.text.find(candidate)
+                if offset >= 0:
+                    location = (name, offset)
+                    break
+        if location:
+            found[candidate] = location
+
+    located: dict[str, tuple[str, int, int]] = {}
+    for quote, n in normalized.items():
+        if n in found:
+            name, at = found[n]
+            located[quote] = (name, *fields[name].to_original(at, at + len(n)))
+    return located
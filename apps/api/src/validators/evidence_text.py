@@ -0,0 +1,203 @@
+"""
+Normalized evidence text, cached by content hash.
+
+Quotes are checked against the lowercased, whitespace-collapsed form of an
+evidence source's excerpt, raw_text and title. For a long filing that
+normalization is the expensive part of citation validation, so each field is
+normalized once per distinct content and shared by every quote, memo and
+validation run that cites it. Keying on a hash of the content (not the row
+id) keeps the cache correct when evidence text is edited.
+
+Each normalized field carries an offset map back to the stored text, so a
+quote found by searching normalized text is reported at its position in the
+original field. The map only records where the normalized-to-original delta
+changes (a collapsed whitespace run, a character whose lowercase form has a
+different length), which keeps it far smaller than the text.
+
+Building the map is the slow part (a Python pass per word); the normalized
+text itself is one C-level lower/split/join. So the map is what gets
+persisted (evidence_text_maps, written by the memo validation job), and a
+stored map is rebuilt into a NormalizedField without re-deriving it. The
+normalized text is not stored: it would duplicate every raw_text.
+"""
+
+import hashlib
+import re
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models import EvidenceSource
+
+
+# Upper bound on cached normalized text, in characters (~a few dozen 10-Ks)
+MAX_CACHED_CHARS = 50_000_000
+
+# Evidence fields quotes may point into, in search order
+SEARCHABLE_FIELDS = ("excerpt", "raw_text", "title")
+
+_NON_SPACE = re.compile(r"\S+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace runs to single spaces."""
+    return " ".join(text.lower().split())
+
+
+def content_hash(text: str) -> str:
+    """Hash identifying a field's text (cache key)."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class NormalizedField:
+    """A field's normalized text plus the map from its offsets to the original's."""
+
+    __slots__ = ("text", "_normalized_starts", "_original_starts")
+
+    def __init__(self, original: str):
+        pieces: list[str] = []
+        normalized_starts = array("q")
+        original_starts = array("q")
+        length = 0
+        delta = None
+
+        def mark(normalized_at: int, original_at: int) -> None:
+            nonlocal delta
+            if original_at - normalized_at != delta:
+                delta = original_at - normalized_at
+                normalized_starts.append(normalized_at)
+                original_starts.append(original_at)
+
+        for token in _NON_SPACE.finditer(original):
+            if pieces:
+                pieces.append(" ")
+                length += 1
+            word = token.group()
+            lowered = word.lower()
+            if len(lowered) == len(word):
+                mark(length, token.start())
+                pieces.append(lowered)
+                length += len(lowered)
+            else:
+                # Lowercasing changed the length ("İ" -> "i̇"): map every
+                # output character to the character it came from. Per-character
+                # lowering only differs from lowered in content (final sigma),
+                # never in length, so it gives the expansion widths.
+                at = length
+                for i, char in enumerate(word):
+                    for _ in char.lower():
+                        mark(at, token.start() + i)
+                        at += 1
+                pieces.append(lowered)
+                length += len(lowered)
+
+        self.text = "".join(pieces)
+        self._normalized_starts = normalized_starts
+        self._original_starts = original_starts
+
+    @classmethod
+    def from_offset_map(
+        cls, original: str, normalized_starts: list[int], original_starts: list[int]
+    ) -> "NormalizedField":
+        """Rebuild from a stored offset_map() of the same original text."""
+        entry = cls.__new__(cls)
+        entry.text = normalize_text(original)
+        entry._normalized_starts = array("q", normalized_starts)
+        entry._original_starts = array("q", original_starts)
+        return entry
+
+    def offset_map(self) -> tuple[list[int], list[int]]:
+        """(normalized_starts, original_starts), for storage."""
+        return self._normalized_starts.tolist(), self._original_starts.tolist()
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def size(self) -> int:
+        """Approximate footprint in characters, for cache accounting."""
+        return len(self.text) + 2 * len(self._normalized_starts)
+
+    def _original(self, at: int) -> int:
+        k = bisect_right(self._normalized_starts, at) - 1
+        return self._original_starts[k] + at - self._normalized_starts[k]
+
+    def to_original(self, start: int, end: int) -> tuple[int, int]:
+        """Original-text range covering normalized text[start:end]."""
+        return self._original(start), self._original(end - 1) + 1
+
+
+class NormalizedTextCache:
+    """LRU of normalized fields keyed by content hash, bounded by size."""
+
+    def __init__(self, max_chars: int = MAX_CACHED_CHARS):
+        self.max_chars = max_chars
+        self._entries: OrderedDict[str, NormalizedField] = OrderedDict()
+        self._chars = 0
+
+    def get(self, text: str) -> NormalizedField:
+        key = content_hash(text)
+        entry = self.peek(key)
+        if entry is None:
+            entry = NormalizedField(text)
+            self.put(key, entry)
+        return entry
+
+    def peek(self, key: str) -> NormalizedField | None:
+        """Cached field for a content hash, without building it."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: NormalizedField) -> None:
+        if key in self._entries:
+            return
+        self._entries[key] = entry
+        self._chars += entry.size
+        while self._chars > self.max_chars and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._chars -= evicted.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._chars = 0
+
+
+_cache = NormalizedTextCache()
+
+
+def load_offset_map(
+    text: str, stored_hash: str, normalized_starts: list[int], original_starts: list[int]
+) -> bool:
+    """
+    Seed the cache from a stored offset map of text.
+
+    Returns False (and caches nothing) if the map was stored for different
+    content, i.e. the field was edited since.
+    """
+    key = content_hash(text)
+    if key != stored_hash:
+        return False
+    if _cache.peek(key) is None:
+        _cache.put(key, NormalizedField.from_offset_map(text, normalized_starts, original_starts))
+    return True
+
+
+def cached_field(text: str) -> tuple[str, NormalizedField] | None:
+    """(content hash, field) if text was normalized in this process, else None."""
+    key = content_hash(text)
+    entry = _cache.peek(key)
+    return (key, entry) if entry is not None else None
+
+
+def normalized_evidence_fields(evidence: "EvidenceSource") -> dict[str, NormalizedField]:
+    """Normalized searchable fields of an evidence source (cached), in search order."""
+    fields: dict[str, NormalizedField] = {}
+    for name in SEARCHABLE_FIELDS:
+        text = getattr(evidence, name)
+        if text:
+            fields[name] = _cache.get(text)
+    return fields
@@ -0,0 +1,116 @@
+"""
+Word-bounded phrase scanner for memo validation.
+
+Marker phrases are compiled into an Aho–Corasick automaton over words, so a
+text is tokenized once and scanned in a single pass whose cost does not grow
+with the number of phrases. Matching is case-insensitive and whole-word
+("perhaps" does not match inside "perhapsing"); a phrase's words must be
+separated by whitespace only, so punctuation ends a phrase. Each match
+reports its character offsets in the original text.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+# Words, keeping inner apostrophes ("we're", "company's")
+_TOKEN = re.compile(r"\w+(?:['’]\w+)*")
+
+
+@dataclass(frozen=True)
+class MarkerMatch:
+    """A marker phrase found in a text, as text[start:end]."""
+    marker: str
+    start: int
+    end: int
+
+
+def _words(phrase: str) -> tuple[str, ...]:
+    return tuple(m.group().casefold() for m in _TOKEN.finditer(phrase))
+
+
+class MarkerScanner:
+    """Aho–Corasick automaton over words for a fixed set of marker phrases."""
+
+    def __init__(self, markers: Iterable[str]):
+        self.markers: list[str] = []
+        self._index: dict[str, int] = {}
+        # Per state: word transitions, failure link, and (marker index, word
+        # count) outputs including those inherited through failure links
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, int]]] = [[]]
+
+        for marker in dict.fromkeys(markers):
+            words = _words(marker)
+            if not words:
+                continue
+            state = 0
+            for word in words:
+                next_state = self._goto[state].get(word)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][word] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append((len(self.markers), len(words)))
+            self._index[marker] = len(self.markers)
+            self.markers.append(marker)
+
+        # Breadth-first failure links
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0)
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def __len__(self) -> int:
+        return len(self.markers)
+
+    def scan(self, text: str) -> list[MarkerMatch]:
+        """All marker occurrences in text, in order of position."""
+        matches: list[MarkerMatch] = []
+        if not text or not self.markers:
+            return matches
+
+        goto, fail, out = self._goto, self._fail, self._out
+        starts: list[int] = []
+        state = 0
+        previous_end = 0
+        for token in _TOKEN.finditer(text):
+            # Anything but whitespace between words breaks a phrase
+            if state and not text[previous_end:token.start()].isspace():
+                state = 0
+            previous_end = token.end()
+            starts.append(token.start())
+
+            word = token.group().casefold()
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+
+            for marker_index, length in out[state]:
+                matches.append(
+                    MarkerMatch(
+                        marker=self.markers[marker_index],
+                        start=starts[-length],
+                        end=token.end(),
+                    )
+                )
+
+        matches.sort(key=lambda m: (m.start, m.end))
+        return matches
+
+    def found_markers(self, text: str) -> list[str]:
+        """Distinct markers found in text, in vocabulary order."""
+        return self.distinct(self.scan(text))
+
+    def distinct(self, matches: list[MarkerMatch]) -> list[str]:
+        """Distinct markers of a scan, in vocabulary order."""
+        return sorted({m.marker for m in matches}, key=self._index.__getitem__)
@@ -8,10 +8,19 @@ Rules:
 4. Combined with citation validation for full grounding check
 """
 
-from dataclasses import dataclass, field
+import copy
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from src.validators.citation_validator import validate_citations
+from src.config import get_settings
+from src.validators.citation_validator import QuoteSpan, validate_citations
+from src.validators.evidence_text import SEARCHABLE_FIELDS, content_hash
+from src.validators.markers import MarkerMatch, MarkerScanner
+from src.validators.result_cache import ValidationResultCache
 
 if TYPE_CHECKING:
     from src.models import Event
@@ -37,6 +46,34 @@ HALLUCINATION_MARKERS = [
 
 MAX_MEMO_LENGTH = 2000  # characters
 
+# Bump when validation rules change so stored verdicts are recomputed
+VALIDATION_RULES_VERSION = "3"
+
+
+@lru_cache
+def get_marker_scanner() -> MarkerScanner:
+    """
+    Scanner for HALLUCINATION_MARKERS plus the optional extra vocabulary file.
+
+    settings.hallucination_markers_path is one phrase per line; blank lines
+    and lines starting with # are ignored.
+    """
+    markers = list(HALLUCINATION_MARKERS)
+    path = get_settings().hallucination_markers_path
+    if path:
+        for line in Path(path).read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                markers.append(line)
+    return MarkerScanner(markers)
+
+
+@lru_cache
+def validation_rules_fingerprint() -> str:
+    """Identifies the rule set: rules version, marker vocabulary and limits."""
+    parts = [VALIDATION_RULES_VERSION, str(MAX_MEMO_LENGTH), *get_marker_scanner().markers]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
 
 @dataclass
 class MemoValidationResult:
@@ -44,18 +81,77 @@ class MemoValidationResult:
     valid: bool
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    # Hallucination markers in memo_what_disclosed, with character offsets
+    marker_matches: list[MarkerMatch] = field(default_factory=list)
+    # Verified quote locations from citation validation
+    quote_spans: list[QuoteSpan] = field(default_factory=list)
+
+    def to_json(self) -> dict:
+        return asdict(self)
 
 
-def validate_memo(event: "Event") -> MemoValidationResult:
+def memo_validation_key(event: "Event") -> str:
+    """
+    Hash of everything validate_memo reads: memo fields, event type, each
+    evidence source's id, type, tier and content hashes, and the rule set.
+    """
+    digest = hashlib.sha256()
+
+    def feed(value) -> None:
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode())
+        digest.update(b"\0")
+
+    feed(validation_rules_fingerprint())
+    feed([
+        event.event_type,
+        event.memo_what_disclosed,
+        event.memo_key_details,
+        event.memo_context,
+    ])
+    for ev in sorted(event.evidence_sources or [], key=lambda ev: str(ev.id)):
+        feed([
+            str(ev.id),
+            ev.source_type,
+            ev.tier,
+            *(content_hash(getattr(ev, name) or "") for name in SEARCHABLE_FIELDS),
+        ])
+    return digest.hexdigest()
+
+
+# Results of validate_memo with the default rules, by memo_validation_key
+_results = ValidationResultCache()
+
+
+def validate_memo(
+    event: "Event", scanner: MarkerScanner | None = None
+) -> MemoValidationResult:
     """
     Validate that an event memo is properly grounded.
 
+    With the default rules, results are cached by memo_validation_key, so
+    revalidating an unchanged event is a lookup. Each call returns its own
+    copy, so callers may modify it without touching the cached entry.
+
     Args:
         event: Event with memo fields and evidence_sources loaded
+        scanner: Marker vocabulary to use (defaults to get_marker_scanner(); a
+            custom scanner bypasses the cache)
 
     Returns:
         MemoValidationResult with valid flag and any errors/warnings
     """
+    if scanner is not None:
+        return _validate_memo(event, scanner)
+
+    key = memo_validation_key(event)
+    result = _results.get(key)
+    if result is None:
+        result = _validate_memo(event, get_marker_scanner())
+        _results.put(key, result)
+    return copy.deepcopy(result)
+
+
+def _validate_memo(event: "Event", scanner: MarkerScanner) -> MemoValidationResult:
     errors: list[str] = []
     warnings: list[str] = []
 
@@ -63,12 +159,10 @@ def validate_memo(event: "Event") -> MemoValidationResult:
     if not event.memo_what_disclosed:
         return MemoValidationResult(valid=True, errors=errors, warnings=warnings)
 
-    memo_text = event.memo_what_disclosed.lower()
-
-    # Rule 1: Check for hallucination markers
-    for marker in HALLUCINATION_MARKERS:
-        if marker in memo_text:
-            errors.append(f"Contains hallucination marker: '{marker}'")
+    # Rule 1: Check for hallucination markers (whole words, one pass)
+    marker_matches = scanner.scan(event.memo_what_disclosed)
+    for marker in scanner.distinct(marker_matches):
+        errors.append(f"Contains hallucination marker: '{marker}'")
 
     # Rule 2: Check length
     if len(event.memo_what_disclosed) > MAX_MEMO_LENGTH:
@@ -84,16 +178,18 @@ def validate_memo(event: "Event") -> MemoValidationResult:
         for i, context_item in enumerate(event.memo_context):
             if not isinstance(context_item, str):
                 continue
-            context_lower = context_item.lower()
-            for marker in HALLUCINATION_MARKERS:
-                if marker in context_lower:
-                    warnings.append(f"Context item {i+1} contains uncertain language: '{marker}'")
-                    break
+            context_markers = scanner.found_markers(context_item)
+            if context_markers:
+                warnings.append(
+                    f"Context item {i+1} contains uncertain language: '{context_markers[0]}'"
+                )
 
     return MemoValidationResult(
         valid=len(errors) == 0,
         errors=errors,
         warnings=warnings,
+        marker_matches=marker_matches,
+        quote_spans=citation_result.quote_spans,
     )
 
 
@@ -115,10 +211,6 @@ def is_event_valid_for_display(event: "Event") -> bool:
         if not has_sec_evidence:
             return False
 
-    # If already validated, use stored result
-    if event.memo_validated is not None:
-        return event.memo_validated
-
-    # Run validation
-    result = validate_memo(event)
-    return result.valid
+    # Stored verdict from the batch job (src.precompute.memo_validation);
+    # validation never runs on the request path
+    return bool(event.memo_validated)
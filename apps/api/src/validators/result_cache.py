@@ -0,0 +1,50 @@
+"""
+In-memory cache of memo validation results.
+
+validate_memo is a deterministic function of the memo fields, the attached
+evidence and the rule set, so results are cached under a hash of exactly
+those inputs (memo_validator.memo_validation_key). Revalidating an unchanged
+event is a lookup. Editing the memo or evidence text, or changing the rules
+(validation_rules_fingerprint), changes the key, so stale entries are never
+read and simply age out of the LRU.
+
+The persisted counterpart is the memo_validation_results table, used by the
+batch job (src.precompute.memo_validation) and keyed by the equivalent hash
+computed in SQL.
+"""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.validators.memo_validator import MemoValidationResult
+
+
+# Results kept in memory; each is small (errors, warnings, offsets)
+MAX_CACHED_RESULTS = 10_000
+
+
+class ValidationResultCache:
+    """LRU of validation results keyed by input hash."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_RESULTS):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, "MemoValidationResult"] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> "MemoValidationResult | None":
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: "MemoValidationResult") -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
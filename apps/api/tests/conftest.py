@@ -0,0 +1,75 @@
+"""
+Shared test fixtures.
+
+The suite runs without Postgres: routes get a FakeSession through
+dependency overrides, and SQL is checked by compiling it against the
+postgresql dialect.
+"""
+
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+
+class FakeResult:
+    def __init__(self, row: tuple):
+        self._row = row
+
+    def one(self) -> tuple:
+        return self._row
+
+
+class FakeSession:
+    """Answers every execute() with the current row and records the statements."""
+
+    def __init__(self, row: tuple = ()):
+        self.row = row
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> FakeResult:
+        self.statements.append(statement)
+        return FakeResult(self.row)
+
+
+def compile_sql(statement: Any) -> str:
+    """Render a statement as Postgres SQL with literal parameters."""
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    return FakeSession()
+
+
+class ScriptedResult:
+    def __init__(self, rows: list):
+        self._rows = rows
+
+    def one(self):
+        return self._rows[0]
+
+    def all(self) -> list:
+        return list(self._rows)
+
+
+class ScriptedSession:
+    """Answers each execute() with the next queued list of rows."""
+
+    def __init__(self, *responses: list):
+        self.responses = list(responses)
+        self.statements: list[Any] = []
+        # executemany parameter lists, per statement (None for single execution)
+        self.params: list[Any] = []
+
+    def queue(self, *responses: list) -> None:
+        self.responses.extend(responses)
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> ScriptedResult:
+        self.statements.append(statement)
+        self.params.append(args[0] if args else None)
+        return ScriptedResult(self.responses.pop(0))
@@ -0,0 +1,33 @@
+from datetime import date
+from types import SimpleNamespace
+
+from src.demo_auth import DemoUser, DEMO_AM_ASSIGNED_PROPERTIES
+from src.services import brief
+from src.services.portfolio_graph import PortfolioGraph
+from tests.conftest import compile_sql
+
+
+class EmptyEventsSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+
+async def test_am_scope_is_a_lease_semi_join(monkeypatch):
+    async def loaded_graph(db):
+        return PortfolioGraph()
+
+    monkeypatch.setattr(brief.portfolio_graph, "ensure_loaded", loaded_graph)
+    db = EmptyEventsSession()
+
+    events = await brief._get_recent_events(
+        db, date(2026, 1, 5), DemoUser(role="am", assigned_property_ids=DEMO_AM_ASSIGNED_PROPERTIES)
+    )
+
+    assert events == []
+    sql = compile_sql(db.statements[0])
+    assert "events.tenant_id IN (SELECT leases.tenant_id" in sql
+    assert "leases.property_id IN (" in sql
@@ -0,0 +1,76 @@
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+from src.caching import DataVersion
+from src.demo_auth import DemoUser
+from src.precompute import brief_payloads
+from src.services.snapshot_calendar import SnapshotCalendar
+from tests.conftest import FakeSession, compile_sql
+
+
+class StoredPayloadSession:
+    """Returns one stored brief_payloads row and fails on any write."""
+
+    def __init__(self, data_version: str, payload: str):
+        self.stored = SimpleNamespace(data_version=data_version, payload=payload)
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        assert statement.is_select, f"GET path issued a write: {statement}"
+        self.statements.append(statement)
+        return SimpleNamespace(one_or_none=lambda: self.stored)
+
+    async def commit(self):
+        raise AssertionError("GET path committed")
+
+
+async def test_current_payload_is_served_as_stored():
+    db = StoredPayloadSession("v1", '{"stored": true}')
+    brief = SimpleNamespace(id=uuid.uuid4(), as_of_date=date(2026, 1, 5))
+
+    payload = await brief_payloads.get_brief_payload(
+        db, brief, DemoUser(role="exec"), DataVersion(tag="v1")
+    )
+    assert payload == '{"stored": true}'
+
+
+async def test_stale_payload_is_rendered_without_writing(monkeypatch):
+    rendered = SimpleNamespace(model_dump_json=lambda by_alias: '{"live": true}')
+
+    async def fake_build_brief(db, brief, user):
+        return rendered
+
+    monkeypatch.setattr(brief_payloads, "build_brief", fake_build_brief)
+    db = StoredPayloadSession("v1", '{"stored": true}')
+    brief = SimpleNamespace(id=uuid.uuid4(), as_of_date=date(2026, 1, 5))
+
+    payload = await brief_payloads.get_brief_payload(
+        db, brief, DemoUser(role="exec"), DataVersion(tag="v2")
+    )
+    assert payload == '{"live": true}'
+    assert len(db.statements) == 1
+
+
+async def test_data_version_covers_evidence_of_window_events(monkeypatch):
+    async def loaded_calendar(db):
+        return SnapshotCalendar([date(2025, 12, 29), date(2026, 1, 5)])
+
+    async def loaded_graph(db):
+        return SimpleNamespace(version=(0, None, 0, None))
+
+    monkeypatch.setattr(brief_payloads.snapshot_calendar, "ensure_loaded", loaded_calendar)
+    monkeypatch.setattr(brief_payloads.portfolio_graph, "ensure_loaded", loaded_graph)
+    db = FakeSession(row=())
+    brief = SimpleNamespace(
+        id=uuid.uuid4(), as_of_date=date(2026, 1, 5), created_at=None
+    )
+
+    await brief_payloads.get_brief_data_version(db, brief)
+
+    sql = compile_sql(db.statements[0])
+    assert "max(evidence_sources.updated_at)" in sql
+    assert (
+        "evidence_sources.event_id IN (SELECT events.id \nFROM events \n"
+        "WHERE events.event_date >= '2025-12-29')"
+    ) in sql
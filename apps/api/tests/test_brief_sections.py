@@ -0,0 +1,72 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import date
+from types import SimpleNamespace
+
+from src.services import brief
+from tests.conftest import ScriptedSession, compile_sql
+
+
+async def test_section_limit_is_shared_across_briefs(monkeypatch):
+    @asynccontextmanager
+    async def fake_session():
+        yield object()
+
+    monkeypatch.setattr(brief, "AsyncSessionLocal", fake_session)
+    monkeypatch.setattr(brief, "_section_semaphore", asyncio.Semaphore(2))
+
+    running = peak = 0
+
+    async def section(session):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "done"
+
+    sections = {name: section for name in ("a", "b", "c")}
+    first, second = await asyncio.gather(
+        brief._run_sections(None, **sections), brief._run_sections(None, **sections)
+    )
+
+    assert first == second == {"a": "done", "b": "done", "c": "done"}
+    assert peak == 2
+
+
+def test_section_slots_leave_a_pooled_connection(monkeypatch):
+    monkeypatch.setattr(brief.engine.pool, "size", lambda: 3)
+    assert brief._section_slots() == 2
+
+
+def attention_row(name: str, issues: int, total: int):
+    prop = SimpleNamespace(
+        id=uuid.uuid4(), name=name, city="Austin", state="TX", image_url=None
+    )
+    return SimpleNamespace(Property=prop, status="watch", issues_count=issues, total=total)
+
+
+async def test_properties_attention_reads_the_rollup_with_its_total():
+    db = ScriptedSession([attention_row("Gateway Plaza", 3, 120)])
+
+    items, total = await brief._get_properties_attention(db, date(2026, 1, 5))
+
+    assert [item.name for item in items] == ["Gateway Plaza"]
+    assert total == 120
+    sql = compile_sql(db.statements[0])
+    assert "FROM property_score_snapshots" in sql
+    assert "count(*) OVER ()" in sql
+    assert "LIMIT 50" in sql
+
+
+async def test_properties_attention_aggregates_dates_missing_from_the_rollup():
+    db = ScriptedSession([], [attention_row("Gateway Plaza", 2, 80)])
+
+    items, total = await brief._get_properties_attention(db, date(2026, 1, 5))
+
+    assert [item.issues_count for item in items] == [2]
+    assert total == 80
+    live_sql = compile_sql(db.statements[1])
+    assert "property_score_snapshots" not in live_sql
+    assert "FROM leases JOIN tenant_score_snapshots" in live_sql
@@ -0,0 +1,119 @@
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from src.caching import DataVersion, get_data_version, table_stats, table_version
+from src.database import get_db
+from src.models import BriefPayload, Tenant
+from src.responses import CamelRouter
+from src.routers.properties import property_version
+from src.routers.search import search_version
+from src.services.snapshot_calendar import SnapshotCalendar
+from tests.conftest import FakeSession, compile_sql
+
+
+PORTFOLIO_ID = uuid.uuid4()
+
+
+def make_client(session: FakeSession) -> TestClient:
+    router = CamelRouter()
+
+    async def version(db=Depends(get_db)) -> DataVersion:
+        return await get_data_version(
+            db, table_stats(Tenant, Tenant.portfolio_id == PORTFOLIO_ID)
+        )
+
+    @router.get("/tenants", etag=version)
+    async def list_tenants():
+        return {"items": []}
+
+    app = FastAPI()
+    app.include_router(router)
+
+    async def override_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_db
+    return TestClient(app)
+
+
+def test_scoped_table_stats_read_count_and_updated_at():
+    count, updated = table_stats(Tenant, Tenant.portfolio_id == PORTFOLIO_ID)
+    assert "count(*)" in compile_sql(count)
+    assert "max(tenants.updated_at)" in compile_sql(updated)
+
+
+def test_table_version_reads_the_change_counter():
+    [version] = table_version(Tenant)
+    sql = compile_sql(version)
+    assert "FROM table_versions" in sql
+    assert "table_versions.table_name = 'tenants'" in sql
+    assert "FROM tenants" not in sql
+
+
+def test_table_version_needs_a_versioned_table():
+    with pytest.raises(ValueError, match="brief_payloads"):
+        table_version(BriefPayload)
+
+
+def test_core_update_bumps_updated_at():
+    sql = str(update(Tenant).values(name="Renamed").compile(dialect=postgresql.dialect()))
+    assert "updated_at=" in sql
+
+
+def test_not_modified_until_row_updated():
+    created = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+    session = FakeSession((3, created))
+    client = make_client(session)
+
+    first = client.get("/tenants")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get("/tenants", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    # Same row count, later updated_at: a rename must invalidate the ETag
+    session.row = (3, datetime(2026, 1, 6, 9, 30, tzinfo=timezone.utc))
+    changed = client.get("/tenants", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_delete_invalidates_the_etag():
+    updated = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+    session = FakeSession((3, updated))
+    client = make_client(session)
+    etag = client.get("/tenants").headers["ETag"]
+
+    # A delete leaves max(updated_at) alone; the count still moves
+    session.row = (2, updated)
+    assert client.get("/tenants", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_if_modified_since_alone_is_never_a_304():
+    session = FakeSession((1, datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)))
+    client = make_client(session)
+
+    since = {"If-Modified-Since": "Tue, 06 Jan 2026 12:00:00 GMT"}
+    response = client.get("/tenants", headers=since)
+    assert response.status_code == 200
+    assert "Last-Modified" not in response.headers
+
+
+async def test_route_versions_scope_snapshots_to_the_latest_date(fake_session):
+    calendar = SnapshotCalendar([date(2025, 12, 29), date(2026, 1, 5)])
+
+    await search_version(fake_session, calendar)
+    await property_version(uuid.uuid4(), fake_session, calendar)
+
+    for statement in fake_session.statements:
+        sql = compile_sql(statement)
+        assert "tenant_score_snapshots.as_of_date = '2026-01-05'" in sql
+        # Whole tables come from their change counters, not a scan
+        assert "FROM tenants" not in sql
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+from src.validators.citation_validator import QuoteSpan, validate_citations
+
+EXCERPT = "The Company obtained   covenant relief\nand increased pricing by 50 bps."
+
+
+def make_event(*details, excerpt=EXCERPT, raw_text=None):
+    evidence = SimpleNamespace(
+        id="ev-1",
+        source_type="sec_filing",
+        tier=1,
+        title="Form 8-K",
+        excerpt=excerpt,
+        raw_text=raw_text,
+    )
+    return SimpleNamespace(
+        event_type="sec_filing", memo_key_details=list(details), evidence_sources=[evidence]
+    )
+
+
+def detail(quote_text, **extra):
+    return {"fact": "f", "citation": "8-K", "evidence_id": "ev-1", "quote_text": quote_text, **extra}
+
+
+def test_found_quote_reports_original_offsets():
+    result = validate_citations(make_event(detail("COVENANT RELIEF and increased")))
+
+    assert result.valid
+    [span] = result.quote_spans
+    assert span == QuoteSpan(0, "ev-1", "excerpt", 23, 52)
+    assert EXCERPT[span.start:span.end] == "covenant relief\nand increased"
+
+
+def test_missing_quote_is_an_error():
+    result = validate_citations(make_event(detail("covenant waiver")))
+
+    assert not result.valid
+    assert result.errors == ["Key detail 1 quote_text not found in evidence: 'covenant waiver...'"]
+
+
+def test_declared_spans_are_checked_in_place():
+    spans = [
+        {"field": "excerpt", "start": 23, "end": 38},
+        {"field": "excerpt", "start": 43, "end": 60},
+    ]
+    result = validate_citations(
+        make_event(detail("covenant relief … increased pricing", quote_spans=spans))
+    )
+
+    assert result.valid
+    assert [(s.start, s.end) for s in result.quote_spans] == [(23, 38), (43, 60)]
+
+
+def test_declared_spans_must_match_quote():
+    spans = [{"field": "excerpt", "start": 0, "end": 11}]
+    result = validate_citations(make_event(detail("covenant relief", quote_spans=spans)))
+
+    assert not result.valid
+
+
+def test_whitespace_only_quote_is_accepted_with_evidence_text():
+    result = validate_citations(make_event(detail("   ")))
+
+    assert result.valid
+    assert result.quote_spans == []
+
+
+def test_whitespace_only_quote_needs_some_evidence_text():
+    event = make_event(detail(" \n "), excerpt=None)
+    event.evidence_sources[0].title = None
+
+    result = validate_citations(event)
+
+    assert not result.valid
@@ -0,0 +1,22 @@
+from sqlalchemy.dialects import postgresql
+
+from src.services.document_search import HEADLINE_MAX_CHARS, _parse_headline, search_documents
+from tests.conftest import ScriptedSession
+
+
+async def test_headline_text_is_capped():
+    db = ScriptedSession([])
+
+    response = await search_documents(db, "going concern", limit=20)
+
+    assert response.items == []
+    compiled = db.statements[0].compile(dialect=postgresql.dialect())
+    assert "left(coalesce(CASE" in str(compiled)
+    assert HEADLINE_MAX_CHARS in compiled.params.values()
+
+
+def test_parse_headline_returns_plain_snippet_and_ranges():
+    text, highlights = _parse_headline("substantial \x02doubt\x03 about \x02going\x03 concern")
+
+    assert text == "substantial doubt about going concern"
+    assert [(h.start, h.end) for h in highlights] == [(12, 17), (24, 29)]
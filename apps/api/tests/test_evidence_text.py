@@ -0,0 +1,66 @@
+import pytest
+
+from src.validators.evidence_text import NormalizedField, normalize_text
+
+
+def original_of(text: str, quote: str) -> str:
+    field = NormalizedField(text)
+    needle = normalize_text(quote)
+    at = field.text.find(needle)
+    assert at >= 0, f"{quote!r} not in {field.text!r}"
+    start, end = field.to_original(at, at + len(needle))
+    return text[start:end]
+
+
+def test_collapsed_whitespace_maps_back_to_original_run():
+    text = "Net   revenue\n\tdeclined 12%"
+    assert original_of(text, "revenue declined") == "revenue\n\tdeclined"
+
+
+def test_lowercase_expansion_at_end_of_quote():
+    # "İ".lower() is two characters; the quote ends on the second one
+    text = "Report by ALİ Capital LLC"
+    assert original_of(text, "ALİ") == "ALİ"
+    assert original_of(text, "ali̇ capital") == "ALİ Capital"
+
+
+def test_text_after_expansion_keeps_its_offsets():
+    text = "İSTANBUL İİ Plaza Tower"
+    assert original_of(text, "plaza") == "Plaza"
+    assert original_of(text, "i̇i̇ plaza") == "İİ Plaza"
+
+
+def test_final_sigma_word_with_expansion_matches_normalize_text():
+    text = "ΟΔΟΣ İ"
+    assert NormalizedField(text).text == normalize_text(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "  Net   revenue\n\tİncreased  ",
+        "aİb İİ x ΟΔΟΣ İ",
+        "ﬁnancial İ ǅ covenant",
+    ],
+)
+def test_every_range_maps_to_text_that_normalizes_to_it(text):
+    field = NormalizedField(text)
+    assert field.text == normalize_text(text)
+    for start in range(len(field.text)):
+        for end in range(start + 1, len(field.text) + 1):
+            piece = field.text[start:end]
+            if piece != piece.strip():
+                continue
+            a, b = field.to_original(start, end)
+            # casefold: a lone final sigma lowercases differently out of context
+            assert piece.casefold() in normalize_text(text[a:b]).casefold()
+
+
+@pytest.mark.parametrize("text", ["Net   revenue\n\tdeclined", "aİb İİ x ΟΔΟΣ İ"])
+def test_stored_offset_map_rebuilds_the_same_field(text):
+    field = NormalizedField(text)
+    rebuilt = NormalizedField.from_offset_map(text, *field.offset_map())
+
+    assert rebuilt.text == field.text
+    for at in range(1, len(field.text) + 1):
+        assert rebuilt.to_original(0, at) == field.to_original(0, at)
@@ -0,0 +1,96 @@
+import re
+
+import pytest
+
+from src.validators.markers import MarkerMatch, MarkerScanner
+from src.validators.memo_validator import HALLUCINATION_MARKERS
+
+
+def spans(matches):
+    return [(m.marker, m.start, m.end) for m in matches]
+
+
+def test_match_reached_through_a_failure_link():
+    # After "credit facility" the automaton is deep in the first phrase;
+    # "waiver" is only reachable by falling back to the "facility" state
+    scanner = MarkerScanner(["credit facility default", "facility waiver"])
+    text = "A credit facility waiver was signed"
+
+    assert spans(scanner.scan(text)) == [("facility waiver", 9, 24)]
+
+
+def test_overlapping_phrases_inherit_outputs_through_failure_links():
+    scanner = MarkerScanner(["substantial doubt about", "doubt about", "about"])
+    text = "There is substantial doubt about the plan"
+
+    assert spans(scanner.scan(text)) == [
+        ("substantial doubt about", 9, 32),
+        ("doubt about", 21, 32),
+        ("about", 27, 32),
+    ]
+
+
+def test_marker_inside_a_longer_word_is_rejected():
+    scanner = MarkerScanner(["perhaps", "appears to"])
+
+    assert scanner.scan("Perhapsing is not a word") == []
+    assert scanner.scan("The tenant disappears to Ohio") == []
+    assert spans(scanner.scan("It appears to be perhaps late")) == [
+        ("appears to", 3, 13),
+        ("perhaps", 17, 24),
+    ]
+
+
+def test_punctuation_breaks_a_phrase_but_whitespace_does_not():
+    scanner = MarkerScanner(["might be"])
+
+    assert scanner.scan("It might. Be late") == []
+    assert scanner.scan("It might, be late") == []
+    assert spans(scanner.scan("It might\n  be late")) == [("might be", 3, 13)]
+
+
+def test_offsets_index_the_original_text():
+    scanner = MarkerScanner(["we believe"])
+    text = "Revenue fell. WE  Believe it recovers."
+
+    [match] = scanner.scan(text)
+
+    assert match == MarkerMatch("we believe", 14, 25)
+    assert text[match.start:match.end] == "WE  Believe"
+
+
+def test_distinct_markers_are_in_vocabulary_order():
+    scanner = MarkerScanner(["probably", "could be"])
+
+    assert scanner.found_markers("It could be late, probably, and could be worse") == [
+        "probably",
+        "could be",
+    ]
+
+
+SAMPLE_MEMOS = [
+    "The Company disclosed a covenant breach and is negotiating a waiver.",
+    "Management believes liquidity is sufficient; it might be tested next quarter.",
+    "I think the tenant will probably close stores. Perhaps more, possibly fewer.",
+    "Sources say the lender may have agreed. In our opinion the risk appears to be rising.",
+    "Reportedly the filing is likely to slip, though it seems the auditor disagrees.",
+    "It could be that we believe otherwise: might, be, sources, say.",
+    "The tenant disappears to Ohio; the happenstance is improbably perhapsing.",
+]
+
+
+def regex_markers(text: str) -> list[str]:
+    """The per-marker whole-word regex the scanner replaces."""
+    found = []
+    for marker in HALLUCINATION_MARKERS:
+        pattern = r"\b" + r"\s+".join(map(re.escape, marker.split())) + r"\b"
+        if re.search(pattern, text, re.IGNORECASE):
+            found.append(marker)
+    return found
+
+
+@pytest.mark.parametrize("memo", SAMPLE_MEMOS)
+def test_agrees_with_per_marker_regex(memo):
+    scanner = MarkerScanner(HALLUCINATION_MARKERS)
+
+    assert scanner.found_markers(memo) == regex_markers(memo)
@@ -0,0 +1,115 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.precompute.memo_validation import _validate_payload, _verdict_values
+from src.validators import evidence_text
+
+
+def stored_event(**overrides):
+    values = dict(
+        id=uuid.uuid4(),
+        memo_validated=True,
+        validation_errors=None,
+        quote_spans=[{"detail": 0, "evidence_id": "e1", "field": "excerpt", "start": 4, "end": 9}],
+        updated_at=datetime(2026, 1, 5, tzinfo=timezone.utc),
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def result(**overrides):
+    values = dict(
+        valid=True,
+        errors=[],
+        warnings=[],
+        marker_matches=[],
+        quote_spans=[{"detail": 0, "evidence_id": "e1", "field": "excerpt", "start": 4, "end": 9}],
+    )
+    values.update(overrides)
+    return values
+
+
+def test_unchanged_verdict_keeps_updated_at():
+    event = stored_event()
+    values = _verdict_values(event, result())
+    assert values["updated_at"] == event.updated_at
+
+
+def test_changed_verdict_lets_onupdate_bump_updated_at():
+    event = stored_event()
+    values = _verdict_values(event, result(valid=False, errors=["Quote not found"]))
+    assert "updated_at" not in values
+    assert values["validation_errors"] == [{"error": "Quote not found"}]
+
+
+def payload(text_maps=None):
+    return {
+        "id": "event-1",
+        "event_type": "news",
+        "memo_what_disclosed": "The tenant missed rent.",
+        "memo_key_details": [
+            {"fact": "Rent missed", "citation": "Reuters", "evidence_id": "ev-1",
+             "quote_text": "failed to pay base rent"},
+        ],
+        "memo_context": [],
+        "evidence_sources": [
+            {
+                "id": "ev-1",
+                "source_type": "news",
+                "tier": 2,
+                "title": "Tenant news",
+                "excerpt": None,
+                "raw_text": "The complaint says the tenant\n\nfailed to  pay base rent.",
+                "text_maps": text_maps or {},
+            }
+        ],
+    }
+
+
+def test_worker_returns_offset_maps_it_built(monkeypatch):
+    monkeypatch.setattr(evidence_text, "_cache", evidence_text.NormalizedTextCache())
+
+    result, new_maps = _validate_payload(payload())
+
+    assert result["valid"]
+    rows = {row["field"]: row for row in new_maps}
+    assert set(rows) == {"raw_text", "title"}
+    assert rows["raw_text"]["evidence_id"] == "ev-1"
+    raw_text = payload()["evidence_sources"][0]["raw_text"]
+    assert rows["raw_text"]["content_hash"] == evidence_text.content_hash(raw_text)
+
+
+def test_worker_reuses_stored_offset_maps(monkeypatch):
+    monkeypatch.setattr(evidence_text, "_cache", evidence_text.NormalizedTextCache())
+    built, rows = _validate_payload(payload())
+    stored = {
+        row["field"]: {
+            "stored_hash": row["content_hash"],
+            "normalized_starts": row["normalized_starts"],
+            "original_starts": row["original_starts"],
+        }
+        for row in rows
+    }
+
+    monkeypatch.setattr(evidence_text, "_cache", evidence_text.NormalizedTextCache())
+    monkeypatch.setattr(
+        evidence_text.NormalizedField,
+        "__init__",
+        lambda self, text: pytest.fail("stored map was rebuilt"),
+    )
+    result, new_maps = _validate_payload(payload(stored))
+
+    assert new_maps == []
+    assert result["quote_spans"] == built["quote_spans"]
+
+
+def test_worker_rebuilds_maps_stored_for_older_text(monkeypatch):
+    monkeypatch.setattr(evidence_text, "_cache", evidence_text.NormalizedTextCache())
+    stale = {"raw_text": {"stored_hash": "0" * 64, "normalized_starts": [0], "original_starts": [0]}}
+
+    _, new_maps = _validate_payload(payload(stale))
+
+    assert sorted(row["field"] for row in new_maps) == ["raw_text", "title"]
@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+from src.validators.memo_validator import validate_memo
+
+
+def make_event(memo="The company probably breached a covenant."):
+    evidence = SimpleNamespace(
+        id="ev-1", source_type="news", tier=2, title="Reuters", excerpt="Covenant breach.", raw_text=None
+    )
+    return SimpleNamespace(
+        id="event-1",
+        event_type="news",
+        memo_what_disclosed=memo,
+        memo_key_details=[],
+        memo_context=[],
+        evidence_sources=[evidence],
+    )
+
+
+def test_cached_results_are_returned_as_copies():
+    first = validate_memo(make_event())
+    assert first.errors == ["Contains hallucination marker: 'probably'"]
+
+    first.errors.clear()
+    first.marker_matches.clear()
+
+    second = validate_memo(make_event())
+    assert second.errors == ["Contains hallucination marker: 'probably'"]
+    assert len(second.marker_matches) == 1
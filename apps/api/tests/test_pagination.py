@@ -0,0 +1,63 @@
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from src.pagination import decode_cursor, encode_cursor
+
+
+def test_round_trip_preserves_key_parts():
+    tenant_id = uuid.uuid4()
+    cursor = encode_cursor("watch", 'Müller, "Bros" & Co', tenant_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, str, str, uuid.UUID) == ("watch", 'Müller, "Bros" & Co', tenant_id)
+
+
+def test_float_rank_round_trips_exactly():
+    rank = 0.1 + 0.2
+    cursor = encode_cursor(rank, "evidence", uuid.UUID(int=1))
+
+    assert decode_cursor(cursor, float, str, uuid.UUID)[0] == rank
+
+
+def test_date_key():
+    cursor = encode_cursor(date(2026, 1, 5), uuid.UUID(int=7))
+
+    assert decode_cursor(cursor, date.fromisoformat, uuid.UUID) == (date(2026, 1, 5), uuid.UUID(int=7))
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        "e30",  # {} (not a list)
+        encode_cursor("only", "two"),  # wrong number of parts
+        encode_cursor("watch", "Name", "not-a-uuid"),
+    ],
+)
+def test_malformed_cursors_are_a_400(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor(cursor, str, str, uuid.UUID)
+
+    assert excinfo.value.status_code == 400
+
+
+def test_pages_cover_every_row_once_across_ties():
+    # (name, id) keys with repeated names, paged the way the list routes do:
+    # limit + 1 rows, cursor from the last row kept, row-value comparison
+    rows = sorted((f"Tenant {n // 3}", uuid.UUID(int=n)) for n in range(10))
+    limit = 4
+    seen = []
+    cursor = None
+    while True:
+        after = decode_cursor(cursor, str, uuid.UUID) if cursor else None
+        page = [row for row in rows if after is None or row > after][: limit + 1]
+        cursor = encode_cursor(*page[limit - 1]) if len(page) > limit else None
+        seen.extend(page[:limit])
+        if cursor is None:
+            break
+
+    assert seen == rows
@@ -0,0 +1,69 @@
+import uuid
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from src.services.portfolio_graph import PortfolioGraph
+from tests.conftest import ScriptedSession
+
+LeaseRow = namedtuple("LeaseRow", "id tenant_id property_id")
+ChangedLeaseRow = namedtuple("ChangedLeaseRow", "id tenant_id property_id updated_at")
+PropertyRow = namedtuple("PropertyRow", "id name")
+
+T0 = datetime(2026, 1, 5, tzinfo=timezone.utc)
+T1 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+
+TENANT = uuid.uuid4()
+PLAZA, TOWER = uuid.uuid4(), uuid.uuid4()
+LEASE = uuid.uuid4()
+
+
+async def loaded_graph() -> tuple[PortfolioGraph, ScriptedSession]:
+    db = ScriptedSession(
+        [(1, T0, 2, T0)],
+        [LeaseRow(LEASE, TENANT, PLAZA)],
+        [PropertyRow(PLAZA, "Park Plaza"), PropertyRow(TOWER, "Riverside Tower")],
+    )
+    graph = PortfolioGraph()
+    await graph.refresh(db)
+    return graph, db
+
+
+async def test_rename_is_applied_without_reload():
+    graph, db = await loaded_graph()
+    assert graph.badges(TENANT) == [{"id": str(PLAZA), "name": "Park Plaza"}]
+
+    db.queue([(1, T0, 2, T1)], [], [PropertyRow(PLAZA, "Park Plaza North")])
+    await graph.refresh(db)
+
+    assert graph.badges(TENANT) == [{"id": str(PLAZA), "name": "Park Plaza North"}]
+    assert graph.version.property_updated_at == T1
+    assert not db.responses
+
+
+async def test_reassigned_lease_triggers_reload():
+    graph, db = await loaded_graph()
+
+    db.queue(
+        [(1, T1, 2, T0)],
+        [ChangedLeaseRow(LEASE, TENANT, TOWER, T1)],
+        [],
+        # Full reload
+        [LeaseRow(LEASE, TENANT, TOWER)],
+        [PropertyRow(PLAZA, "Park Plaza"), PropertyRow(TOWER, "Riverside Tower")],
+    )
+    await graph.refresh(db)
+
+    assert graph.properties_of(TENANT) == [TOWER]
+    assert graph.tenants_of(PLAZA) == []
+    assert not db.responses
+
+
+async def test_unchanged_version_skips_reads():
+    graph, db = await loaded_graph()
+    before = graph.version
+
+    db.queue([(1, T0, 2, T0)])
+    await graph.refresh(db)
+
+    assert graph.version == before
+    assert len(db.statements) == 4
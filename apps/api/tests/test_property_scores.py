@@ -0,0 +1,31 @@
+from datetime import date
+from types import SimpleNamespace
+
+from src.precompute.property_scores import rollup_property_scores
+from tests.conftest import compile_sql
+
+
+class RollupSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return SimpleNamespace(rowcount=0)
+
+    async def commit(self):
+        pass
+
+
+async def test_rollup_only_touches_changed_rows():
+    db = RollupSession()
+
+    await rollup_property_scores(db, date(2026, 1, 5))
+
+    sql = compile_sql(db.statements[0])
+    assert "updated_at = now()" in sql
+    assert (
+        "WHERE (property_score_snapshots.status, property_score_snapshots.watch_score, "
+        "property_score_snapshots.issues_count) IS DISTINCT FROM "
+        "(excluded.status, excluded.watch_score, excluded.issues_count)"
+    ) in sql
@@ -0,0 +1,38 @@
+import pytest
+
+from src.seed.generate import generate
+
+
+def test_small_run_writes_every_fixture(tmp_path):
+    counts = generate(tmp_path, properties=3, tenants=4, events=5, weeks=2, raw_text_scale=0.01)
+
+    assert counts["tenants"] == 4
+    assert counts["events"] == 5
+    assert counts["score_snapshots"] == 8
+    assert (tmp_path / "events.ndjson.gz").exists()
+
+
+@pytest.mark.parametrize(
+    "sizes, message",
+    [
+        ({"tenants": 0, "events": 10}, "at least one tenant"),
+        ({"weeks": 0}, "at least 1"),
+        ({"portfolios": 0}, "at least 1"),
+        ({"properties": -1}, "cannot be negative"),
+        ({"raw_text_scale": 0}, "must be positive"),
+    ],
+)
+def test_bad_sizes_fail_before_writing(tmp_path, sizes, message):
+    out = tmp_path / "fixtures"
+
+    with pytest.raises(ValueError, match=message):
+        generate(out, **sizes)
+
+    assert not out.exists()
+
+
+def test_no_tenants_and_no_events_is_allowed(tmp_path):
+    counts = generate(tmp_path, properties=2, tenants=0, events=0, weeks=1)
+
+    assert "events" not in counts
+    assert counts["properties"] == 2
@@ -0,0 +1,94 @@
+import json
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from src.models import Portfolio, Tenant
+from src.seed import load
+from src.seed.upsert import row_hash, upsert_batch
+from tests.conftest import ScriptedSession
+
+
+class CommitSession:
+    async def commit(self):
+        pass
+
+
+def upsert_session(keep_ids: list) -> ScriptedSession:
+    """Answers the stored-hash lookup and both upserts; COPY appends to keep_ids."""
+
+    async def copy_records_to_table(name, records, columns):
+        keep_ids.extend(record[0] for record in records)
+
+    async def get_raw_connection():
+        return SimpleNamespace(
+            driver_connection=SimpleNamespace(copy_records_to_table=copy_records_to_table)
+        )
+
+    async def connection():
+        return SimpleNamespace(get_raw_connection=get_raw_connection)
+
+    session = ScriptedSession([], [], [])
+    session.connection = connection
+    return session
+
+
+def write_fixture(directory, name, rows):
+    (directory / f"{name}.json").write_text(json.dumps(rows))
+
+
+async def test_delete_missing_skips_tables_without_a_fixture(tmp_path, monkeypatch):
+    write_fixture(tmp_path, "portfolios", [{"id": "p1"}])
+    write_fixture(tmp_path, "leases", [{"id": "l1"}])
+
+    async def create_keep_table(session, model):
+        return model.__tablename__
+
+    async def upsert_batch(session, model, batch, values, keep):
+        return len(batch), 0
+
+    deletes = []
+
+    async def delete_missing(session, model, keep, seeded_tables):
+        deletes.append((model.__tablename__, seeded_tables))
+        return 0
+
+    monkeypatch.setattr(load, "create_keep_table", create_keep_table)
+    monkeypatch.setattr(load, "upsert_batch", upsert_batch)
+    monkeypatch.setattr(load, "delete_missing", delete_missing)
+
+    touched = await load.upsert_tables(CommitSession(), tmp_path, delete=True)
+
+    assert touched == 2
+    # Only tables with a fixture, children first; the rest are left alone
+    assert [table for table, _ in deletes] == ["leases", "portfolios"]
+    assert deletes[0][1] == {"portfolios", "leases"}
+
+
+async def test_repeated_ids_in_a_batch_keep_the_last_row():
+    keep_ids = []
+    session = upsert_session(keep_ids)
+    items = [{"id": "a", "name": "Old"}, {"id": "b", "name": "B"}, {"id": "a", "name": "New"}]
+
+    upserted, unchanged = await upsert_batch(
+        session, Portfolio, items, dict, keep=SimpleNamespace(name="seed_keep_portfolios")
+    )
+
+    assert (upserted, unchanged) == (2, 0)
+    assert keep_ids == ["a", "b"]
+    assert [row["name"] for row in session.params[1]] == ["New", "B"]
+    assert [row["content_hash"] for row in session.params[2]] == [
+        row_hash(items[2]),
+        row_hash(items[1]),
+    ]
+
+
+async def test_upsert_bumps_updated_at():
+    session = upsert_session([])
+
+    await upsert_batch(
+        session, Tenant, [{"id": "t", "name": "Acme"}], dict, keep=SimpleNamespace(name="k")
+    )
+
+    sql = str(session.statements[1].compile(dialect=postgresql.dialect()))
+    assert "DO UPDATE SET name = excluded.name, updated_at = now()" in sql
@@ -0,0 +1,97 @@
+import uuid
+from collections import namedtuple
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.services import typeahead
+from src.services.typeahead import (
+    MAX_CANDIDATES,
+    TypeaheadIndex,
+    _index_keys,
+    _property_entry,
+    _tenant_entry,
+)
+from tests.conftest import ScriptedSession
+
+
+def make_index(tenants=(), properties=()) -> TypeaheadIndex:
+    entries = [
+        _tenant_entry(
+            SimpleNamespace(id=uuid.uuid4(), name=name, ticker=ticker, cik=None, entity_type="public")
+        )
+        for name, ticker in tenants
+    ]
+    entries.extend(
+        _property_entry(SimpleNamespace(id=uuid.uuid4(), name=name, city=city, state="TX"))
+        for name, city in properties
+    )
+    index = TypeaheadIndex()
+    index._entries = entries
+    index._ids = {entry.id for entry in entries}
+    index._keys = sorted(_index_keys(entries, 0))
+    index.loaded = True
+    return index
+
+
+def test_multi_word_match_beyond_candidate_cap():
+    # Every entry matches the lead word "property"; only one matches "simon",
+    # and it sorts after MAX_CANDIDATES others in the prefix range
+    properties = [(f"Property {n:04d}", "Austin") for n in range(MAX_CANDIDATES + 100)]
+    index = make_index(properties=properties + [("Simon Property Plaza", "Zephyr")])
+
+    tenants, matches = index.suggest("simon property", limit=5)
+
+    assert tenants == []
+    assert [entry.name for entry in matches] == ["Simon Property Plaza"]
+
+
+def test_single_word_query_ranks_exact_then_name_prefix():
+    index = make_index(
+        tenants=[("Acme Holdings", "ACME"), ("Acmeco Industries", None), ("Big Acme", None)],
+    )
+
+    tenants, _ = index.suggest("acme", limit=3)
+
+    assert [entry.name for entry in tenants] == ["Acme Holdings", "Big Acme", "Acmeco Industries"]
+
+
+def test_prefix_words_match_in_any_order():
+    index = make_index(properties=[("Riverside Tower", "Houston"), ("Tower Hill", "Dallas")])
+
+    _, matches = index.suggest("tow riv", limit=5)
+
+    assert [entry.name for entry in matches] == ["Riverside Tower"]
+
+
+async def test_rename_triggers_rebuild(monkeypatch):
+    Row = namedtuple("Row", "id name ticker cik entity_type")
+    ChangedRow = namedtuple("ChangedRow", "id name ticker cik entity_type updated_at")
+    t0 = datetime(2026, 1, 5, tzinfo=timezone.utc)
+    t1 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    tenant_id = uuid.uuid4()
+
+    async def no_statuses(self, db):
+        self._statuses = {}
+
+    monkeypatch.setattr(typeahead.TypeaheadIndex, "_load_statuses", no_statuses)
+    index = TypeaheadIndex()
+    db = ScriptedSession(
+        [(1, t0, 0, None, 0, None)],
+        [Row(tenant_id, "Acme Holdings", "ACME", None, "public")],
+        [],
+    )
+    await index.refresh(db)
+
+    db.queue(
+        [(1, t1, 0, None, 0, None)],
+        [ChangedRow(tenant_id, "Apex Holdings", "APEX", None, "public", t1)],
+        [],
+        # Full rebuild
+        [Row(tenant_id, "Apex Holdings", "APEX", None, "public")],
+        [],
+    )
+    await index.refresh(db)
+
+    assert index.suggest("acme", limit=5) == ([], [])
+    assert [entry.name for entry in index.suggest("apex", limit=5)[0]] == ["Apex Holdings"]
+    assert not db.responses
@@ -115,6 +115,13 @@ export default function DashboardPage() {
 
   const hasMoreProperties = (brief.propertiesAttention?.length || 0) > 4;
 
+  // The brief carries the top properties only; the total counts all of them
+  const shownProperties = brief.propertiesAttention?.length || 0;
+  const totalProperties = brief.propertiesTotal ?? shownProperties;
+  const propertiesLabel = shownProperties < totalProperties
+    ? `View top ${shownProperties} of ${totalProperties} properties`
+    : `View all ${totalProperties} properties`;
+
   return (
     <>
       {/* Main content with sidebar layout */}
@@ -185,7 +192,7 @@ export default function DashboardPage() {
                             onClick={() => setShowAllProperties(!showAllProperties)}
                             className="w-full mt-3 py-2 text-xs text-muted-foreground hover:text-foreground flex items-center justify-center gap-1 transition-colors"
                           >
-                            {showAllProperties ? 'Show less' : `View all ${brief.propertiesAttention?.length || 0} properties`}
+                            {showAllProperties ? 'Show less' : propertiesLabel}
                             <ChevronRight className={`h-3 w-3 transition-transform ${showAllProperties ? '-rotate-90' : ''}`} />
                           </button>
                         )}
@@ -248,7 +255,7 @@ export default function DashboardPage() {
                           onClick={() => setShowAllProperties(!showAllProperties)}
                           className="w-full mt-3 py-2 text-xs text-muted-foreground hover:text-foreground flex items-center justify-center gap-1 transition-colors"
                         >
-                          {showAllProperties ? 'Show less' : `View all ${brief.propertiesAttention?.length || 0} properties`}
+                          {showAllProperties ? 'Show less' : propertiesLabel}
                           <ChevronRight className={`h-3 w-3 transition-transform ${showAllProperties ? '-rotate-90' : ''}`} />
                         </button>
                       )}
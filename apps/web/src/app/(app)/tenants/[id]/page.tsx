@@ -55,6 +55,7 @@ interface TenantDetailResponse {
   tenant: TenantDetail;
   properties: PropertySummary[];
   events: EventDetail[];
+  eventsNextCursor: string | null;
 }
 
 function formatDate(dateStr: string) {
@@ -187,6 +188,7 @@ export default function TenantDetailPage() {
   const [data, setData] = useState<TenantDetailResponse | null>(null);
   const [loading, setLoading] = useState(true);
   const [showEvidence, setShowEvidence] = useState<string | null>(null);
+  const [loadingMoreEvents, setLoadingMoreEvents] = useState(false);
 
   useEffect(() => {
     async function loadTenant() {
@@ -207,6 +209,29 @@ export default function TenantDetailPage() {
     }
   }, [tenantId]);
 
+  async function loadMoreEvents() {
+    if (!data?.eventsNextCursor) return;
+    setLoadingMoreEvents(true);
+    try {
+      const response = await fetch(
+        `/api/v1/tenants/${tenantId}?events_cursor=${encodeURIComponent(data.eventsNextCursor)}`
+      );
+      if (!response.ok) throw new Error("Failed to load events");
+      const result: TenantDetailResponse = await response.json();
+      setData((prev) =>
+        prev && {
+          ...prev,
+          events: [...prev.events, ...result.events],
+          eventsNextCursor: result.eventsNextCursor,
+        }
+      );
+    } catch (error) {
+      console.error("Failed to load more events:", error);
+    } finally {
+      setLoadingMoreEvents(false);
+    }
+  }
+
   if (loading) {
     return (
       <div className="max-w-4xl mx-auto space-y-6">
@@ -231,7 +256,7 @@ export default function TenantDetailPage() {
     );
   }
 
-  const { tenant, properties, events } = data;
+  const { tenant, properties, events, eventsNextCursor } = data;
 
   return (
     <div className="max-w-4xl mx-auto space-y-6 animate-fade-in">
@@ -296,7 +321,7 @@ export default function TenantDetailPage() {
       {/* Events Section */}
       <section>
         <h2 className="text-sm font-semibold text-muted-foreground uppercase tracking-wide mb-3">
-          Recent Events ({events.length})
+          Recent Events ({events.length}{eventsNextCursor ? "+" : ""})
         </h2>
         {events.length === 0 ? (
           <div className="py-12 text-center rounded-xl border border-dashed border-border/50 bg-muted/20">
@@ -311,6 +336,15 @@ export default function TenantDetailPage() {
                 onViewEvidence={(eventId) => setShowEvidence(eventId)}
               />
             ))}
+            {eventsNextCursor && (
+              <button
+                onClick={loadMoreEvents}
+                disabled={loadingMoreEvents}
+                className="w-full py-3 rounded-lg border border-border bg-muted/30 hover:bg-muted/50 transition-colors text-sm font-medium text-foreground disabled:opacity-50"
+              >
+                {loadingMoreEvents ? "Loading..." : "Load more events"}
+              </button>
+            )}
           </div>
         )}
       </section>
@@ -34,7 +34,7 @@ export function CommandPalette() {
   // Search on input
   useEffect(() => {
     if (search.length >= 2) {
-      api.search(search).then(results => {
+      api.suggest(search).then(results => {
         setTenants(results.tenants || []);
         setProperties(results.properties || []);
       });
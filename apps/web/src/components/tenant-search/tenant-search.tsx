@@ -13,25 +13,7 @@ import {
 import { StatusBadge } from "@/components/ui/status-badge";
 import { cn } from "@/lib/utils";
 import { api } from "@/lib/api";
-import type { TenantStatus, TenantDetailResponse } from "@/types";
-
-interface TenantFromAPI {
-  id: string;
-  name: string;
-  ticker: string | null;
-  cik: string | null;
-  industry: string | null;
-  entityType: string;
-  status: TenantStatus;
-  propertyCount: number;
-  logoUrl: string | null;
-  latestEvent: {
-    id: string;
-    eventType: string;
-    headline: string;
-    date: string;
-  } | null;
-}
+import type { Tenant, TenantStatus, TenantDetailResponse } from "@/types";
 
 const statusFilters: { value: TenantStatus | "all"; label: string }[] = [
   { value: "all", label: "All" },
@@ -50,39 +32,59 @@ function formatDate(dateStr: string) {
 }
 
 export function TenantSearch() {
-  const [tenants, setTenants] = useState<TenantFromAPI[]>([]);
+  const [tenants, setTenants] = useState<Tenant[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [filter, setFilter] = useState<TenantStatus | "all">("all");
   const [searchQuery, setSearchQuery] = useState("");
+  const [debouncedQuery, setDebouncedQuery] = useState("");
   const [expandedTenantId, setExpandedTenantId] = useState<string | null>(null);
   const [tenantDetails, setTenantDetails] = useState<Record<string, TenantDetailResponse>>({});
   const [loadingDetails, setLoadingDetails] = useState<string | null>(null);
 
+  // Search runs server-side so it sees every tenant, not just the loaded page
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedQuery(searchQuery.trim()), 250);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
+  const statusParam = filter === "all" ? undefined : filter;
+
   useEffect(() => {
+    let cancelled = false;
     async function loadTenants() {
       setLoading(true);
       try {
-        const statusParam = filter === "all" ? undefined : filter;
-        const response = await fetch(
-          `/api/v1/tenants${statusParam ? `?status=${statusParam}` : ""}`
-        );
-        const data = await response.json();
-        setTenants(data);
+        const data = await api.getTenants(statusParam, undefined, debouncedQuery);
+        if (cancelled) return;
+        setTenants(data.items);
+        setNextCursor(data.nextCursor);
       } catch (error) {
         console.error("Failed to load tenants:", error);
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
     }
     loadTenants();
-  }, [filter]);
+    return () => {
+      cancelled = true;
+    };
+  }, [statusParam, debouncedQuery]);
 
-  const filteredTenants = tenants.filter(
-    (tenant) =>
-      tenant.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      (tenant.ticker &&
-        tenant.ticker.toLowerCase().includes(searchQuery.toLowerCase()))
-  );
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.getTenants(statusParam, nextCursor, debouncedQuery);
+      setTenants((prev) => [...prev, ...data.items]);
+      setNextCursor(data.nextCursor);
+    } catch (error) {
+      console.error("Failed to load more tenants:", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const handleExpand = async (tenantId: string) => {
     if (expandedTenantId === tenantId) {
@@ -158,16 +160,16 @@ export function TenantSearch() {
               </div>
             ))}
           </div>
-        ) : filteredTenants.length === 0 ? (
+        ) : tenants.length === 0 ? (
           <div className="py-12 text-center">
             <Search className="h-8 w-8 text-muted-foreground/50 mx-auto mb-3" />
             <p className="text-sm text-muted-foreground">
-              {searchQuery ? "No tenants match your search" : "No tenants found"}
+              {debouncedQuery ? "No tenants match your search" : "No tenants found"}
             </p>
           </div>
         ) : (
           <div className="divide-y divide-border/50">
-            {filteredTenants.slice(0, 20).map((tenant) => (
+            {tenants.map((tenant) => (
               <TenantRow
                 key={tenant.id}
                 tenant={tenant}
@@ -177,14 +179,15 @@ export function TenantSearch() {
                 onToggle={() => handleExpand(tenant.id)}
               />
             ))}
-            {filteredTenants.length > 20 && (
+            {nextCursor && (
               <div className="p-3 text-center">
-                <Link
-                  href="/tenants"
-                  className="text-xs text-primary hover:underline"
+                <button
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="text-xs text-primary hover:underline disabled:opacity-50"
                 >
-                  View all {filteredTenants.length} tenants
-                </Link>
+                  {loadingMore ? "Loading..." : "Load more tenants"}
+                </button>
               </div>
             )}
           </div>
@@ -195,7 +198,7 @@ export function TenantSearch() {
 }
 
 interface TenantRowProps {
-  tenant: TenantFromAPI;
+  tenant: Tenant;
   isExpanded: boolean;
   isLoading: boolean;
   details?: TenantDetailResponse;
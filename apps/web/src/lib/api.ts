@@ -5,6 +5,8 @@ import type {
   Tenant,
   Property,
   Evidence,
+  Page,
+  DocumentSearchHit,
   DemoRole,
 } from "@/types";
 
@@ -60,13 +62,20 @@ export const api = {
   },
 
   // Tenants
-  getTenants: (status?: string) => {
-    const params = status ? `?status=${status}` : "";
-    return request<Tenant[]>(`/tenants${params}`);
+  getTenants: (status?: string, cursor?: string, query?: string) => {
+    const params = new URLSearchParams();
+    if (status) params.set("status", status);
+    if (query) params.set("q", query);
+    if (cursor) params.set("cursor", cursor);
+    const query = params.toString() ? `?${params}` : "";
+    return request<Page<Tenant>>(`/tenants${query}`);
   },
 
-  getTenant: (id: string) => {
-    return request<TenantDetailResponse>(`/tenants/${id}`);
+  getTenant: (id: string, eventsCursor?: string) => {
+    const params = eventsCursor
+      ? `?events_cursor=${encodeURIComponent(eventsCursor)}`
+      : "";
+    return request<TenantDetailResponse>(`/tenants/${id}${params}`);
   },
 
   // Events
@@ -79,8 +88,9 @@ export const api = {
   },
 
   // Properties
-  getProperties: () => {
-    return request<Property[]>("/properties");
+  getProperties: (cursor?: string) => {
+    const params = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    return request<Page<Property>>(`/properties${params}`);
   },
 
   getProperty: (id: string) => {
@@ -93,6 +103,19 @@ export const api = {
       `/search?q=${encodeURIComponent(query)}`
     );
   },
+
+  searchDocuments: (query: string, cursor?: string) => {
+    const params = new URLSearchParams({ q: query });
+    if (cursor) params.set("cursor", cursor);
+    return request<Page<DocumentSearchHit>>(`/search/documents?${params}`);
+  },
+
+  // Typeahead (in-memory on the API, safe to call per keystroke)
+  suggest: (query: string) => {
+    return request<{ tenants: Tenant[]; properties: Property[] }>(
+      `/search/suggest?q=${encodeURIComponent(query)}`
+    );
+  },
 };
 
 export { APIError };
@@ -85,6 +85,15 @@ export interface Evidence {
   url?: string;
   excerpt?: string;
   pageReference?: string;
+  quoteSpans?: QuoteSpan[];
+}
+
+// Verified location of a key detail's quote in stored evidence text
+export interface QuoteSpan {
+  detail: number;
+  field: 'excerpt' | 'raw_text' | 'title';
+  start: number;
+  end: number;
 }
 
 export interface PropertyBadge {
@@ -133,6 +142,7 @@ export interface BriefResponse {
   postureTiles?: PostureTile[];
   clusterTiles?: ClusterTile[];
   propertiesAttention?: PropertyAttentionItem[];
+  propertiesTotal?: number;
   questions?: QuestionItem[];
 }
 
@@ -169,6 +179,31 @@ export interface TenantDetailResponse {
   tenant: Tenant;
   properties: Property[];
   events: Event[];
+  eventsNextCursor?: string | null;
+}
+
+// Cursor-paginated list response
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+// Full-text search hit (event headline/memo or evidence text)
+export interface DocumentSearchHit {
+  kind: 'event' | 'evidence';
+  id: string;
+  eventId: string;
+  eventType: string;
+  eventDate: string;
+  headline: string;
+  tenantId: string;
+  tenantName: string;
+  evidenceTitle: string | null;
+  field: 'headline' | 'memo_what_disclosed' | 'excerpt' | 'raw_text';
+  rank: number;
+  snippet: string;
+  offset: number | null; // snippet position within the field
+  highlights: { start: number; end: number }[]; // ranges within snippet
 }
 
 export interface EventDetailResponse {